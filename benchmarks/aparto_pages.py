@@ -0,0 +1,80 @@
+"""
+benchmarks/aparto_pages.py — Throughput of Aparto marketing-site page parsing.
+
+Runs the single-pass property/city page extractors and the reference
+BeautifulSoup versions over the saved page corpus in tests/fixtures/aparto,
+checks both produce identical output, and reports pages per second. City
+pages are also tiled into one large page to show how each scales with the
+number of property links.
+
+Usage:
+    python -m benchmarks.aparto_pages [--number 50] [--tile 40]
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import timeit
+from typing import Callable, List, Tuple
+
+from student_rooms.providers.aparto import _extract_prices_from_html, _parse_city_page
+from tests.aparto_reference import extract_prices_from_html_soup, parse_city_page_soup
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "fixtures", "aparto")
+
+
+def load_corpus() -> List[Tuple[str, str]]:
+    pages = []
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.html"))):
+        with open(path, encoding="utf-8") as fh:
+            pages.append((os.path.basename(path), fh.read()))
+    return pages
+
+
+def tiled_city_page(html: str, copies: int) -> str:
+    """Repeat a city page's <main> so it carries `copies` times the links."""
+    head, _, rest = html.partition("<main>")
+    body, _, tail = rest.partition("</main>")
+    return head + "<main>" + body * copies + "</main>" + tail
+
+
+def measure(fn: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=50, help="parses per measurement")
+    parser.add_argument("--tile", type=int, default=40, help="copies of the Dublin city page body")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    jobs = []
+    for name, html in corpus:
+        if name.startswith("city_"):
+            slug = name[len("city_"):-len(".html")]
+            jobs.append((name, html, lambda h, s=slug: _parse_city_page(h, s),
+                         lambda h, s=slug: parse_city_page_soup(h, s)))
+        else:
+            jobs.append((name, html, lambda h: _extract_prices_from_html(h, ""),
+                         lambda h: extract_prices_from_html_soup(h, "")))
+    dublin = dict(corpus)["city_dublin.html"]
+    jobs.append((f"city_dublin x{args.tile}", tiled_city_page(dublin, args.tile),
+                 lambda h: _parse_city_page(h, "dublin"), lambda h: parse_city_page_soup(h, "dublin")))
+
+    mismatches = 0
+    print(f"{'page':<32}{'KiB':>8}{'fast/s':>10}{'soup/s':>10}{'speedup':>9}  parity")
+    for name, html, fast, soup in jobs:
+        same = fast(html) == soup(html)
+        mismatches += not same
+        t_fast = measure(lambda: fast(html), args.number)
+        t_soup = measure(lambda: soup(html), args.number)
+        print(f"{name:<32}{len(html) / 1024:>8.1f}{1 / t_fast:>10.0f}{1 / t_soup:>10.0f}"
+              f"{t_soup / t_fast:>8.1f}x  {'ok' if same else 'MISMATCH'}")
+    if mismatches:
+        raise SystemExit(f"{mismatches} page(s) differ from the reference parser")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+benchmarks/term_page_parser.py — Per-page cost of StarRez term page parsing.
+
+Compares the regex fast path used by StarRezScraper against the reference
+BeautifulSoup parser on a synthetic room search page of realistic size.
+
+Usage:
+    python -m benchmarks.term_page_parser [--rooms 40] [--number 200]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from student_rooms.providers.aparto import _parse_term_page
+from tests.aparto_reference import parse_term_page_soup
+
+ROOM_CARD = """
+<div class="room-card" data-roombaseid="{room_id}">
+  <h3 class="title">Gold Ensuite {room_id}</h3>
+  <ul class="features"><li>Private bathroom</li><li>Shared kitchen</li><li>Double bed</li></ul>
+  <span class="price">From &euro;{price} per week</span>
+  <a class="button" href="/StarRezPortal/RoomSearch/Select?roomBaseID={room_id}">Select</a>
+</div>
+"""
+
+PAGE = """
+<!DOCTYPE html>
+<html>
+<head>
+<title>Choose your room</title>
+<script>window.portal = {{"culture": "en-IE", "features": [1, 2, 3]}};</script>
+<style>.room-card {{ border: 1px solid #ccc; }}</style>
+</head>
+<body>
+<nav>{nav}</nav>
+<h1>Choose your room</h1>
+<div class="page-container" data-termid="1267" data-datestart="2026-08-29T00:00:00" data-dateend="2027-06-12T00:00:00">
+  <p>You have selected 'Binary Hub - 26/27 - 41 Weeks' booking term.
+  This term begins on 29/08/2026 and ends on 12/06/2027.</p>
+  {rooms}
+</div>
+</body>
+</html>
+"""
+
+
+def build_page(rooms: int) -> str:
+    nav = "".join(f'<a href="/page/{i}">Link {i}</a>' for i in range(60))
+    cards = "".join(ROOM_CARD.format(room_id=1000 + i, price=250 + i) for i in range(rooms))
+    return PAGE.format(nav=nav, rooms=cards)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rooms", type=int, default=40, help="room cards per page")
+    parser.add_argument("--number", type=int, default=200, help="parses per measurement")
+    args = parser.parse_args()
+
+    page = build_page(args.rooms)
+    assert _parse_term_page(page) == parse_term_page_soup(page)
+
+    print(f"page size: {len(page) / 1024:.1f} KiB, {args.rooms} room cards")
+    for label, fn in (("regex", _parse_term_page), ("soup", parse_term_page_soup)):
+        best = min(timeit.repeat(lambda: fn(page), number=args.number, repeat=5))
+        print(f"{label:>6}: {best / args.number * 1e6:9.1f} µs/page")
+
+
+if __name__ == "__main__":
+    main()
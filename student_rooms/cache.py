@@ -0,0 +1,127 @@
+"""
+cache.py — Persistent JSON cache with per-read TTLs.
+
+Each key is stored as its own JSON file under the user cache directory
+($XDG_CACHE_HOME/student-rooms-cli, default ~/.cache/student-rooms-cli).
+Entries record when they were written; callers decide how old is too old
+by passing a TTL on read. Writes are atomic (temp file + rename), and any
+I/O or decode error is treated as a miss so a broken cache never breaks a
+scan.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from student_rooms.models.config import CacheConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_dir() -> str:
+    """Return the default cache directory, honouring $XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.expanduser(os.path.join(cache_home, "student-rooms-cli"))
+
+
+def default_data_dir() -> str:
+    """Return the default data directory (seen options, history), honouring $XDG_DATA_HOME."""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join("~", ".local", "share")
+    return os.path.expanduser(os.path.join(data_home, "student-rooms-cli"))
+
+
+@dataclass
+class CacheEntry:
+    """A cached value plus the wall-clock time it was stored."""
+    value: Any
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.stored_at)
+
+
+class JsonCache:
+    """File-backed key/value cache; keys like 'yugo/cities/598930'."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.expanduser(directory) if directory else default_cache_dir()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9._-]+", "_", key.strip("/").replace("/", "__"))
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the stored entry regardless of age, or None."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug("Cache read failed for %s: %s", key, exc)
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        try:
+            return CacheEntry(value=data["value"], stored_at=float(data["stored_at"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def get(self, key: str, ttl_seconds: float) -> Optional[Any]:
+        """Return the cached value if younger than ttl_seconds, else None."""
+        entry = self.get_entry(key)
+        if entry is None or entry.age > ttl_seconds:
+            return None
+        return entry.value
+
+    def set(self, key: str, value: Any, stored_at: Optional[float] = None) -> None:
+        """
+        Store a JSON-serialisable value under key (atomic replace).
+        `stored_at` keeps an earlier write time when only metadata changed.
+        """
+        path = self._path(key)
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "stored_at": time.time() if stored_at is None else stored_at,
+            "value": value,
+        }
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                        json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+            except (OSError, TypeError, ValueError) as exc:
+                logger.debug("Cache write failed for %s: %s", key, exc)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+
+def create_cache(config: CacheConfig) -> Optional[JsonCache]:
+    """Factory: return a JsonCache for the config, or None if disabled."""
+    if not config.enabled:
+        return None
+    return JsonCache(config.directory)
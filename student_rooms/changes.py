@@ -0,0 +1,184 @@
+"""
+changes.py — Change events between consecutive watch snapshots.
+
+A snapshot maps RoomOption.dedup_key() → option. Diffing two snapshots is
+a single hash join: one pass over the current options looks each key up in
+the previous snapshot, and one pass over the previous keys finds removals.
+
+Events are typed so watch mode can route each kind to its own notifier:
+    new                   bookable option not in the previous snapshot
+    removed               option in the previous snapshot but not this one
+    price_changed         weekly price moved (or became known/unknown)
+    availability_changed  bookable flag flipped, e.g. a sold-out room returns
+
+A sold-out option that first shows up produces no event; it is reported
+through availability_changed once it becomes bookable. Snapshots hold the
+unfiltered scan results, so an option whose price crosses a configured
+limit is reported as a price change; filter_events() then applies the
+user's filters to the events.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Set
+
+from student_rooms.matching import apply_filters
+from student_rooms.models.config import FilterConfig
+from student_rooms.providers.base import RoomOption
+
+EVENT_NEW = "new"
+EVENT_REMOVED = "removed"
+EVENT_PRICE_CHANGED = "price_changed"
+EVENT_AVAILABILITY_CHANGED = "availability_changed"
+EVENT_TYPES = (EVENT_NEW, EVENT_PRICE_CHANGED, EVENT_AVAILABILITY_CHANGED, EVENT_REMOVED)
+
+# Weekly prices closer than this (EUR) are treated as unchanged
+PRICE_TOLERANCE = 0.01
+
+Snapshot = Dict[str, RoomOption]
+
+
+@dataclass
+class ChangeEvent:
+    """One change to a room option between two snapshots."""
+    type: str
+    key: str
+    option: RoomOption                      # current option (last known one for removals)
+    previous: Optional[RoomOption] = None   # option in the previous snapshot, if any
+    reappeared: bool = False                # new event for a key alerted in an earlier run
+
+    @property
+    def price_delta(self) -> Optional[float]:
+        if self.previous is None:
+            return None
+        old, new = self.previous.price_weekly, self.option.price_weekly
+        if old is None or new is None:
+            return None
+        return new - old
+
+    def summary_line(self) -> str:
+        """One-line description used in change alerts."""
+        o = self.option
+        label = f"[{o.provider.upper()}] {o.property_name} | {o.room_type}"
+        if o.option_name:
+            label += f" | {o.option_name}"
+        if self.type == EVENT_PRICE_CHANGED:
+            old = _price_str(self.previous)
+            delta = self.price_delta
+            arrow = "" if delta is None else (" ⬇" if delta < 0 else " ⬆")
+            return f"{label} | {old} → {_price_str(o)}{arrow}"
+        if self.type == EVENT_AVAILABILITY_CHANGED:
+            state = "available again" if o.available else "sold out"
+            return f"{label} | {state} | {_price_str(o)}"
+        return f"{label} | {_price_str(o)}"
+
+
+def _price_str(option: Optional[RoomOption]) -> str:
+    if option is None:
+        return "N/A"
+    if option.price_weekly is not None:
+        return f"€{option.price_weekly:.0f}/week"
+    return option.price_label or "N/A"
+
+
+def snapshot(options: Iterable[RoomOption]) -> Snapshot:
+    """Index options by dedup key (the first option wins on duplicates)."""
+    snap: Snapshot = {}
+    for option in options:
+        snap.setdefault(option.dedup_key(), option)
+    return snap
+
+
+def _price_changed(old: Optional[float], new: Optional[float]) -> bool:
+    if old is None or new is None:
+        return old is not new
+    return abs(new - old) >= PRICE_TOLERANCE
+
+
+def diff_snapshots(
+    previous: Mapping[str, RoomOption],
+    current: Mapping[str, RoomOption],
+    unseen: Optional[Set[str]] = None,
+) -> List[ChangeEvent]:
+    """
+    Return change events from `previous` to `current`, in current order
+    followed by removals in previous order. `unseen` (keys never alerted
+    before) marks new events for other keys as re-appearances. Sold-out
+    options entering the snapshot emit nothing.
+    """
+    events: List[ChangeEvent] = []
+    for key, option in current.items():
+        old = previous.get(key)
+        if old is None:
+            if not option.available:
+                continue
+            reappeared = unseen is not None and key not in unseen
+            events.append(ChangeEvent(EVENT_NEW, key, option, reappeared=reappeared))
+            continue
+        if _price_changed(old.price_weekly, option.price_weekly):
+            events.append(ChangeEvent(EVENT_PRICE_CHANGED, key, option, old))
+        if bool(old.available) != bool(option.available):
+            events.append(ChangeEvent(EVENT_AVAILABILITY_CHANGED, key, option, old))
+    for key, old in previous.items():
+        if key not in current:
+            events.append(ChangeEvent(EVENT_REMOVED, key, old, old))
+    return events
+
+
+def group_events(events: Iterable[ChangeEvent]) -> Dict[str, List[ChangeEvent]]:
+    """Group events by type, in EVENT_TYPES order, keeping only non-empty groups."""
+    grouped: Dict[str, List[ChangeEvent]] = {t: [] for t in EVENT_TYPES}
+    for event in events:
+        grouped[event.type].append(event)
+    return {t: evs for t, evs in grouped.items() if evs}
+
+
+def filter_events(events: List[ChangeEvent], filters: FilterConfig) -> List[ChangeEvent]:
+    """
+    Keep events whose option matches the filters before or after the
+    change, so a price moving across max_weekly_price is still reported.
+    """
+    if not events:
+        return []
+    candidates = [e.option for e in events] + [e.previous for e in events if e.previous is not None]
+    matching = {id(option) for option in apply_filters(candidates, filters)}
+    return [
+        e for e in events
+        if id(e.option) in matching or (e.previous is not None and id(e.previous) in matching)
+    ]
+
+
+class ChangeTracker:
+    """
+    Keeps the last snapshot per provider. Providers are diffed separately
+    so one that failed or was not due this cycle does not show its options
+    as removed.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: Dict[str, Snapshot] = {}
+
+    def update(
+        self,
+        provider: str,
+        options: Iterable[RoomOption],
+        unseen: Set[str],
+    ) -> List[ChangeEvent]:
+        """
+        Replace the provider's snapshot and return its change events. With
+        no earlier snapshot (first scan after start) there is nothing to
+        diff, so only bookable options never alerted before are reported
+        as new.
+        """
+        current = snapshot(options)
+        previous = self._snapshots.get(provider)
+        self._snapshots[provider] = current
+        if previous is None:
+            return [
+                ChangeEvent(EVENT_NEW, key, option)
+                for key, option in current.items() if key in unseen and option.available
+            ]
+        return diff_snapshots(previous, current, unseen)
+
+    def __contains__(self, provider: str) -> bool:
+        return provider in self._snapshots
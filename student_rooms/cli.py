@@ -1,24 +1,44 @@
 """
 student_rooms.cli — student-rooms-cli entry point.
 
-Commands: discover | scan | watch | probe-booking | notify | test-match
+Commands: discover | scan | watch | probe-booking | notify | test-match | history
 Providers: --provider yugo | aparto | all  (default: all)
 """
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
 import logging
+import math
 import os
-import random
+import queue
+import sqlite3
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
-
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from student_rooms.cache import create_cache, default_data_dir
+from student_rooms.changes import (
+    EVENT_AVAILABILITY_CHANGED,
+    EVENT_NEW,
+    EVENT_PRICE_CHANGED,
+    EVENT_REMOVED,
+    EVENT_TYPES,
+    ChangeEvent,
+    ChangeTracker,
+    filter_events,
+    group_events,
+)
+from student_rooms.history import HistoryStore, create_history
 from student_rooms.matching import apply_filters
 from student_rooms.models.config import Config, load_config
-from student_rooms.notifiers.base import create_notifier
+from student_rooms.notifiers.base import create_event_notifiers, create_notifier
 from student_rooms.providers.base import RoomOption
+from student_rooms.scheduler import WatchScheduler
+from student_rooms.seen_store import SeenStore
 
 logger = logging.getLogger(__name__)
 
@@ -28,41 +48,35 @@ logger = logging.getLogger(__name__)
 
 LEGACY_SEEN_FILE = os.path.join(os.path.dirname(__file__), "..", "reports", "seen_options.json")
 
+# How often watch mode forgets seen options older than polling.seen_ttl_days
+SEEN_PRUNE_INTERVAL_SECONDS = 24 * 3600
+
 
 def _default_seen_path() -> str:
-    """Return path for seen_options.json, preferring user data dir with legacy fallback."""
+    """
+    Return path for the legacy seen_options.json list, preferring the
+    repo-local reports/ copy; its keys are imported into the database once.
+    """
     legacy_path = os.path.abspath(LEGACY_SEEN_FILE)
     if os.path.exists(legacy_path):
         return legacy_path
 
-    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join("~", ".local", "share")
-    data_dir = os.path.expanduser(os.path.join(data_home, "student-rooms-cli"))
-    return os.path.join(data_dir, "seen_options.json")
-
-
-def load_seen_keys(path: Optional[str] = None) -> Set[str]:
-    path = path or _default_seen_path()
-    try:
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-            if isinstance(data, list):
-                return set(data)
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        pass
-    return set()
+    return os.path.join(default_data_dir(), "seen_options.json")
 
 
-def save_seen_keys(keys: Set[str], path: Optional[str] = None) -> None:
-    path = path or _default_seen_path()
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(sorted(keys), fh, ensure_ascii=False, indent=2)
+def _default_seen_db_path() -> str:
+    """Return path for the seen-options database (user data dir)."""
+    return os.path.join(default_data_dir(), "seen_options.sqlite3")
 
 
 # ---------------------------------------------------------------------------
 # Provider factory
 # ---------------------------------------------------------------------------
 
+# Upper bound on how long a command waits at exit for provider background
+# work (e.g. a property list refresh) so its result reaches the cache.
+BACKGROUND_WAIT_SECONDS = 20.0
+
 def make_providers(
     provider_arg: str,
     config: Config,
@@ -79,6 +93,9 @@ def make_providers(
         yugo_enabled = getattr(providers_cfg, "yugo_enabled", True)
         aparto_enabled = getattr(providers_cfg, "aparto_enabled", True)
 
+    cache_cfg = getattr(config, "cache", None)
+    cache = create_cache(cache_cfg) if cache_cfg else None
+
     instances = []
 
     want_yugo = provider_arg in ("yugo", "all")
@@ -86,25 +103,214 @@ def make_providers(
 
     if want_yugo and yugo_enabled:
         from student_rooms.providers.yugo import YugoProvider
+        yugo_interval, yugo_jitter = config.polling.schedule_for("yugo")
         instances.append(YugoProvider(
             country=country or config.target.country or "Ireland",
             city=city or config.target.city or "Dublin",
             country_id=country_id or config.target.country_id,
             city_id=city_id or config.target.city_id,
+            max_workers=getattr(providers_cfg, "yugo_max_workers", 8) if providers_cfg else 8,
+            max_in_flight=getattr(providers_cfg, "yugo_max_in_flight", 8) if providers_cfg else 8,
+            cache=cache,
+            poll_interval_seconds=yugo_interval + yugo_jitter,
         ))
 
     if want_aparto and aparto_enabled:
-        from student_rooms.providers.aparto import ApartoProvider
+        from student_rooms.providers.aparto import ApartoMultiCityProvider, ApartoProvider
         aparto_start = getattr(providers_cfg, "aparto_term_id_start", None) if providers_cfg else None
         aparto_end = getattr(providers_cfg, "aparto_term_id_end", None) if providers_cfg else None
-        instances.append(ApartoProvider(
-            city=city or config.target.city or "Dublin",
-            country=country or config.target.country,
-        ))
+        aparto_cities = getattr(providers_cfg, "aparto_cities", None) if providers_cfg else None
+        if aparto_cities and not city:
+            # Multi-city mode: one StarRez sweep per regional portal
+            instances.append(ApartoMultiCityProvider(
+                cities=aparto_cities,
+                cache=cache,
+                term_id_start=aparto_start,
+                term_id_end=aparto_end,
+            ))
+        else:
+            instances.append(ApartoProvider(
+                city=city or config.target.city or "Dublin",
+                country=country or config.target.country,
+                cache=cache,
+                term_id_start=aparto_start,
+                term_id_end=aparto_end,
+            ))
 
     return instances
 
 
+def wait_for_background(providers: List[Any], timeout: float = BACKGROUND_WAIT_SECONDS) -> None:
+    """Give providers' background work a shared `timeout` to finish."""
+    deadline = time.monotonic() + timeout
+    for provider in providers:
+        provider.wait_for_background(max(0.0, deadline - time.monotonic()))
+
+
+@contextlib.contextmanager
+def _command_providers(args: argparse.Namespace, config: Config) -> Iterator[List[Any]]:
+    """
+    Build the providers for a one-shot command and, when it returns, wait
+    for their background work (e.g. a property list refresh) so its result
+    reaches the cache before the process exits.
+    """
+    providers = make_providers(
+        args.provider, config,
+        country=getattr(args, "country", None),
+        city=getattr(args, "city", None),
+        country_id=getattr(args, "country_id", None),
+        city_id=getattr(args, "city_id", None),
+    )
+    try:
+        yield providers
+    finally:
+        wait_for_background(providers)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent provider execution
+# ---------------------------------------------------------------------------
+
+def provider_timeouts(config: Config) -> Dict[str, float]:
+    """Per-provider time limits for one scan/discover call, keyed by provider name."""
+    providers_cfg = getattr(config, "providers", None)
+    return {
+        "yugo": getattr(providers_cfg, "yugo_timeout_seconds", 120.0) if providers_cfg else 120.0,
+        "aparto": getattr(providers_cfg, "aparto_timeout_seconds", 300.0) if providers_cfg else 300.0,
+    }
+
+
+@dataclass
+class ProviderOutcome:
+    """Result of one provider call: a value, an error, or a timeout."""
+    provider: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+class ProviderRunner:
+    """
+    Runs provider calls on daemon threads and reports outcomes as they land.
+
+    Calls are started individually with start() and collected with poll(),
+    so a caller can launch a provider whenever it falls due while others
+    are still running; run() is the batch form. A provider that overruns
+    its timeout is reported as timed out without holding up the others (or
+    process exit). Python threads cannot be cancelled: an overrunning call
+    keeps going in the background, its late result is discarded, and the
+    runner reports that provider as busy until it returns.
+    """
+
+    def __init__(self) -> None:
+        self._running: Dict[int, threading.Thread] = {}
+        self._done: "queue.Queue[Tuple[int, ProviderOutcome]]" = queue.Queue()
+        # id(provider) → (run token, provider, started, deadline)
+        self._pending: Dict[int, Tuple[int, Any, float, Optional[float]]] = {}
+        self._tokens = 0
+
+    def busy(self, provider: Any) -> bool:
+        thread = self._running.get(id(provider))
+        return thread is not None and thread.is_alive()
+
+    def pending(self) -> bool:
+        """True while a started call has neither finished nor timed out."""
+        return bool(self._pending)
+
+    def start(self, provider: Any, call: Callable[[Any], Any], timeout: Optional[float] = None) -> None:
+        """Start call(provider) on its own thread."""
+        self._tokens += 1
+        token = self._tokens
+        started = time.monotonic()
+
+        def _worker() -> None:
+            try:
+                outcome = ProviderOutcome(provider, result=call(provider))
+            except Exception as exc:
+                outcome = ProviderOutcome(provider, error=exc)
+            outcome.elapsed = time.monotonic() - started
+            self._done.put((token, outcome))
+
+        thread = threading.Thread(target=_worker, name=f"provider-{provider.name}", daemon=True)
+        self._running[id(provider)] = thread
+        self._pending[id(provider)] = (token, provider, started, started + timeout if timeout else None)
+        thread.start()
+
+    def poll(self, wait: Optional[float] = None) -> List[ProviderOutcome]:
+        """
+        Wait up to `wait` seconds (None: until something happens) for calls
+        to finish, returning every finished or timed-out outcome, in order.
+        Returns early at the next call deadline.
+        """
+        deadlines = [deadline for _, _, _, deadline in self._pending.values() if deadline is not None]
+        if deadlines:
+            until_deadline = max(0.0, min(deadlines) - time.monotonic())
+            wait = until_deadline if wait is None else min(wait, until_deadline)
+        if wait is None and not self._pending:
+            return []
+
+        outcomes: List[ProviderOutcome] = []
+        until = None if wait is None else time.monotonic() + wait
+        while True:
+            try:
+                if outcomes:
+                    token, outcome = self._done.get_nowait()
+                else:
+                    remaining = None if until is None else max(0.0, until - time.monotonic())
+                    token, outcome = self._done.get(timeout=remaining)
+            except queue.Empty:
+                break
+            entry = self._pending.get(id(outcome.provider))
+            if entry is not None and entry[0] == token:
+                del self._pending[id(outcome.provider)]
+                outcomes.append(outcome)
+
+        now = time.monotonic()
+        for key, (_, provider, started, deadline) in list(self._pending.items()):
+            if deadline is not None and deadline <= now:
+                del self._pending[key]
+                outcomes.append(ProviderOutcome(provider, timed_out=True, elapsed=now - started))
+        return outcomes
+
+    def run(
+        self,
+        providers: List[Any],
+        call: Callable[[Any], Any],
+        timeouts: Optional[Dict[str, float]] = None,
+    ) -> Iterator[ProviderOutcome]:
+        """Run call(provider) for every provider and yield outcomes as they land."""
+        timeouts = timeouts or {}
+        for provider in providers:
+            self.start(provider, call, timeouts.get(provider.name))
+        while self.pending():
+            yield from self.poll()
+
+
+def run_providers(
+    providers: List[Any],
+    call: Callable[[Any], Any],
+    timeouts: Optional[Dict[str, float]] = None,
+) -> Iterator[ProviderOutcome]:
+    """Run call(provider) for every provider concurrently; see ProviderRunner."""
+    return ProviderRunner().run(providers, call, timeouts)
+
+
+def _log_failed_outcome(outcome: ProviderOutcome, action: str) -> None:
+    name = outcome.provider.name
+    if outcome.timed_out:
+        logger.error("Provider %s %s timed out after %.0fs", name, action, outcome.elapsed)
+    else:
+        logger.error(
+            "Provider %s %s failed", name, action,
+            exc_info=(type(outcome.error), outcome.error, outcome.error.__traceback__),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -166,6 +372,47 @@ def build_alert_message(
     return "\n".join(lines)
 
 
+_CHANGE_HEADERS = {
+    EVENT_PRICE_CHANGED: "💶 PRICE CHANGE",
+    EVENT_AVAILABILITY_CHANGED: "🔄 AVAILABILITY CHANGE",
+    EVENT_REMOVED: "❌ REMOVED",
+}
+
+
+def build_new_options_message(
+    events: List[ChangeEvent],
+    provider_probe: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Alert for new options, flagging those back after disappearing."""
+    message = build_alert_message([e.option for e in events], provider_probe, is_new=True, all_options=False)
+    back = [e for e in events if e.reappeared]
+    if back:
+        lines = ["", f"↩️ Back after disappearing ({len(back)}):"]
+        lines.extend(f"  • {e.summary_line()}" for e in back[:10])
+        message += "\n" + "\n".join(lines)
+    return message
+
+
+def build_change_message(event_type: str, events: List[ChangeEvent]) -> str:
+    """Alert listing price, availability or removal events of one type."""
+    if not events:
+        return ""
+    lines = [f"{_CHANGE_HEADERS.get(event_type, event_type)} · Student Rooms · {len(events)} option(s)", ""]
+    lines.extend(f"• {e.summary_line()}" for e in events[:20])
+    if len(events) > 20:
+        lines.append(f"… and {len(events) - 20} more")
+    if event_type != EVENT_REMOVED:
+        top = events[0].option
+        if top.booking_url:
+            lines.extend(["", f"🔗 Book: {top.booking_url}"])
+    return "\n".join(lines)
+
+
+def bookable(options: List[RoomOption]) -> List[RoomOption]:
+    """Drop options the provider reports as sold out (available=False)."""
+    return [m for m in options if m.available]
+
+
 def prioritize_matches(matches: List[RoomOption]) -> List[RoomOption]:
     """Sort: available first, then by provider preference, then by price."""
     def key(m: RoomOption) -> Tuple:
@@ -179,155 +426,190 @@ def prioritize_matches(matches: List[RoomOption]) -> List[RoomOption]:
 # Commands
 # ---------------------------------------------------------------------------
 
-def handle_discover(args: argparse.Namespace, config: Config) -> int:
-    providers = make_providers(
-        args.provider, config,
-        country=getattr(args, "country", None),
-        city=getattr(args, "city", None),
-        country_id=getattr(args, "country_id", None),
-        city_id=getattr(args, "city_id", None),
-    )
-
-    if getattr(args, "countries", False) or getattr(args, "cities", False) or getattr(args, "residences", False):
-        yugo_provider = next((p for p in providers if p.name == "yugo"), None)
-        if not yugo_provider:
-            print("Yugo provider not enabled; listing flags are only supported for Yugo.")
-            return 2
+def _scan_providers(
+    providers: List[Any],
+    config: Config,
+    academic_year: str,
+    apply_filter: bool,
+    action: str,
+) -> List[RoomOption]:
+    """Scan all providers concurrently; failed or timed-out providers contribute nothing."""
+    def _scan(p: Any) -> List[RoomOption]:
+        return p.scan(
+            academic_year=academic_year,
+            semester=1,
+            apply_semester_filter=apply_filter,
+            academic_config=config.academic_year,
+        )
 
-        if args.countries:
-            items = yugo_provider.list_countries()
-            label = "countries"
-        elif args.cities:
-            items = yugo_provider.list_cities()
-            label = "cities"
+    all_matches: List[RoomOption] = []
+    for outcome in run_providers(providers, _scan, provider_timeouts(config)):
+        if outcome.ok:
+            all_matches.extend(outcome.result)
+            logger.info("Provider %s %s: %d options in %.1fs",
+                        outcome.provider.name, action, len(outcome.result), outcome.elapsed)
         else:
-            items = yugo_provider.list_residences()
-            label = "residences"
+            _log_failed_outcome(outcome, action)
+    return all_matches
+
+
+def _record_history(
+    history: Optional[HistoryStore],
+    options: List[RoomOption],
+    args: argparse.Namespace,
+    config: Config,
+) -> None:
+    """Append scan results to the history store; failures are only logged."""
+    if history is None or not options:
+        return
+    try:
+        history.append(options, city=getattr(args, "city", None) or config.target.city or "Dublin")
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Could not record scan history: %s", exc)
+
+
+def handle_discover(args: argparse.Namespace, config: Config) -> int:
+    with _command_providers(args, config) as providers:
+        if getattr(args, "countries", False) or getattr(args, "cities", False) or getattr(args, "residences", False):
+            yugo_provider = next((p for p in providers if p.name == "yugo"), None)
+            if not yugo_provider:
+                print("Yugo provider not enabled; listing flags are only supported for Yugo.")
+                return 2
+
+            if args.countries:
+                items = yugo_provider.list_countries()
+                label = "countries"
+            elif args.cities:
+                items = yugo_provider.list_cities()
+                label = "cities"
+            else:
+                items = yugo_provider.list_residences()
+                label = "residences"
+
+            if args.json:
+                print(json.dumps(items, ensure_ascii=False, indent=2))
+            else:
+                print(f"Found {len(items)} {label}:")
+                for item in items:
+                    name = item.get("name") or item.get("displayName") or item.get("contentId") or item.get("id") or str(item)
+                    item_id = item.get("contentId") or item.get("id") or item.get("countryId") or ""
+                    suffix = f" ({item_id})" if item_id else ""
+                    print(f"- {name}{suffix}")
+            return 0
+
+        props_by_provider: Dict[int, List[Dict]] = {}
+        for outcome in run_providers(providers, lambda p: p.discover_properties(), provider_timeouts(config)):
+            if not outcome.ok:
+                _log_failed_outcome(outcome, "discover")
+                continue
+            for prop in outcome.result:
+                prop.setdefault("provider", outcome.provider.name)
+            props_by_provider[id(outcome.provider)] = outcome.result
+
+        all_props: List[Dict] = []
+        for p in providers:
+            all_props.extend(props_by_provider.get(id(p), []))
 
         if args.json:
-            print(json.dumps(items, ensure_ascii=False, indent=2))
+            print(json.dumps(all_props, ensure_ascii=False, indent=2))
         else:
-            print(f"Found {len(items)} {label}:")
-            for item in items:
-                name = item.get("name") or item.get("displayName") or item.get("contentId") or item.get("id") or str(item)
-                item_id = item.get("contentId") or item.get("id") or item.get("countryId") or ""
-                suffix = f" ({item_id})" if item_id else ""
-                print(f"- {name}{suffix}")
+            print(f"Found {len(all_props)} properties:\n")
+            for prop in all_props:
+                prov = prop.get("provider", "?")
+                name = prop.get("name") or prop.get("contentId") or prop.get("id") or str(prop)
+                slug = prop.get("slug") or prop.get("id") or ""
+                loc = prop.get("locationInfo") or prop.get("location") or ""
+                url = prop.get("url") or prop.get("portalLink") or ""
+                print(f"[{prov.upper()}] {name} ({slug})")
+                if loc:
+                    print(f"       📍 {loc}")
+                if url:
+                    print(f"       🔗 {url}")
         return 0
 
-    all_props: List[Dict] = []
-    for p in providers:
-        props = p.discover_properties()
-        for prop in props:
-            prop.setdefault("provider", p.name)
-        all_props.extend(props)
-
-    if args.json:
-        print(json.dumps(all_props, ensure_ascii=False, indent=2))
-    else:
-        print(f"Found {len(all_props)} properties:\n")
-        for prop in all_props:
-            prov = prop.get("provider", "?")
-            name = prop.get("name") or prop.get("contentId") or prop.get("id") or str(prop)
-            slug = prop.get("slug") or prop.get("id") or ""
-            loc = prop.get("locationInfo") or prop.get("location") or ""
-            url = prop.get("url") or prop.get("portalLink") or ""
-            print(f"[{prov.upper()}] {name} ({slug})")
-            if loc:
-                print(f"       📍 {loc}")
-            if url:
-                print(f"       🔗 {url}")
-    return 0
-
 
 def handle_scan(args: argparse.Namespace, config: Config) -> int:
-    providers = make_providers(
-        args.provider, config,
-        country=getattr(args, "country", None),
-        city=getattr(args, "city", None),
-        country_id=getattr(args, "country_id", None),
-        city_id=getattr(args, "city_id", None),
-    )
+    with _command_providers(args, config) as providers:
+        academic_year = config.academic_year.academic_year_str()
+        apply_filter = not getattr(args, "all_options", False)
 
-    academic_year = config.academic_year.academic_year_str()
-    apply_filter = not getattr(args, "all_options", False)
-
-    all_matches: List[RoomOption] = []
-    for p in providers:
-        try:
-            matches = p.scan(
-                academic_year=academic_year,
-                semester=1,
-                apply_semester_filter=apply_filter,
-                academic_config=config.academic_year,
-            )
-            all_matches.extend(matches)
-        except Exception:
-            logger.exception("Provider %s scan failed", p.name)
+        all_matches = _scan_providers(providers, config, academic_year, apply_filter, "scan")
+        history = create_history(config.history)
+        _record_history(history, all_matches, args, config)
+        if history is not None:
+            history.close()
 
-    filtered = apply_filters(all_matches, config.filters)
-    ranked = prioritize_matches(filtered)
+        filtered = apply_filters(bookable(all_matches), config.filters)
+        ranked = prioritize_matches(filtered)
 
-    if args.json:
-        print(json.dumps(
-            {
-                "matchCount": len(ranked),
-                "matches": [
-                    {
-                        "provider": m.provider,
-                        "property": m.property_name,
-                        "roomType": m.room_type,
-                        "priceWeekly": m.price_weekly,
-                        "priceLabel": m.price_label,
-                        "available": m.available,
-                        "bookingUrl": m.booking_url,
-                        "startDate": m.start_date,
-                        "endDate": m.end_date,
-                        "optionName": m.option_name,
-                        "location": m.location,
-                        "dedupKey": m.dedup_key(),
-                    }
-                    for m in ranked
-                ],
-            },
-            ensure_ascii=False,
-            indent=2,
-        ))
-    else:
-        if ranked:
-            for m in ranked[:10]:
-                price = f"€{m.price_weekly:.0f}/week" if m.price_weekly else m.price_label or "N/A"
-                print(f"[{m.provider.upper()}] {m.property_name} | {m.room_type} | {price}")
-                if m.option_name:
-                    print(f"         Tenancy: {m.option_name}")
-                if m.location:
-                    print(f"         📍 {m.location}")
-                if m.booking_url:
-                    print(f"         🔗 {m.booking_url}")
-                print()
-        print(f"Total matches: {len(ranked)}")
-
-    if getattr(args, "notify", False) and ranked:
-        notifier = create_notifier(config.notifications)
-        error = notifier.validate()
-        if error:
-            print(error)
-            return 2
+        if args.json:
+            print(json.dumps(
+                {
+                    "matchCount": len(ranked),
+                    "matches": [
+                        {
+                            "provider": m.provider,
+                            "property": m.property_name,
+                            "roomType": m.room_type,
+                            "priceWeekly": m.price_weekly,
+                            "priceLabel": m.price_label,
+                            "available": m.available,
+                            "bookingUrl": m.booking_url,
+                            "startDate": m.start_date,
+                            "endDate": m.end_date,
+                            "optionName": m.option_name,
+                            "location": m.location,
+                            "dedupKey": m.dedup_key(),
+                        }
+                        for m in ranked
+                    ],
+                },
+                ensure_ascii=False,
+                indent=2,
+            ))
+        else:
+            if ranked:
+                for m in ranked[:10]:
+                    price = f"€{m.price_weekly:.0f}/week" if m.price_weekly else m.price_label or "N/A"
+                    print(f"[{m.provider.upper()}] {m.property_name} | {m.room_type} | {price}")
+                    if m.option_name:
+                        print(f"         Tenancy: {m.option_name}")
+                    if m.location:
+                        print(f"         📍 {m.location}")
+                    if m.booking_url:
+                        print(f"         🔗 {m.booking_url}")
+                    print()
+            print(f"Total matches: {len(ranked)}")
+
+        if getattr(args, "notify", False) and ranked:
+            notifier = create_notifier(config.notifications)
+            error = notifier.validate()
+            if error:
+                print(error)
+                return 2
+
+            probe = None
+            top = ranked[0]
+            try:
+                provider_inst = next(
+                    p for p in providers if p.name == top.provider
+                )
+                probe = provider_inst.probe_booking(top)
+            except (StopIteration, NotImplementedError, Exception) as exc:
+                logger.warning("Booking probe for notify failed: %s", exc)
+
+            message = build_alert_message(ranked, probe, is_new=True, all_options=not apply_filter)
+            notifier.send(message)
 
-        probe = None
-        top = ranked[0]
-        try:
-            provider_inst = next(
-                p for p in providers if p.name == top.provider
-            )
-            probe = provider_inst.probe_booking(top)
-        except (StopIteration, NotImplementedError, Exception) as exc:
-            logger.warning("Booking probe for notify failed: %s", exc)
+        return 0
 
-        message = build_alert_message(ranked, probe, is_new=True, all_options=not apply_filter)
-        notifier.send(message)
 
-    return 0
+def _format_next_runs(scheduler: WatchScheduler) -> str:
+    now = time.monotonic()
+    return ", ".join(
+        f"{name} running" if math.isinf(at) else f"{name} in {max(0, at - now):.0f}s"
+        for name, at in sorted(scheduler.next_runs().items(), key=lambda i: i[1])
+    )
 
 
 def handle_watch(args: argparse.Namespace, config: Config) -> int:
@@ -338,197 +620,212 @@ def handle_watch(args: argparse.Namespace, config: Config) -> int:
         country_id=getattr(args, "country_id", None),
         city_id=getattr(args, "city_id", None),
     )
+    if not providers:
+        print(f"No enabled providers for '{args.provider}'; nothing to watch.")
+        return 2
 
     academic_year = config.academic_year.academic_year_str()
-    interval = max(5, config.polling.interval_seconds)
-    jitter = max(0, config.polling.jitter_seconds)
+    schedules = {p.name: config.polling.schedule_for(p.name) for p in providers}
+    scheduler = WatchScheduler(schedules)
 
-    notifier = create_notifier(config.notifications)
+    notifiers = create_event_notifiers(config.notifications, EVENT_TYPES)
+    tracker = ChangeTracker()
+    history = create_history(config.history)
 
-    seen_keys = load_seen_keys()
-    failure_counts: Dict[str, int] = {p.name: 0 for p in providers}
-    backoff_until: Dict[str, float] = {p.name: 0.0 for p in providers}
-    backoff_base = 30
-    backoff_max = 600
+    seen = SeenStore(_default_seen_db_path(), legacy_json_path=_default_seen_path())
+    seen_ttl = config.polling.seen_ttl_days * 24 * 3600
+
+    def _prune_seen() -> float:
+        """Prune the seen store; returns when the next prune is due."""
+        pruned = seen.prune(seen_ttl)
+        if pruned:
+            logger.info("Forgot %d options not seen for %d days", pruned, config.polling.seen_ttl_days)
+        return time.monotonic() + SEEN_PRUNE_INTERVAL_SECONDS
+
+    next_prune = _prune_seen()
     logger.info(
-        "Watch loop started: providers=%s interval=%ds jitter=%ds seen=%d keys",
+        "Watch loop started: providers=%s schedules=%s seen=%d keys",
         [p.name for p in providers],
-        interval,
-        jitter,
-        len(seen_keys),
+        {name: f"{interval}s±{jitter}s" for name, (interval, jitter) in schedules.items()},
+        len(seen),
     )
     print(
-        f"▶ Watch started | providers: {', '.join(p.name for p in providers)} | "
-        f"interval: {interval}s | academic year: {academic_year}"
+        f"▶ Watch started | providers: "
+        f"{', '.join(f'{name} every {interval}s' for name, (interval, _) in schedules.items())} | "
+        f"academic year: {academic_year}"
     )
 
+    runner = ProviderRunner()
+    timeouts = provider_timeouts(config)
+    by_name = {p.name: p for p in providers}
+
+    def _scan(p: Any) -> List[RoomOption]:
+        return p.scan(
+            academic_year=academic_year,
+            semester=1,
+            apply_semester_filter=True,
+            academic_config=config.academic_year,
+        )
+
+    def _notify(event_type: str, type_events: List[ChangeEvent]) -> None:
+        notifier = notifiers.get(event_type)
+        if notifier is None:
+            return
+        error = notifier.validate()
+        if error:
+            logger.error(error)
+            return
+        if event_type == EVENT_NEW:
+            # Try to get booking probe for top new match
+            probe = None
+            top_new = type_events[0].option
+            try:
+                provider_inst = next(
+                    p for p in providers if p.name == top_new.provider
+                )
+                probe = provider_inst.probe_booking(top_new)
+            except (StopIteration, NotImplementedError, Exception) as exc:
+                logger.warning("Watch probe failed: %s", exc)
+            message = build_new_options_message(type_events, probe)
+        else:
+            message = build_change_message(event_type, type_events)
+        notifier.send(message)
+
+    def _process(name: str, options: List[RoomOption]) -> None:
+        """Diff one provider's scan against its previous one and alert."""
+        _record_history(history, options, args, config)
+        ranked = prioritize_matches(apply_filters(bookable(options), config.filters))
+        logger.info("%s: scanned %s options. Matches: %s", name, len(options), len(ranked))
+
+        # Snapshots hold unfiltered results; filters apply to the events
+        unseen = seen.unseen(m.dedup_key() for m in options)
+        events = filter_events(tracker.update(name, options, unseen), config.filters)
+        grouped = group_events(events)
+
+        if grouped:
+            counts = ", ".join(f"{len(evs)} {event_type}" for event_type, evs in grouped.items())
+            logger.info("%s change events: %s", name, counts)
+            print(f"✅ {name}: changes detected: {counts}")
+        else:
+            print(f"  ⏳ {name}: {len(ranked)} matches, no changes. Next: {_format_next_runs(scheduler)}")
+            logger.info("%s: no changes across %d matches.", name, len(ranked))
+
+        for event_type, type_events in grouped.items():
+            _notify(event_type, type_events)
+
+        # Persist new keys and refresh last-seen of current ones
+        seen.record(m.dedup_key() for m in ranked)
+
     try:
         while True:
-            all_matches: List[RoomOption] = []
-            for p in providers:
-                now = time.monotonic()
-                if now < backoff_until.get(p.name, 0.0):
-                    logger.info(
-                        "Skipping %s due to backoff (%.0fs remaining)",
-                        p.name,
-                        backoff_until[p.name] - now,
-                    )
+            # Start providers as they fall due; a running one is not due
+            # again until its outcome is recorded
+            for name in scheduler.due():
+                p = by_name[name]
+                if runner.busy(p):
+                    logger.warning("Skipping %s: previous timed-out scan still running", p.name)
+                    scheduler.skip(p.name)
                     continue
-                try:
-                    matches = p.scan(
-                        academic_year=academic_year,
-                        semester=1,
-                        apply_semester_filter=True,
-                        academic_config=config.academic_year,
-                    )
-                    all_matches.extend(matches)
-                    failure_counts[p.name] = 0
-                    backoff_until[p.name] = 0.0
-                except Exception:
-                    logger.exception("Provider %s watch scan failed", p.name)
-                    failure_counts[p.name] = failure_counts.get(p.name, 0) + 1
-                    backoff = min(backoff_max, backoff_base * (2 ** (failure_counts[p.name] - 1)))
-                    backoff_until[p.name] = time.monotonic() + backoff
-                    logger.warning("Provider %s backoff set to %ds", p.name, backoff)
-
-            filtered = apply_filters(all_matches, config.filters)
-            ranked = prioritize_matches(filtered)
-            logger.info("Scanned %s options. Total matches: %s", len(all_matches), len(ranked))
-
-            # Detect new options not yet seen
-            new_matches = [m for m in ranked if m.dedup_key() not in seen_keys]
-
-            if new_matches:
-                logger.info("NEW options detected: %d", len(new_matches))
-                print(f"✅ NEW match(es) detected: {len(new_matches)}")
-
-                error = notifier.validate()
-                if error:
-                    logger.error(error)
-                else:
-                    # Try to get booking probe for top new match
-                    probe = None
-                    top_new = new_matches[0]
-                    try:
-                        provider_inst = next(
-                            p for p in providers if p.name == top_new.provider
-                        )
-                        probe = provider_inst.probe_booking(top_new)
-                    except (StopIteration, NotImplementedError, Exception) as exc:
-                        logger.warning("Watch probe failed: %s", exc)
-
-                    message = build_alert_message(new_matches, probe, is_new=True, all_options=False)
-                    notifier.send(message)
-
-                # Add new keys to seen set and persist
-                for m in new_matches:
-                    seen_keys.add(m.dedup_key())
-                save_seen_keys(seen_keys)
-
-            else:
-                print(f"  ⏳ {len(ranked)} matches, no new options. Sleeping {interval}s...")
-                logger.info("No new matches. All %d matches already seen.", len(ranked))
+                scheduler.start(p.name)
+                runner.start(p, _scan, timeouts.get(p.name))
+
+            wait = scheduler.seconds_until_next()
+            for outcome in runner.poll(None if math.isinf(wait) else wait):
+                p = outcome.provider
+                if outcome.ok:
+                    scheduler.record_success(p.name)
+                    _process(p.name, outcome.result)
+                    continue
+                _log_failed_outcome(outcome, "watch scan")
+                backoff = scheduler.record_failure(p.name)
+                logger.warning("Provider %s backoff set to %ds", p.name, backoff)
 
-            sleep_for = interval + random.randint(0, jitter) if jitter else interval
-            time.sleep(sleep_for)
+            if time.monotonic() >= next_prune:
+                next_prune = _prune_seen()
 
     except KeyboardInterrupt:
         print("\n⏹ Watch stopped.")
         return 0
+    finally:
+        seen.close()
+        if history is not None:
+            history.close()
 
 
 def handle_probe_booking(args: argparse.Namespace, config: Config) -> int:
-    providers = make_providers(
-        args.provider, config,
-        country=getattr(args, "country", None),
-        city=getattr(args, "city", None),
-        country_id=getattr(args, "country_id", None),
-        city_id=getattr(args, "city_id", None),
-    )
+    with _command_providers(args, config) as providers:
+        academic_year = config.academic_year.academic_year_str()
+        apply_filter = not getattr(args, "all_options", False)
+
+        all_matches = _scan_providers(providers, config, academic_year, apply_filter, "probe scan")
+
+        if not all_matches:
+            print("No matches found.")
+            return 1
+
+        # Apply optional filters
+        def _contains(value: Optional[str], needle: Optional[str]) -> bool:
+            if not needle:
+                return True
+            if not value:
+                return False
+            return needle.strip().lower() in value.strip().lower()
+
+        candidates = [
+            m for m in all_matches
+            if _contains(m.property_name, getattr(args, "residence", None))
+            and _contains(m.room_type, getattr(args, "room", None))
+            and _contains(m.option_name, getattr(args, "tenancy", None))
+            and (not getattr(args, "provider_filter", None) or m.provider == args.provider_filter)
+        ]
+        candidates = prioritize_matches(candidates)
+
+        if not candidates:
+            print("No candidates after filters.")
+            return 1
+
+        idx = max(0, getattr(args, "index", 0))
+        if idx >= len(candidates):
+            print(f"Index {idx} out of range (candidates: {len(candidates)})")
+            return 2
 
-    academic_year = config.academic_year.academic_year_str()
-    apply_filter = not getattr(args, "all_options", False)
+        selected = candidates[idx]
 
-    all_matches: List[RoomOption] = []
-    for p in providers:
         try:
-            matches = p.scan(
-                academic_year=academic_year,
-                semester=1,
-                apply_semester_filter=apply_filter,
-                academic_config=config.academic_year,
-            )
-            all_matches.extend(matches)
+            provider_inst = next(p for p in providers if p.name == selected.provider)
+            probe = provider_inst.probe_booking(selected)
+        except (StopIteration, NotImplementedError) as exc:
+            print(f"Provider '{selected.provider}' does not support probe_booking: {exc}")
+            return 1
         except Exception as exc:
-            logger.error("Provider %s probe scan failed: %s", p.name, exc)
-
-    if not all_matches:
-        print("No matches found.")
-        return 1
-
-    # Apply optional filters
-    def _contains(value: Optional[str], needle: Optional[str]) -> bool:
-        if not needle:
-            return True
-        if not value:
-            return False
-        return needle.strip().lower() in value.strip().lower()
-
-    candidates = [
-        m for m in all_matches
-        if _contains(m.property_name, getattr(args, "residence", None))
-        and _contains(m.room_type, getattr(args, "room", None))
-        and _contains(m.option_name, getattr(args, "tenancy", None))
-        and (not getattr(args, "provider_filter", None) or m.provider == args.provider_filter)
-    ]
-    candidates = prioritize_matches(candidates)
-
-    if not candidates:
-        print("No candidates after filters.")
-        return 1
-
-    idx = max(0, getattr(args, "index", 0))
-    if idx >= len(candidates):
-        print(f"Index {idx} out of range (candidates: {len(candidates)})")
-        return 2
-
-    selected = candidates[idx]
-
-    try:
-        provider_inst = next(p for p in providers if p.name == selected.provider)
-        probe = provider_inst.probe_booking(selected)
-    except (StopIteration, NotImplementedError) as exc:
-        print(f"Provider '{selected.provider}' does not support probe_booking: {exc}")
-        return 1
-    except Exception as exc:
-        print(f"Booking probe failed: {exc}")
-        return 1
-
-    if getattr(args, "notify", False):
-        notifier = create_notifier(config.notifications)
-        error = notifier.validate()
-        if error:
-            print(error)
-            return 2
-        message = build_alert_message(candidates, probe, is_new=True, all_options=not apply_filter)
-        notifier.send(message)
+            print(f"Booking probe failed: {exc}")
+            return 1
+
+        if getattr(args, "notify", False):
+            notifier = create_notifier(config.notifications)
+            error = notifier.validate()
+            if error:
+                print(error)
+                return 2
+            message = build_alert_message(candidates, probe, is_new=True, all_options=not apply_filter)
+            notifier.send(message)
 
-    if args.json:
-        print(json.dumps(probe, ensure_ascii=False, indent=2))
-    else:
-        print("Booking probe OK")
-        match = probe.get("match", {})
-        links = probe.get("links", {})
-        print(f"  Provider:  {selected.provider}")
-        print(f"  Property:  {match.get('property') or match.get('residence')}")
-        print(f"  Room:      {match.get('room')}")
-        if match.get("startDate") or match.get("endDate"):
-            print(f"  Dates:     {match.get('startDate')} → {match.get('endDate')}")
-        for link_name, link_url in links.items():
-            if link_url:
-                print(f"  {link_name}: {link_url}")
+        if args.json:
+            print(json.dumps(probe, ensure_ascii=False, indent=2))
+        else:
+            print("Booking probe OK")
+            match = probe.get("match", {})
+            links = probe.get("links", {})
+            print(f"  Provider:  {selected.provider}")
+            print(f"  Property:  {match.get('property') or match.get('residence')}")
+            print(f"  Room:      {match.get('room')}")
+            if match.get("startDate") or match.get("endDate"):
+                print(f"  Dates:     {match.get('startDate')} → {match.get('endDate')}")
+            for link_name, link_url in links.items():
+                if link_url:
+                    print(f"  {link_name}: {link_url}")
 
-    return 0
+        return 0
 
 
 def handle_notify(args: argparse.Namespace, config: Config) -> int:
@@ -543,6 +840,50 @@ def handle_notify(args: argparse.Namespace, config: Config) -> int:
     return 0
 
 
+def handle_history(args: argparse.Namespace, config: Config) -> int:
+    days = max(1, args.days)
+    history = HistoryStore(config.history.directory)
+    try:
+        if args.rebuild_index:
+            count = history.rebuild_index()
+            print(f"Rebuilt history index from {count} records.")
+        provider = None if args.provider == "all" else args.provider
+        if args.releases:
+            rows = history.releases(days, provider=provider, property_name=args.property)
+        else:
+            rows = history.price_summary(
+                days, by_room=args.by == "room", provider=provider, property_name=args.property,
+            )
+    finally:
+        history.close()
+
+    if args.json:
+        print(json.dumps({"days": days, "rows": rows}, ensure_ascii=False, indent=2))
+        return 0
+
+    if not rows:
+        print(f"No scan history in the last {days} days.")
+        return 0
+    for row in rows:
+        label = f"[{row['provider'].upper()}] {row['property']}"
+        if row.get("roomType"):
+            label += f" | {row['roomType']}"
+        price = row["minPriceWeekly"]
+        price_str = f"€{price:.0f}/week" if price is not None else "N/A"
+        if args.releases:
+            option = f" | {row['optionName']}" if row.get("optionName") else ""
+            print(f"{row['firstSeen']}  {label}{option} | from {price_str}")
+        else:
+            top = row["maxPriceWeekly"]
+            spread = f" (max €{top:.0f})" if top is not None and top != price else ""
+            print(
+                f"{label} | min {price_str}{spread} | seen {row['daysSeen']} day(s), "
+                f"{row['options']} option(s), available {row['availableShare']:.0%} of scans"
+            )
+    print(f"Total: {len(rows)}")
+    return 0
+
+
 def handle_test_match(args: argparse.Namespace, config: Config) -> int:
     """Backwards-compatible test-match for Yugo semester logic."""
     from student_rooms.matching import match_semester1
@@ -633,6 +974,19 @@ def build_parser() -> argparse.ArgumentParser:
     notify_cmd = sub.add_parser("notify", help="Send a test notification.")
     notify_cmd.add_argument("--message", help="Message text to send.")
 
+    # history
+    history = sub.add_parser("history", help="Price history from recorded scans.")
+    _add_provider_arg(history)
+    history.add_argument("--days", type=int, default=30, help="Look-back window in days (default 30).")
+    history.add_argument("--by", choices=["property", "room"], default="property",
+                         help="Group prices by property or by property and room type.")
+    history.add_argument("--property", help="Filter by property name (contains).")
+    history.add_argument("--releases", action="store_true",
+                         help="List options first seen in the window instead of prices.")
+    history.add_argument("--rebuild-index", action="store_true", dest="rebuild_index",
+                         help="Rebuild the index from the compressed partitions first.")
+    history.add_argument("--json", action="store_true", help="Output JSON.")
+
     # test-match (Yugo legacy)
     test_match = sub.add_parser("test-match", help="[Yugo] Test Semester 1 matching logic.")
     test_match.add_argument("--from-year", dest="from_year", type=int, required=True)
@@ -665,6 +1019,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         "watch": handle_watch,
         "probe-booking": handle_probe_booking,
         "notify": handle_notify,
+        "history": handle_history,
         "test-match": handle_test_match,
     }
 
@@ -0,0 +1,402 @@
+"""
+history.py — Local history of scan results.
+
+Every scan appends one compact JSON line per option to a gzip file
+partitioned by provider, city and UTC day:
+
+    <data dir>/history/<provider>/<city>/<YYYY-MM-DD>.jsonl.gz
+
+Each append compresses a complete gzip member in memory and writes it to
+the end of the partition in one call, so partitions are never rewritten.
+Readers decode member by member and resynchronise on the next gzip header
+after a damaged one, so a member truncated by a killed process costs only
+that append.
+
+A SQLite index (history/index.sqlite3) keeps one row per option per day
+with its min/max/last weekly price and availability counts, so queries
+like "minimum weekly price per property over 30 days" read index rows
+instead of decompressing partitions. The index also records how many
+bytes of each partition it covers, updated in the same transaction as the
+rows; on open, any partition bytes written after the last index commit
+(e.g. by a process killed in between) are indexed. The index can always
+be rebuilt from the partitions.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from student_rooms.cache import default_data_dir
+from student_rooms.models.config import HistoryConfig
+from student_rooms.providers.base import RoomOption
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+INDEX_FILE = "index.sqlite3"
+PARTITION_SUFFIX = ".jsonl.gz"
+_GZIP_MAGIC = b"\x1f\x8b\x08"
+
+
+def default_history_dir() -> str:
+    """Return the default history directory, honouring $XDG_DATA_HOME."""
+    return os.path.join(default_data_dir(), "history")
+
+
+def _slug(value: Optional[str]) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", (value or "").lower()).strip("-") or "unknown"
+
+
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _record(option: RoomOption, ts: float) -> Dict[str, Any]:
+    return {
+        "ts": round(ts, 3),
+        "key": option.dedup_key(),
+        "property": option.property_name,
+        "slug": option.property_slug,
+        "room_type": option.room_type,
+        "option": option.option_name,
+        "price_weekly": option.price_weekly,
+        "price_label": option.price_label,
+        "available": bool(option.available),
+        "start_date": option.start_date,
+        "end_date": option.end_date,
+        "academic_year": option.academic_year,
+    }
+
+
+_UPSERT = """
+INSERT INTO daily (
+    day, key, provider, city, property_slug, property_name, room_type, option_name,
+    min_price, max_price, last_price, scans, available_scans, first_ts, last_ts
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
+ON CONFLICT (day, key) DO UPDATE SET
+    property_name = excluded.property_name,
+    min_price = min(coalesce(daily.min_price, excluded.min_price), coalesce(excluded.min_price, daily.min_price)),
+    max_price = max(coalesce(daily.max_price, excluded.max_price), coalesce(excluded.max_price, daily.max_price)),
+    last_price = CASE WHEN excluded.last_ts >= daily.last_ts THEN excluded.last_price ELSE daily.last_price END,
+    scans = daily.scans + 1,
+    available_scans = daily.available_scans + excluded.available_scans,
+    first_ts = min(daily.first_ts, excluded.first_ts),
+    last_ts = max(daily.last_ts, excluded.last_ts)
+"""
+
+
+class HistoryStore:
+    """Append-only scan history with a SQLite daily index."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.expanduser(directory) if directory else default_history_dir()
+        os.makedirs(self.directory, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(self.directory, INDEX_FILE), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self._catch_up()
+
+    def _migrate(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS daily ("
+                " day TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " provider TEXT NOT NULL,"
+                " city TEXT NOT NULL,"
+                " property_slug TEXT NOT NULL,"
+                " property_name TEXT NOT NULL,"
+                " room_type TEXT NOT NULL,"
+                " option_name TEXT,"
+                " min_price REAL,"
+                " max_price REAL,"
+                " last_price REAL,"
+                " scans INTEGER NOT NULL,"
+                " available_scans INTEGER NOT NULL,"
+                " first_ts REAL NOT NULL,"
+                " last_ts REAL NOT NULL,"
+                " PRIMARY KEY (day, key)"
+                ") WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS daily_property ON daily (property_slug, day)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS daily_key ON daily (key, day)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS partitions ("
+                " path TEXT PRIMARY KEY,"
+                " indexed_bytes INTEGER NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            if version == 1:
+                # v1 indexed every append; its partitions are fully covered
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO partitions (path, indexed_bytes) VALUES (?, ?)",
+                    ((self._relpath(path), os.path.getsize(path)) for _, _, _, path in self.partitions()),
+                )
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # -- writing -------------------------------------------------------------
+
+    def partition_path(self, provider: str, city: str, day: str) -> str:
+        return os.path.join(self.directory, _slug(provider), _slug(city), f"{day}{PARTITION_SUFFIX}")
+
+    def append(
+        self,
+        options: Iterable[RoomOption],
+        city: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> int:
+        """
+        Append one scan's options to their partitions and the index. The
+        city comes from option.raw["city"] when the provider sets it, else
+        `city`. Returns the number of options written.
+        """
+        ts = time.time() if now is None else now
+        day = _day(ts)
+        partitions: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for option in options:
+            option_city = _slug(option.raw.get("city") or city)
+            partitions.setdefault((option.provider, option_city), []).append(_record(option, ts))
+        if not partitions:
+            return 0
+
+        for (provider, option_city), records in partitions.items():
+            path = self.partition_path(provider, option_city, day)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            payload = "".join(
+                json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records
+            )
+            member = gzip.compress(payload.encode("utf-8"))
+            with open(path, "ab") as fh:
+                fh.write(member)
+                size = fh.tell()
+            with self._conn:
+                self._index(provider, option_city, day, records)
+                self._mark_indexed(path, size)
+        return sum(len(records) for records in partitions.values())
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(path, self.directory)
+
+    def _mark_indexed(self, path: str, size: int) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO partitions (path, indexed_bytes) VALUES (?, ?)",
+            (self._relpath(path), size),
+        )
+
+    def _catch_up(self) -> int:
+        """Index partition bytes written after the last index commit."""
+        indexed = dict(self._conn.execute("SELECT path, indexed_bytes FROM partitions"))
+        count = 0
+        for provider, city, day, path in self.partitions():
+            size = os.path.getsize(path)
+            offset = indexed.get(self._relpath(path), 0)
+            if size == offset:
+                continue
+            if size < offset:
+                logger.warning("History partition %s shrank; run history --rebuild-index", path)
+                continue
+            records = list(self.read_partition(path, offset))
+            with self._conn:
+                self._index(provider, city, day, records)
+                self._mark_indexed(path, size)
+            count += len(records)
+        if count:
+            logger.info("Indexed %d history records missing from the index", count)
+        return count
+
+    def _index(self, provider: str, city: str, day: str, records: List[Dict[str, Any]]) -> None:
+        self._conn.executemany(_UPSERT, (
+            (
+                day, r["key"], provider, city, r["slug"], r["property"], r["room_type"], r["option"],
+                r["price_weekly"], r["price_weekly"], r["price_weekly"],
+                1 if r["available"] else 0, r["ts"], r["ts"],
+            )
+            for r in records
+        ))
+
+    # -- reading -------------------------------------------------------------
+
+    def partitions(self, provider: Optional[str] = None) -> Iterator[Tuple[str, str, str, str]]:
+        """Yield (provider, city, day, path) for every partition on disk, in order."""
+        providers = [_slug(provider)] if provider else sorted(os.listdir(self.directory))
+        for prov in providers:
+            prov_dir = os.path.join(self.directory, prov)
+            if not os.path.isdir(prov_dir):
+                continue
+            for city in sorted(os.listdir(prov_dir)):
+                city_dir = os.path.join(prov_dir, city)
+                if not os.path.isdir(city_dir):
+                    continue
+                for name in sorted(os.listdir(city_dir)):
+                    if name.endswith(PARTITION_SUFFIX):
+                        yield prov, city, name[:-len(PARTITION_SUFFIX)], os.path.join(city_dir, name)
+
+    def read_partition(self, path: str, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of one partition from byte `offset` (a member
+        boundary). Damaged members are skipped by resynchronising on the
+        next gzip header, and a truncated last line is dropped.
+        """
+        try:
+            with open(path, "rb") as fh:
+                fh.seek(offset)
+                data = fh.read()
+        except OSError as exc:
+            logger.warning("Could not read history partition %s: %s", path, exc)
+            return
+        pos = 0
+        while pos < len(data):
+            decoder = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+            try:
+                payload = decoder.decompress(data[pos:])
+            except zlib.error:
+                payload = None
+            if payload is None or not decoder.eof:
+                logger.warning("History partition %s has a damaged member at byte %d", path, offset + pos)
+                pos = data.find(_GZIP_MAGIC, pos + 1)
+                if pos < 0:
+                    return
+                continue
+            pos = len(data) - len(decoder.unused_data)
+            for line in payload.decode("utf-8", errors="replace").splitlines():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def rebuild_index(self) -> int:
+        """Rebuild the daily index from the partitions; returns records read."""
+        count = 0
+        with self._conn:
+            self._conn.execute("DELETE FROM daily")
+            self._conn.execute("DELETE FROM partitions")
+            for provider, city, day, path in self.partitions():
+                size = os.path.getsize(path)
+                records = list(self.read_partition(path))
+                self._index(provider, city, day, records)
+                self._mark_indexed(path, size)
+                count += len(records)
+        return count
+
+    def _where(
+        self,
+        since_day: Optional[str],
+        provider: Optional[str],
+        property_name: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if since_day:
+            clauses.append("day >= ?")
+            params.append(since_day)
+        if provider:
+            clauses.append("provider = ?")
+            params.append(provider)
+        if property_name:
+            clauses.append("property_name LIKE ?")
+            params.append(f"%{property_name}%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def price_summary(
+        self,
+        days: int = 30,
+        by_room: bool = False,
+        provider: Optional[str] = None,
+        property_name: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Min/max weekly price per property (or per property and room type)
+        over the last `days` days, cheapest first.
+        """
+        since = _day((time.time() if now is None else now) - timedelta(days=days - 1).total_seconds())
+        where, params = self._where(since, provider, property_name)
+        rows = self._conn.execute(
+            "SELECT provider, city, property_slug, max(property_name)" + (", max(room_type)" if by_room else "")
+            + ", min(min_price), max(max_price), count(DISTINCT day), count(DISTINCT key),"
+            " sum(scans), sum(available_scans), max(day)"
+            f" FROM daily{where}"
+            f" GROUP BY provider, property_slug{', lower(room_type)' if by_room else ''}"
+            " ORDER BY min(min_price) IS NULL, min(min_price), provider, property_slug",
+            params,
+        ).fetchall()
+        out = []
+        for row in rows:
+            row = list(row)
+            entry = {
+                "provider": row.pop(0),
+                "city": row.pop(0),
+                "propertySlug": row.pop(0),
+                "property": row.pop(0),
+            }
+            if by_room:
+                entry["roomType"] = row.pop(0)
+            min_price, max_price, days_seen, options, scans, available, last_day = row
+            entry.update({
+                "minPriceWeekly": min_price,
+                "maxPriceWeekly": max_price,
+                "daysSeen": days_seen,
+                "options": options,
+                "availableShare": round(available / scans, 3) if scans else 0.0,
+                "lastSeen": last_day,
+            })
+            out.append(entry)
+        return out
+
+    def releases(
+        self,
+        days: int = 30,
+        provider: Optional[str] = None,
+        property_name: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Options first observed within the last `days` days, oldest first."""
+        since = _day((time.time() if now is None else now) - timedelta(days=days - 1).total_seconds())
+        where, params = self._where(since, provider, property_name)
+        rows = self._conn.execute(
+            "SELECT key, provider, max(property_name), max(room_type), max(option_name),"
+            " min(day) AS first_day, max(day), min(min_price)"
+            f" FROM daily AS d{where}"
+            " AND NOT EXISTS (SELECT 1 FROM daily AS p WHERE p.key = d.key AND p.day < ?)"
+            " GROUP BY key ORDER BY first_day, provider, key",
+            params + [since],
+        ).fetchall()
+        return [
+            {
+                "dedupKey": key,
+                "provider": prov,
+                "property": prop,
+                "roomType": room,
+                "optionName": option_name,
+                "firstSeen": first_day,
+                "lastSeen": last_day,
+                "minPriceWeekly": min_price,
+            }
+            for key, prov, prop, room, option_name, first_day, last_day, min_price in rows
+        ]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def create_history(config: HistoryConfig) -> Optional[HistoryStore]:
+    """Factory: return a HistoryStore for the config, or None if disabled."""
+    if not config.enabled:
+        return None
+    try:
+        return HistoryStore(config.directory)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Scan history disabled: %s", exc)
+        return None
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 
 from student_rooms.models.config import AcademicYearConfig, FilterConfig
 from student_rooms.providers.base import RoomOption
@@ -102,7 +102,7 @@ def apply_filters(results: List[RoomOption], filters: FilterConfig) -> List[Room
 
     filtered: List[RoomOption] = []
     for option in results:
-        raw = option.raw if isinstance(option.raw, dict) else {}
+        raw = option.raw if isinstance(option.raw, Mapping) else {}
         room_data = raw.get("roomData") or raw.get("room")
 
         if room_data:
@@ -58,15 +58,43 @@ class ProviderConfig:
 @dataclass
 class ProvidersConfig:
     yugo_enabled: bool = True
+    yugo_max_workers: int = 8
+    yugo_max_in_flight: int = 8
+    yugo_timeout_seconds: float = 120.0
     aparto_enabled: bool = True
-    aparto_term_id_start: int = 1200
-    aparto_term_id_end: int = 1600
+    aparto_timeout_seconds: float = 300.0
+    aparto_term_id_start: Optional[int] = None
+    aparto_term_id_end: Optional[int] = None
+    aparto_cities: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CacheConfig:
+    enabled: bool = True
+    directory: Optional[str] = None  # default: $XDG_CACHE_HOME/student-rooms-cli
+
+
+@dataclass
+class HistoryConfig:
+    enabled: bool = True
+    directory: Optional[str] = None  # default: $XDG_DATA_HOME/student-rooms-cli/history
 
 
 @dataclass
 class PollingConfig:
     interval_seconds: int = 300
     jitter_seconds: int = 30
+    # Per-provider overrides (polling.providers.<name>); others use the above
+    provider_interval_seconds: Dict[str, int] = field(default_factory=dict)
+    provider_jitter_seconds: Dict[str, int] = field(default_factory=dict)
+    # Alerted options not seen again for this long are forgotten (and re-alert)
+    seen_ttl_days: int = 60
+
+    def schedule_for(self, provider: str) -> Tuple[int, int]:
+        """Return (interval_seconds, jitter_seconds) for a provider."""
+        interval = self.provider_interval_seconds.get(provider, self.interval_seconds)
+        jitter = self.provider_jitter_seconds.get(provider, self.jitter_seconds)
+        return max(5, interval), max(0, jitter)
 
 
 # ---------------------------------------------------------------------------
@@ -117,6 +145,15 @@ class NotificationConfig:
     webhook: WebhookNotifierConfig = field(default_factory=WebhookNotifierConfig)
     telegram: TelegramNotifierConfig = field(default_factory=TelegramNotifierConfig)
     openclaw: OpenClawNotifierConfig = field(default_factory=OpenClawNotifierConfig)
+    # Watch change event type → notifier type ("none" silences it).
+    # Unlisted events use `type`, except "removed" which is silent.
+    routes: Dict[str, str] = field(default_factory=dict)
+
+    def route_for(self, event_type: str) -> Optional[str]:
+        """Notifier type for a watch change event, or None if it is not sent."""
+        default = "none" if event_type == "removed" else self.type
+        route = self.routes.get(event_type, default).strip().lower()
+        return None if route in ("", "none", "off") else route
 
 
 @dataclass
@@ -127,6 +164,8 @@ class Config:
     polling: PollingConfig = field(default_factory=PollingConfig)
     notifications: NotificationConfig = field(default_factory=NotificationConfig)
     providers: ProvidersConfig = field(default_factory=ProvidersConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    history: HistoryConfig = field(default_factory=HistoryConfig)
 
 
 # ---------------------------------------------------------------------------
@@ -154,6 +193,15 @@ def _as_int_list(value: Any, fallback: List[int]) -> List[int]:
     return out or fallback
 
 
+def _optional_int(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _load_yaml(path: str) -> Tuple[dict, List[str]]:
     warnings: List[str] = []
     if not os.path.exists(path):
@@ -186,8 +234,11 @@ def load_config(yaml_path: str = "config.yaml") -> Tuple[Config, List[str]]:
     academic_data = _get_dict(data, "academic_year", {})
     semester_data = _get_dict(academic_data, "semester1", {})
     polling_data = _get_dict(data, "polling", {})
+    polling_providers = _get_dict(polling_data, "providers", {})
     notify_data = _get_dict(data, "notifications", {})
     providers_data = _get_dict(data, "providers", {})
+    cache_data = _get_dict(data, "cache", {})
+    history_data = _get_dict(data, "history", {})
 
     # Parse notifier configs
     notify_type = str(notify_data.get("type", "stdout"))
@@ -233,9 +284,25 @@ def load_config(yaml_path: str = "config.yaml") -> Tuple[Config, List[str]]:
         polling=PollingConfig(
             interval_seconds=int(polling_data.get("interval_seconds", 300)),
             jitter_seconds=int(polling_data.get("jitter_seconds", 30)),
+            provider_interval_seconds={
+                str(name): int(opts["interval_seconds"])
+                for name, opts in polling_providers.items()
+                if isinstance(opts, dict) and opts.get("interval_seconds") is not None
+            },
+            seen_ttl_days=max(1, int(polling_data.get("seen_ttl_days", 60))),
+            provider_jitter_seconds={
+                str(name): int(opts["jitter_seconds"])
+                for name, opts in polling_providers.items()
+                if isinstance(opts, dict) and opts.get("jitter_seconds") is not None
+            },
         ),
         notifications=NotificationConfig(
             type=notify_type,
+            routes={
+                str(event): str(route)
+                for event, route in _get_dict(notify_data, "routes", {}).items()
+                if route is not None
+            },
             stdout=StdoutNotifierConfig(enabled=True),
             webhook=WebhookNotifierConfig(
                 enabled=bool(webhook_data.get("enabled", False)),
@@ -265,9 +332,25 @@ def load_config(yaml_path: str = "config.yaml") -> Tuple[Config, List[str]]:
         ),
         providers=ProvidersConfig(
             yugo_enabled=bool(_get_dict(providers_data, "yugo", {}).get("enabled", True)),
+            yugo_max_workers=max(1, int(_get_dict(providers_data, "yugo", {}).get("max_workers", 8))),
+            yugo_max_in_flight=max(1, int(_get_dict(providers_data, "yugo", {}).get("max_in_flight", 8))),
+            yugo_timeout_seconds=max(1.0, float(_get_dict(providers_data, "yugo", {}).get("timeout_seconds", 120))),
             aparto_enabled=bool(_get_dict(providers_data, "aparto", {}).get("enabled", True)),
-            aparto_term_id_start=int(_get_dict(providers_data, "aparto", {}).get("term_id_start", 1200)),
-            aparto_term_id_end=int(_get_dict(providers_data, "aparto", {}).get("term_id_end", 1600)),
+            aparto_timeout_seconds=max(1.0, float(_get_dict(providers_data, "aparto", {}).get("timeout_seconds", 300))),
+            aparto_term_id_start=_optional_int(_get_dict(providers_data, "aparto", {}).get("term_id_start")),
+            aparto_term_id_end=_optional_int(_get_dict(providers_data, "aparto", {}).get("term_id_end")),
+            aparto_cities=[
+                str(c).strip() for c in (_get_dict(providers_data, "aparto", {}).get("cities") or [])
+                if str(c).strip()
+            ],
+        ),
+        cache=CacheConfig(
+            enabled=bool(cache_data.get("enabled", True)),
+            directory=cache_data.get("directory"),
+        ),
+        history=HistoryConfig(
+            enabled=bool(history_data.get("enabled", True)),
+            directory=history_data.get("directory"),
         ),
     )
 
@@ -5,7 +5,8 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import replace
+from typing import Dict, Iterable, Optional
 
 from student_rooms.models.config import NotificationConfig
 
@@ -102,3 +103,25 @@ def create_notifier(config: NotificationConfig) -> BaseNotifier:
     else:
         logger.warning("Unknown notifier type '%s', falling back to stdout.", notifier_type)
         return StdoutNotifier()
+
+
+def create_event_notifiers(
+    config: NotificationConfig,
+    event_types: Iterable[str],
+) -> Dict[str, Optional[BaseNotifier]]:
+    """
+    Map each watch change event type to its routed notifier (None when the
+    event is silenced). Event types routed to the same backend share one
+    notifier instance.
+    """
+    by_type: Dict[str, BaseNotifier] = {}
+    routed: Dict[str, Optional[BaseNotifier]] = {}
+    for event_type in event_types:
+        route = config.route_for(event_type)
+        if route is None:
+            routed[event_type] = None
+            continue
+        if route not in by_type:
+            by_type[route] = create_notifier(replace(config, type=route))
+        routed[event_type] = by_type[route]
+    return routed
@@ -18,18 +18,26 @@ StarRez portal topology:
 """
 from __future__ import annotations
 
+import codecs
 import concurrent.futures
+import functools
+import hashlib
+import html as html_lib
 import json
 import logging
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
 
 import requests
 from bs4 import BeautifulSoup
 
+from student_rooms.cache import JsonCache
 from student_rooms.models.config import AcademicYearConfig
 from student_rooms.providers.base import BaseProvider, RoomOption
 
@@ -105,9 +113,96 @@ CITY_SLUG_MAP: Dict[str, str] = {
 # For efficiency, the default range targets the recent 400 IDs where
 # current-year terms cluster.  A full historical scan can be done by
 # explicitly passing start_id=100.
+# DEFAULT_TERM_SCAN_END is only a soft bound: unless an end is configured,
+# hits near it trigger a galloping search for the live frontier (doubling
+# steps from the last hit, then binary refinement), capped at
+# TERM_FRONTIER_MAX_SPAN IDs past the last hit. Each gallop point probes a
+# small window of IDs because live termIDs are sparse.
 DEFAULT_TERM_SCAN_START = 1200
 DEFAULT_TERM_SCAN_END = 1600
 DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES = 50
+TERM_FRONTIER_INITIAL_STEP = 16
+TERM_FRONTIER_PROBE_WINDOW = 4
+TERM_FRONTIER_MAX_SPAN = 4096
+
+# StarRez session pool. Probes are spread over several portal sessions;
+# their cookies are persisted in the cache and reused across runs until
+# they are older than STARREZ_SESSION_MAX_AGE_SECONDS. A session that lands
+# on the country-selection page, or that stops finding a known-valid term
+# after STARREZ_SESSION_CANARY_MISSES consecutive misses, is treated as
+# expired and re-established.
+STARREZ_SESSION_POOL_SIZE = 4
+STARREZ_SESSION_MAX_AGE_SECONDS = 4 * 3600
+STARREZ_SESSION_CANARY_MISSES = 25
+_SESSION_EXPIRED_MARKERS = ("CheckOrderList", "Choose_Your_Country")
+
+# Term probe responses are streamed and read only until every field the
+# parser needs has been seen, up to TERM_PROBE_BYTE_BUDGET bytes. When a
+# read stops early and at most TERM_PROBE_DRAIN_BYTES remain (per
+# Content-Length), the rest is drained so the connection can be reused.
+TERM_PROBE_BYTE_BUDGET = 512 * 1024
+TERM_PROBE_CHUNK_BYTES = 16 * 1024
+# Completeness checks scan each newly read chunk plus this many characters
+# before it, so markers straddling a chunk boundary are still found.
+TERM_PAGE_SCAN_OVERLAP_CHARS = 2048
+TERM_PROBE_DRAIN_BYTES = 64 * 1024
+
+# Room cards (data-roombaseid / room-result) are parsed from the term page
+# itself, so a read that has seen a card continues until the listing ends:
+# a closing </main>, a <footer> or </body> after the last card, or
+# TERM_ROOM_LISTING_GAP_CHARS of page without another one. Each card's
+# markup is capped at TERM_ROOM_CARD_MAX_CHARS.
+TERM_ROOM_LISTING_GAP_CHARS = 32 * 1024
+TERM_ROOM_CARD_MAX_CHARS = 8 * 1024
+
+# Adaptive (AIMD) concurrency for termID probing. The in-flight limit grows
+# by one after each window of `limit` healthy responses and halves on a
+# 429, a 5xx, a network error or a response slower than
+# PROBE_SLOW_RESPONSE_SECONDS (at most once per window). The pause between
+# submissions moves the other way: it doubles on back-off and halves on
+# growth.
+PROBE_CONCURRENCY_INITIAL = 8
+PROBE_CONCURRENCY_MIN = 1
+PROBE_CONCURRENCY_MAX = 32
+PROBE_SLOW_RESPONSE_SECONDS = 5.0
+PROBE_PACE_MAX_SECONDS = 1.0
+
+# Persistent termID index (per portal). Known-valid IDs are re-validated on
+# every scan; known-dead IDs are only re-checked once their (staggered)
+# TTL expires. An index older than TERM_INDEX_MAX_AGE_SECONDS triggers a
+# full sweep so it cannot drift from the portal indefinitely.
+TERM_INDEX_DEAD_RECHECK_SECONDS = 24 * 3600
+TERM_INDEX_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# How long a provider reuses its last sweep's terms for probe_booking()
+# before falling back to a fresh sweep. Only the option's own termID is
+# re-checked against the portal while the snapshot is fresh.
+TERM_SNAPSHOT_MAX_AGE_SECONDS = 10 * 60
+
+# Property pages are only fetched as a price fallback, for properties whose
+# StarRez term pages listed no rooms. Requests to apartostudent.com start at
+# most once per PROPERTY_FETCH_MIN_INTERVAL seconds, with a few in flight.
+PROPERTY_FETCH_WORKERS = 4
+PROPERTY_FETCH_MIN_INTERVAL = 0.25
+
+# Parsed property pages are cached by URL together with the page's content
+# hash and HTTP validators (ETag / Last-Modified). A 304 or an unchanged
+# hash reuses the parsed rooms without parsing; entries older than this
+# (counted from the last actual parse) are dropped so validators cannot pin
+# a page forever. Entries parsed by another PROPERTY_PAGE_PARSER_VERSION are
+# misses; bump it whenever _parse_property_page changes its output.
+PROPERTY_PAGE_CACHE_TTL_SECONDS = 30 * 24 * 3600
+PROPERTY_PAGE_PARSER_VERSION = 2
+
+# Discovered properties (with their aliases) are cached per city slug. An
+# entry younger than PROPERTY_DISCOVERY_FRESH_SECONDS is used as is; an
+# older one is still used straight away while a background thread
+# re-scrapes the city page, and the refreshed list replaces it on the next
+# scan; short-lived commands wait for that thread before exiting (see
+# wait_for_background). Entries past PROPERTY_DISCOVERY_MAX_AGE_SECONDS are only used if
+# the city page cannot be fetched.
+PROPERTY_DISCOVERY_FRESH_SECONDS = 7 * 24 * 3600
+PROPERTY_DISCOVERY_MAX_AGE_SECONDS = 90 * 24 * 3600
 
 HEADERS = {
     "User-Agent": (
@@ -143,24 +238,226 @@ class StarRezTerm:
     is_semester1: bool
     has_rooms: bool
     booking_url: str
+    rooms: List[Dict[str, Any]] = field(default_factory=list)  # parsed room cards
+
+
+class _TransientProbeError(Exception):
+    """A term probe failed for a reason that says nothing about the termID."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class StarRezTermIndex:
+    """
+    Persistent record of known-valid and known-dead termIDs for one portal.
+
+    Lets scans skip the bulk of a range sweep: known hits are re-validated,
+    dead IDs are re-checked on a slow, per-ID staggered cadence, and new IDs
+    are discovered by probing upward from the highest known hit.
+    """
+
+    def __init__(
+        self,
+        cache: JsonCache,
+        portal_base: str,
+        dead_recheck_seconds: float = TERM_INDEX_DEAD_RECHECK_SECONDS,
+        max_age_seconds: float = TERM_INDEX_MAX_AGE_SECONDS,
+    ):
+        self._cache = cache
+        self._key = f"aparto/term-index/{urlsplit(portal_base).netloc}"
+        self.dead_recheck_seconds = dead_recheck_seconds
+        self.max_age_seconds = max_age_seconds
+        self.valid: Dict[int, float] = {}
+        self.dead: Dict[int, float] = {}
+        self.created_at = 0.0
+        self._load()
+
+    def _load(self) -> None:
+        entry = self._cache.get_entry(self._key)
+        data = entry.value if entry else None
+        if not isinstance(data, dict):
+            return
+        try:
+            self.valid = {int(k): float(v) for k, v in (data.get("valid") or {}).items()}
+            self.dead = {int(k): float(v) for k, v in (data.get("dead") or {}).items()}
+            self.created_at = float(data.get("created_at") or 0.0)
+        except (TypeError, ValueError, AttributeError):
+            self.valid, self.dead, self.created_at = {}, {}, 0.0
+
+    def save(self) -> None:
+        self._cache.set(self._key, {
+            "created_at": self.created_at,
+            "valid": {str(k): v for k, v in sorted(self.valid.items())},
+            "dead": {str(k): v for k, v in sorted(self.dead.items())},
+        })
+
+    @property
+    def high_water_mark(self) -> Optional[int]:
+        return max(self.valid) if self.valid else None
+
+    def _dead_expired(self, term_id: int, checked_at: float, now: float) -> bool:
+        # Stagger re-checks over 0.75x–1.25x of the TTL so dead IDs found in
+        # the same sweep do not all come due on the same scan.
+        spread = 0.75 + 0.5 * ((term_id * 2654435761) % 1000) / 1000
+        return now - checked_at > self.dead_recheck_seconds * spread
+
+    def plan(self, start_id: int, end_id: int, now: Optional[float] = None) -> Optional[Tuple[List[int], int]]:
+        """
+        Return (term_ids, frontier_start) to probe, or None for a full sweep.
+
+        term_ids holds known-valid IDs, dead IDs due for a re-check, IDs in
+        range never probed before, then every ID from frontier_start (one
+        past the high-water mark) to end_id. Only the frontier segment is
+        subject to the consecutive-miss early stop.
+        """
+        now = time.time() if now is None else now
+        high = self.high_water_mark
+        if high is None or now - self.created_at > self.max_age_seconds:
+            return None
+
+        frontier_start = max(start_id, high + 1)
+        known: Set[int] = set()
+        for tid in range(start_id, min(high, end_id) + 1):
+            if tid in self.valid:
+                known.add(tid)
+            elif tid in self.dead:
+                if self._dead_expired(tid, self.dead[tid], now):
+                    known.add(tid)
+            else:
+                known.add(tid)
+        return sorted(known) + list(range(frontier_start, end_id + 1)), frontier_start
+
+    def record(self, results: Dict[int, Optional["StarRezTerm"]], full_sweep: bool, now: Optional[float] = None) -> None:
+        """Fold probe outcomes into the index (transient failures excluded)."""
+        now = time.time() if now is None else now
+        if full_sweep:
+            self.created_at = now
+        for tid, term in results.items():
+            if term is not None:
+                self.valid[tid] = now
+                self.dead.pop(tid, None)
+            else:
+                self.dead[tid] = now
+                self.valid.pop(tid, None)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _fetch(
+class _RateLimiter:
+    """Space out request starts across threads by a minimum interval."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.min_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+class _AimdController:
+    """
+    Additive-increase / multiplicative-decrease limit on in-flight probes.
+
+    Worker threads report each probe via record(); the submitting thread
+    reads `limit` and `pace`. Decisions are logged and counted in stats().
+    """
+
+    def __init__(
+        self,
+        initial: int = PROBE_CONCURRENCY_INITIAL,
+        minimum: int = PROBE_CONCURRENCY_MIN,
+        maximum: int = PROBE_CONCURRENCY_MAX,
+        pace: float = 0.05,
+        slow_seconds: float = PROBE_SLOW_RESPONSE_SECONDS,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self.pace = pace
+        self._pace_floor = pace
+        self.slow_seconds = slow_seconds
+        self._lock = threading.Lock()
+        self._healthy_streak = 0
+        self._cooldown = 0
+        self._counts = {"responses": 0, "congested": 0, "increases": 0, "decreases": 0}
+        self._peak = self.limit
+        self._latency_total = 0.0
+
+    def record(self, latency: float, status: Optional[int] = None, failed: bool = False) -> None:
+        """Report one probe: its latency, and the HTTP status if it failed."""
+        congested = failed and (status is None or status == 429 or status >= 500)
+        congested = congested or latency > self.slow_seconds
+        with self._lock:
+            self._counts["responses"] += 1
+            self._latency_total += latency
+            if self._cooldown:
+                self._cooldown -= 1
+            if congested:
+                self._counts["congested"] += 1
+                self._healthy_streak = 0
+                if self._cooldown == 0:
+                    self._decrease(status, latency)
+                return
+            self._healthy_streak += 1
+            if self._healthy_streak >= self.limit and self.limit < self.maximum:
+                self._healthy_streak = 0
+                self.limit += 1
+                self.pace = self.pace / 2 if self.pace >= 0.01 else 0.0
+                self._peak = max(self._peak, self.limit)
+                self._counts["increases"] += 1
+                logger.debug("StarRez probe concurrency → %d (healthy)", self.limit)
+
+    def _decrease(self, status: Optional[int], latency: float) -> None:
+        previous = self.limit
+        self.limit = max(self.minimum, self.limit // 2)
+        self.pace = min(PROBE_PACE_MAX_SECONDS, max(self.pace * 2, self._pace_floor, 0.05))
+        self._cooldown = previous
+        self._counts["decreases"] += 1
+        reason = f"HTTP {status}" if status else (
+            f"slow response {latency:.1f}s" if latency > self.slow_seconds else "request error"
+        )
+        logger.info(
+            "StarRez probe concurrency %d → %d, pace %.2fs (%s)",
+            previous, self.limit, self.pace, reason,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the current scan: decisions, peak limit, mean latency."""
+        with self._lock:
+            responses = self._counts["responses"]
+            return {
+                **self._counts,
+                "limit": self.limit,
+                "peak": self._peak,
+                "pace": self.pace,
+                "meanLatency": (self._latency_total / responses) if responses else 0.0,
+            }
+
+
+def _fetch_response(
     session: requests.Session,
     url: str,
     timeout: int = 20,
     retries: int = 3,
-) -> Optional[str]:
-    """Fetch URL with retries; return HTML text or None on failure."""
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> Optional[requests.Response]:
+    """Fetch URL with retries; return the 200/304 response or None on failure."""
+    headers = {**HEADERS, **extra_headers} if extra_headers else HEADERS
     for attempt in range(1, retries + 1):
         try:
-            resp = session.get(url, headers=HEADERS, timeout=timeout)
-            if resp.status_code == 200:
-                return resp.text
+            resp = session.get(url, headers=headers, timeout=timeout)
+            if resp.status_code in (200, 304):
+                return resp
             if resp.status_code == 404:
                 return None
             logger.warning("HTTP %s fetching %s (attempt %s/%s)", resp.status_code, url, attempt, retries)
@@ -171,6 +468,17 @@ def _fetch(
     return None
 
 
+def _fetch(
+    session: requests.Session,
+    url: str,
+    timeout: int = 20,
+    retries: int = 3,
+) -> Optional[str]:
+    """Fetch URL with retries; return HTML text or None on failure."""
+    resp = _fetch_response(session, url, timeout=timeout, retries=retries)
+    return resp.text if resp is not None else None
+
+
 def _extract_next_data(html: str) -> Optional[Dict[str, Any]]:
     """Extract the __NEXT_DATA__ JSON embedded by Next.js."""
     try:
@@ -183,51 +491,258 @@ def _extract_next_data(html: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _extract_rsc_json_chunks(html: str) -> List[Any]:
+_RSC_PUSH_RE = re.compile(r'self\.__next_f\.push\(\[1\s*,\s*"')
+_RSC_TEXT_ROW_RE = re.compile(r'[0-9a-fA-F]*:T([0-9a-fA-F]+),')
+# Rows that can yield a room must carry one of the price keys read by
+# _extract_rooms_from_next_data; everything else is skipped unparsed.
+_RSC_PRICE_HINT_RE = re.compile(r'"(?:price|priceFrom|weeklyPrice)"\s*:')
+RSC_MAX_ROW_CHARS = 4 * 1024 * 1024
+
+
+class _RscRowStream:
     """
-    Extract JSON objects pushed via Next.js RSC:
-      self.__next_f.push([1, '...json...'])
+    Incremental splitter for the Next.js RSC stream.
+
+    The payload pushed through self.__next_f is one text stream of
+    `<id>:<value>` rows separated by newlines, cut into chunks at arbitrary
+    points. Feed decoded chunks in order; complete JSON rows carrying price
+    keys are yielded as parsed values. Only the row being assembled is
+    buffered, and rows longer than `max_row_chars` are dropped. Text rows
+    (`<id>:T<hex byte length>,...`) are skipped by length since their
+    content may contain newlines.
     """
-    results = []
-    pattern = re.compile(r'self\.__next_f\.push\(\[1\s*,\s*"((?:[^"\\]|\\.)*)"\]\)', re.DOTALL)
-    for match in pattern.finditer(html):
-        raw = match.group(1)
-        try:
-            unescaped = raw.encode("utf-8").decode("unicode_escape")
-        except Exception:
-            unescaped = raw.replace('\\"', '"').replace("\\n", "\n")
-        try:
-            for line in unescaped.splitlines():
-                colon_idx = line.find(":")
-                if colon_idx < 0:
+
+    def __init__(self, max_row_chars: int = RSC_MAX_ROW_CHARS):
+        self._max_row_chars = max_row_chars
+        self._row: List[str] = []
+        self._row_chars = 0
+        self._overflow = False
+        self._text_bytes = 0
+
+    def feed(self, chunk: str) -> Iterable[Any]:
+        pos = 0
+        while pos < len(chunk):
+            if self._text_bytes:
+                pos = self._skip_text(chunk, pos)
+                continue
+            if not self._row and not self._overflow:
+                # Text row headers split across chunks are not recognised;
+                # those rows then fall through to the newline splitter.
+                text_row = _RSC_TEXT_ROW_RE.match(chunk, pos)
+                if text_row:
+                    self._text_bytes = int(text_row.group(1), 16)
+                    pos = text_row.end()
                     continue
-                json_part = line[colon_idx + 1:]
-                if json_part.startswith("{") or json_part.startswith("["):
-                    try:
-                        results.append(json.loads(json_part))
-                    except json.JSONDecodeError:
-                        pass
-        except Exception:
+            newline = chunk.find("\n", pos)
+            end = len(chunk) if newline < 0 else newline
+            if not self._overflow:
+                self._row.append(chunk[pos:end])
+                self._row_chars += end - pos
+                if self._row_chars > self._max_row_chars:
+                    logger.debug("RSC row exceeds %d chars; skipping", self._max_row_chars)
+                    self._overflow = True
+                    self._row = []
+            if newline < 0:
+                break
+            yield from self._end_row()
+            pos = newline + 1
+
+    def close(self) -> Iterable[Any]:
+        yield from self._end_row()
+
+    def _skip_text(self, chunk: str, pos: int) -> int:
+        piece = chunk[pos:pos + self._text_bytes]
+        size = len(piece.encode("utf-8"))
+        if size <= self._text_bytes:
+            self._text_bytes -= size
+            return pos + len(piece)
+        for offset, char in enumerate(piece):
+            self._text_bytes -= len(char.encode("utf-8"))
+            if self._text_bytes <= 0:
+                self._text_bytes = 0
+                return pos + offset + 1
+        return pos + len(piece)
+
+    def _end_row(self) -> Iterable[Any]:
+        row = "".join(self._row)
+        self._row = []
+        self._row_chars = 0
+        if self._overflow:
+            self._overflow = False
+            return
+        colon = row.find(":")
+        if colon < 0:
+            return
+        value = row[colon + 1:]
+        if value[:1] not in ("{", "[") or not _RSC_PRICE_HINT_RE.search(value):
+            return
+        try:
+            yield json.loads(value)
+        except json.JSONDecodeError:
             pass
-    return results
+
+
+def _iter_rsc_json(html: str, max_row_chars: int = RSC_MAX_ROW_CHARS) -> Iterable[Any]:
+    """
+    Yield RSC rows from a Next.js page that carry price data, in one pass.
+
+    Each self.__next_f.push([1, "..."]) string literal is decoded with the
+    JSON string scanner and fed straight into an _RscRowStream, so no
+    intermediate list of chunks or fragments is built.
+    """
+    stream = _RscRowStream(max_row_chars)
+    pos = 0
+    while True:
+        push = _RSC_PUSH_RE.search(html, pos)
+        if not push:
+            break
+        try:
+            chunk, pos = json.decoder.scanstring(html, push.end(), False)
+        except ValueError:
+            pos = push.end()
+            continue
+        yield from stream.feed(chunk)
+    yield from stream.close()
+
+
+_TEXT_SKIP_TAGS = frozenset({"script", "style"})
+_PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+_ASCII_SPACES = " \n\t\x0c\r"
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+})
+_CONTAINER_TAGS = frozenset({"div", "section", "article"})
+
+
+class _PageScanner(HTMLParser):
+    """
+    Single pass over a page collecting its visible text and anchor links.
+
+    `text` matches BeautifulSoup's get_text(separator=" "). Each link
+    records the text of its nearest enclosing div/section/article, which
+    is joined once when that container closes rather than once per link.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._pieces: List[str] = []
+        self._data: List[str] = []
+        self._stack: List[List[Any]] = []  # [tag, first piece index, pending links]
+        self._skip = 0
+        self._preserve = 0
+        self.links: List[Dict[str, Optional[str]]] = []
+
+    @classmethod
+    def scan(cls, html: str) -> "_PageScanner":
+        scanner = cls()
+        scanner.feed(html)
+        scanner.close()
+        return scanner
+
+    @property
+    def text(self) -> str:
+        return " ".join(self._pieces)
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self._flush()
+        if tag == "a":
+            href = dict(attrs).get("href", False)
+            if href is not False:
+                link: Dict[str, Optional[str]] = {"href": href or "", "container_text": None}
+                self.links.append(link)
+                for entry in reversed(self._stack):
+                    if entry[0] in _CONTAINER_TAGS:
+                        entry[2].append(link)
+                        break
+        if tag in _VOID_TAGS:
+            return
+        if tag in _TEXT_SKIP_TAGS:
+            self._skip += 1
+        elif tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve += 1
+        self._stack.append([tag, len(self._pieces), []])
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                while len(self._stack) > depth:
+                    self._close(self._stack.pop())
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+        if data.startswith("CDATA[") and not self._skip:
+            self._pieces.append(data[len("CDATA["):])
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        while self._stack:
+            self._close(self._stack.pop())
+
+    def _flush(self) -> None:
+        if not self._data:
+            return
+        data = "".join(self._data)
+        self._data = []
+        if self._skip:
+            return
+        # Like BeautifulSoup, collapse whitespace-only runs outside <pre>.
+        if not self._preserve and not data.strip(_ASCII_SPACES):
+            data = "\n" if "\n" in data else " "
+        self._pieces.append(data)
+
+    def _close(self, entry: List[Any]) -> None:
+        tag, first, links = entry
+        if tag in _TEXT_SKIP_TAGS:
+            self._skip -= 1
+        elif tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve -= 1
+        if links:
+            container_text = " ".join(self._pieces[first:])
+            for link in links:
+                link["container_text"] = container_text
+
+
+_PROXIMITY_PRICE_RE = re.compile(
+    r'(Bronze|Silver|Gold|Platinum|Studio|Deluxe)[\s\-]*(Ensuite|En-suite|Studio|Room|Suite|Apartment)?'
+    r'.{0,200}?[€£]\s*(\d+(?:[.,]\d+)?)\s*(?:p/?w|/week|per week|pw)',
+    re.IGNORECASE | re.DOTALL,
+)
+# Tier mentions, weekly prices and monthly prices in one scan (the three
+# fallbacks used when no tier sits next to its price).
+_PRICE_TOKEN_RE = re.compile(
+    r'\b(?P<tier>Bronze|Silver|Gold|Platinum|Studio|Deluxe)\b'
+    r'(?:[\s\-]*(?P<subtype>Ensuite|En-suite|Room|Suite|Apartment))?'
+    r'|[€£]\s*(?P<amount>\d+(?:[.,]\d+)?)\s*'
+    r'(?:(?P<weekly>p/?w|/week|per week|pw)|(?P<monthly>per month|/month|p/?m|pcm))',
+    re.IGNORECASE,
+)
+_APARTO_TIERS = ["Bronze", "Silver", "Gold", "Platinum"]
+_TIER_ORDER = {t: i for i, t in enumerate(_APARTO_TIERS)}
 
 
 def _extract_prices_from_html(html: str, property_name: str) -> List[Dict[str, Any]]:
     """Parse room types and prices from HTML."""
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.get_text(separator=" ")
-
-    APARTO_TIERS = ["Bronze", "Silver", "Gold", "Platinum"]
+    text = _PageScanner.scan(html).text
 
     rooms = []
     seen_tiers: set = set()
-
-    proximity_pattern = re.compile(
-        r'(Bronze|Silver|Gold|Platinum|Studio|Deluxe)[\s\-]*(Ensuite|En-suite|Studio|Room|Suite|Apartment)?'
-        r'.{0,200}?[€£]\s*(\d+(?:[.,]\d+)?)\s*(?:p/?w|/week|per week|pw)',
-        re.IGNORECASE | re.DOTALL,
-    )
-    for m in proximity_pattern.finditer(text):
+    for m in _PROXIMITY_PRICE_RE.finditer(text):
         tier = m.group(1).strip().title()
         subtype = (m.group(2) or "Ensuite").strip().title()
         label = f"{tier} {subtype}"
@@ -245,43 +760,33 @@ def _extract_prices_from_html(html: str, property_name: str) -> List[Dict[str, A
         })
 
     if rooms:
-        tier_order = {t: i for i, t in enumerate(APARTO_TIERS)}
-        rooms.sort(key=lambda r: tier_order.get(r["room_type"].split()[0].title(), 99))
+        rooms.sort(key=lambda r: _TIER_ORDER.get(r["room_type"].split()[0].title(), 99))
         return rooms
 
-    # Fallback: check for monthly pricing (common for ES/IT)
-    monthly_pattern = re.compile(
-        r'[€£]\s*(\d+(?:[.,]\d+)?)\s*(?:per month|/month|p/?m|pcm)',
-        re.IGNORECASE,
-    )
-    monthly_prices = monthly_pattern.findall(text)
+    found_tiers: List[str] = []
+    weekly_prices: Set[float] = set()
+    monthly_prices: Set[float] = set()
+    for m in _PRICE_TOKEN_RE.finditer(text):
+        if m.group("tier"):
+            label = f"{m.group('tier').strip().title()} {(m.group('subtype') or 'Ensuite').strip().title()}"
+            if label not in found_tiers:
+                found_tiers.append(label)
+        elif m.group("weekly"):
+            weekly_prices.add(float(m.group("amount").replace(",", ".")))
+        else:
+            monthly_prices.add(float(m.group("amount").replace(",", ".")))
+
+    # Fallback: monthly pricing (common for ES/IT)
     if monthly_prices:
-        prices = sorted({float(p.replace(",", ".")) for p in monthly_prices if p})
-        if prices:
-            return [{
-                "room_type": "Room",
-                "price_label": f"from €{prices[0]:.0f}/month",
-                "price_weekly": round(prices[0] / 4.33, 2),  # approximate
-            }]
+        cheapest = min(monthly_prices)
+        return [{
+            "room_type": "Room",
+            "price_label": f"from €{cheapest:.0f}/month",
+            "price_weekly": round(cheapest / 4.33, 2),  # approximate
+        }]
 
     # Fallback: separate tier list + price list
-    tier_pattern = re.compile(
-        r'\b(Bronze|Silver|Gold|Platinum|Studio|Deluxe)\b'
-        r'[\s\-]*(Ensuite|En-suite|Room|Suite|Apartment)?',
-        re.IGNORECASE,
-    )
-    found_tiers = []
-    for m in tier_pattern.finditer(text):
-        tier = m.group(1).strip().title()
-        subtype = (m.group(2) or "Ensuite").strip().title()
-        label = f"{tier} {subtype}"
-        if label not in found_tiers:
-            found_tiers.append(label)
-
-    price_pattern = re.compile(r'[€£]\s*(\d+(?:[.,]\d+)?)\s*(?:p/?w|/week|per week|pw)', re.IGNORECASE)
-    prices_raw = price_pattern.findall(text)
-    prices = sorted({float(p.replace(",", ".")) for p in prices_raw if p})
-
+    prices = sorted(weekly_prices)
     if not found_tiers:
         weekly = prices[0] if prices else None
         return [{
@@ -290,9 +795,7 @@ def _extract_prices_from_html(html: str, property_name: str) -> List[Dict[str, A
             "price_weekly": weekly,
         }]
 
-    tier_order = {t: i for i, t in enumerate(APARTO_TIERS)}
-    found_tiers.sort(key=lambda l: tier_order.get(l.split()[0].title(), 99))
-
+    found_tiers.sort(key=lambda l: _TIER_ORDER.get(l.split()[0].title(), 99))
     for idx, tier_label in enumerate(found_tiers):
         weekly = prices[idx] if idx < len(prices) else (prices[0] if prices else None)
         rooms.append({
@@ -343,6 +846,31 @@ def _extract_rooms_from_next_data(next_data: Dict[str, Any]) -> List[Dict[str, A
 # Dynamic property discovery
 # ---------------------------------------------------------------------------
 
+def _extract_rooms_from_rsc(html: str) -> List[Dict[str, Any]]:
+    """Room data from the page's RSC stream, first occurrence of each room type."""
+    rooms: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+    for value in _iter_rsc_json(html):
+        for room in _extract_rooms_from_next_data(value):
+            if room["room_type"] not in seen:
+                seen.add(room["room_type"])
+                rooms.append(room)
+    return rooms
+
+
+def _parse_property_page(html: str, property_name: str) -> List[Dict[str, Any]]:
+    """Parse room types + prices from a property page (Next.js data, RSC, then HTML)."""
+    next_data = _extract_next_data(html)
+    if next_data:
+        rooms = _extract_rooms_from_next_data(next_data)
+        if rooms:
+            return rooms
+    rooms = _extract_rooms_from_rsc(html)
+    if rooms:
+        return rooms
+    return _extract_prices_from_html(html, property_name)
+
+
 def _discover_city_properties(
     session: requests.Session,
     city_slug: str,
@@ -358,14 +886,30 @@ def _discover_city_properties(
         logger.warning("Could not fetch city page: %s", url)
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
+    properties = _parse_city_page(html, city_slug)
+    if not properties:
+        logger.warning("No properties found for city slug: %s", city_slug)
+
+    return properties
+
+
+_ADDRESS_RE = re.compile(
+    r'((?:Carrer|Calle|Via|Rue|Street|St|Rd|Road|Square|Place|Point|Tce|Terrace)\s+[^,\n]{3,50}(?:,\s*[^,\n]{3,30})?)',
+    re.IGNORECASE,
+)
+
+
+def _property_link_pattern(city_slug: str) -> re.Pattern:
+    return re.compile(rf'^{re.escape(MAIN_BASE)}/locations/{re.escape(city_slug)}/([a-z0-9-]+)/?$')
+
+
+def _parse_city_page(html: str, city_slug: str) -> List[Dict[str, str]]:
+    """Extract property links (with nearby addresses) from a city page in one pass."""
+    pattern = _property_link_pattern(city_slug)
     properties: List[Dict[str, str]] = []
     seen_slugs: Set[str] = set()
-
-    # Find all links to /locations/{city_slug}/{property_slug}
-    pattern = re.compile(rf'^{re.escape(MAIN_BASE)}/locations/{re.escape(city_slug)}/([a-z0-9-]+)/?$')
-    for link in soup.find_all("a", href=True):
-        href = link.get("href", "")
+    for link in _PageScanner.scan(html).links:
+        href = link["href"] or ""
         if not href.startswith("http"):
             href = MAIN_BASE + href
         m = pattern.match(href.rstrip("/"))
@@ -376,36 +920,22 @@ def _discover_city_properties(
             continue
         seen_slugs.add(slug)
 
-        # Derive display name from slug
-        name = slug.replace("-", " ").title()
-
-        # Try to get address text near the link
-        parent = link.find_parent(["div", "section", "article"])
         location = ""
-        if parent:
-            addr_text = parent.get_text(separator=" ").strip()
-            # Look for address patterns (street names, postcodes)
-            addr_match = re.search(
-                r'((?:Carrer|Calle|Via|Rue|Street|St|Rd|Road|Square|Place|Point|Tce|Terrace)\s+[^,\n]{3,50}(?:,\s*[^,\n]{3,30})?)',
-                addr_text,
-                re.IGNORECASE,
-            )
+        if link["container_text"] is not None:
+            addr_match = _ADDRESS_RE.search(link["container_text"].strip())
             if addr_match:
                 location = addr_match.group(1).strip()
 
         properties.append({
             "slug": slug,
-            "name": name,
+            "name": slug.replace("-", " ").title(),
             "location": location,
             "url": f"{MAIN_BASE}/locations/{city_slug}/{slug}",
         })
-
-    if not properties:
-        logger.warning("No properties found for city slug: %s", city_slug)
-
     return properties
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalise_name(name: str) -> str:
     """Normalise a property name for fuzzy matching."""
     return re.sub(r'[^a-z0-9\s]', '', name.lower()).strip()
@@ -457,6 +987,7 @@ def _parse_months_from_name(term_name: str) -> Optional[int]:
     return int(m.group(1)) if m else None
 
 
+@functools.lru_cache(maxsize=4096)
 def _extract_property_name(term_name: str) -> str:
     """Extract property name from term name like 'Binary Hub - 26/27 - 41 Weeks'.
 
@@ -482,6 +1013,94 @@ def _extract_property_name(term_name: str) -> str:
     return term_name
 
 
+def _substrings(text: str) -> Iterable[str]:
+    """Yield every substring of text, including the empty string."""
+    yield ""
+    for i in range(len(text)):
+        for j in range(i + 1, len(text) + 1):
+            yield text[i:j]
+
+
+class _PropertyMatcher:
+    """
+    Precomputed lookups for matching StarRez term names to properties.
+
+    Built once per property discovery. Gives the same answers as the
+    original linear scans (substring match against every known name, then
+    alias/prefix checks) via set and dict lookups keyed by the term's own
+    substrings and word prefixes, so cost no longer grows with the number
+    of properties and aliases.
+    """
+
+    def __init__(
+        self,
+        property_names: Iterable[str],
+        property_aliases: Dict[str, str],
+        properties: Optional[List[Dict[str, str]]] = None,
+    ):
+        self._known_norms: Set[str] = {_normalise_name(name) for name in property_names}
+        self._known_substrings: Set[str] = {
+            sub for norm in self._known_norms for sub in _substrings(norm)
+        }
+        self._aliases = property_aliases
+
+        # Mirrors {norm: prop} built in discovery order: the first occurrence
+        # fixes the position, a later duplicate replaces the value.
+        self._props_by_norm: Dict[str, Dict[str, str]] = {}
+        for prop in properties or []:
+            self._props_by_norm[_normalise_name(prop["name"])] = prop
+        self._position = {norm: pos for pos, norm in enumerate(self._props_by_norm)}
+        self._ordered = list(self._props_by_norm.values())
+        self._first_containing: Dict[str, int] = {}
+        for norm, pos in self._position.items():
+            for sub in _substrings(norm):
+                self._first_containing.setdefault(sub, pos)
+
+    def is_target_city_term(self, term_name: str) -> bool:
+        """Equivalent of _is_target_city_term() for this matcher's names."""
+        prop_name_norm = _normalise_name(_extract_property_name(term_name))
+
+        # Direct match: a known name contains the term's name, or vice versa
+        if self._known_norms:
+            if prop_name_norm in self._known_substrings:
+                return True
+            if any(sub in self._known_norms for sub in _substrings(prop_name_norm)):
+                return True
+
+        # Aliases (handles abbreviations like PA, CdM), as a whole name or
+        # a leading word prefix
+        if not self._aliases:
+            return False
+        if prop_name_norm in self._aliases:
+            return True
+        for i, ch in enumerate(prop_name_norm):
+            if ch == " " and prop_name_norm[:i] in self._aliases:
+                return True
+        term_start = _normalise_name(term_name.split("-")[0].strip() if "-" in term_name else term_name)
+        return term_start in self._aliases
+
+    def match_property(self, property_name: str) -> Optional[Dict[str, str]]:
+        """Return the first discovered property matching a term's property name."""
+        term_prop_norm = _normalise_name(property_name)
+
+        # Direct match: first property (in discovery order) whose name
+        # contains the term's name or is contained in it
+        positions = [
+            self._position[sub] for sub in set(_substrings(term_prop_norm))
+            if sub in self._position
+        ]
+        if term_prop_norm in self._first_containing:
+            positions.append(self._first_containing[term_prop_norm])
+        if positions:
+            return self._ordered[min(positions)]
+
+        # Alias match
+        canonical = self._aliases.get(term_prop_norm) if self._aliases else None
+        if canonical:
+            return self._props_by_norm.get(_normalise_name(canonical))
+        return None
+
+
 def _is_target_city_term(
     term_name: str,
     target_property_names: Set[str],
@@ -491,27 +1110,10 @@ def _is_target_city_term(
     Check if a term belongs to a property in the target city.
 
     Uses fuzzy matching against dynamically discovered property names
-    and their aliases/abbreviations.
+    and their aliases/abbreviations. Callers matching many terms should
+    build a _PropertyMatcher once instead.
     """
-    prop_name_raw = _extract_property_name(term_name)
-    prop_name_norm = _normalise_name(prop_name_raw)
-
-    # Direct match against known property names
-    for known_name in target_property_names:
-        known_norm = _normalise_name(known_name)
-        if known_norm in prop_name_norm or prop_name_norm in known_norm:
-            return True
-
-    # Check aliases (handles abbreviations like PA, CdM)
-    for alias, canonical in property_aliases.items():
-        if alias == prop_name_norm or prop_name_norm.startswith(alias + " "):
-            return True
-        # Also check if the alias appears at the start of the term name
-        term_start = _normalise_name(term_name.split("-")[0].strip() if "-" in term_name else term_name)
-        if alias == term_start:
-            return True
-
-    return False
+    return _PropertyMatcher(target_property_names, property_aliases).is_target_city_term(term_name)
 
 
 def _is_semester1_term(
@@ -562,10 +1164,510 @@ def _is_semester1_term(
     return False
 
 
+# ---------------------------------------------------------------------------
+# StarRez term page parsing
+# ---------------------------------------------------------------------------
+
+_TERM_INFO_RE = re.compile(
+    r"You have selected '([^']+)' booking term.*?"
+    r"begins on (\d{2}/\d{2}/\d{4}).*?"
+    r"ends on (\d{2}/\d{2}/\d{4})",
+    re.DOTALL,
+)
+_TERMID_TAG_RE = re.compile(r"<[a-z][^>]*?\sdata-termid(?=[\s=/>])[^>]*>", re.IGNORECASE)
+_ROOMBASEID_ATTR_RE = re.compile(r"<[a-z][^>]*?\sdata-roombaseid(?=[\s=/>])", re.IGNORECASE)
+_ROOM_RESULT_RE = re.compile(r"room-result", re.IGNORECASE)
+_ROOM_MARKER_RE = re.compile(r"room-result|\sdata-roombaseid(?=[\s=/>])", re.IGNORECASE)
+_ROOM_LISTING_END_RE = re.compile(r"</main\s*>|<footer\b|</body\s*>", re.IGNORECASE)
+_ROOMBASEID_TAG_RE = re.compile(r"<[a-z][^>]*?\sdata-roombaseid(?=[\s=/>])[^>]*>", re.IGNORECASE)
+_ROOM_RESULT_TAG_RE = re.compile(
+    r"<[a-z][^>]*?\sclass\s*=\s*(?:\"[^\"]*|'[^']*)room-result[^>]*>", re.IGNORECASE,
+)
+_ROOM_NAME_RE = re.compile(
+    r"<(h[1-6])\b[^>]*>(.*?)</\1\s*>"
+    r"|<[a-z][^>]*\sclass\s*=\s*[\"'][^\"']*(?:title|name)[^\"']*[\"'][^>]*>([^<]+)",
+    re.IGNORECASE | re.DOTALL,
+)
+_ROOM_PRICE_RE = re.compile(
+    r"([€£])\s*(\d[\d.,]*\d|\d)"
+    r"(?:\s*(?:per\s+|/\s*|p/?|a\s+)(week|wk|w|month|mth|cm|m|night|n)\b|\s+(weekly|monthly|nightly)\b)?",
+    re.IGNORECASE,
+)
+_ROOM_AVAILABLE_RE = re.compile(
+    r"(?<![\d€£.,])(\d+)\s+(?:rooms?\s+|beds?\s+|spaces?\s+)?(?:available|left|remaining)\b"
+    r"|available\s*(?:rooms?|beds?|spaces?)?\s*:\s*(\d+)",
+    re.IGNORECASE,
+)
+_ROOM_SOLD_OUT_RE = re.compile(
+    r"sold\s+out|fully\s+booked|no\s+(?:rooms?|beds?|spaces?)\s+(?:currently\s+)?(?:available|left)",
+    re.IGNORECASE,
+)
+_CURRENCY_MARKERS = ("€", "£", "&euro", "&pound", "&#8364", "&#163", "&#x20ac", "&#xa3")
+_NON_TEXT_RE = re.compile(
+    r"<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->|<[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@dataclass(slots=True)
+class _TermPageFields:
+    """Fields extracted from a StarRez room search page."""
+    term_name: Optional[str]
+    start_date: Optional[str]
+    end_date: Optional[str]
+    start_iso: Optional[str]
+    end_iso: Optional[str]
+    has_rooms: bool
+    rooms: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _tag_attr(tag: str, name: str) -> Optional[str]:
+    match = re.search(
+        rf"\s{name}\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))",
+        tag,
+        re.IGNORECASE,
+    )
+    if not match:
+        return None
+    value = next(g for g in match.groups() if g is not None)
+    return html_lib.unescape(value)
+
+
+def _parse_amount(raw: str) -> float:
+    """Parse '329', '329.00', '1,050' or '1.050,50' (a 3-digit group is thousands)."""
+    sep = max(raw.rfind(","), raw.rfind("."))
+    if sep >= 0 and len(raw) - sep - 1 != 3:
+        return float(re.sub(r"[.,]", "", raw[:sep]) + "." + raw[sep + 1:])
+    return float(re.sub(r"[.,]", "", raw))
+
+
+def _room_card_price(text: str, weeks: Optional[int]) -> Tuple[Optional[float], str]:
+    """
+    Cheapest weekly-equivalent price in a room card's text, with its label.
+
+    Monthly prices use the same 4.33 weeks/month approximation as the
+    property page parser; a price without a period is taken as the total
+    for the term and divided by the term's weeks when known.
+    """
+    best: Optional[Tuple[Optional[float], str]] = None
+    for m in _ROOM_PRICE_RE.finditer(text):
+        symbol = m.group(1)
+        try:
+            amount = _parse_amount(m.group(2))
+        except ValueError:
+            continue
+        unit = (m.group(3) or m.group(4) or "").lower()
+        if unit.startswith("w"):
+            weekly, label = amount, f"{symbol}{amount:.0f}/week"
+        elif unit.startswith(("m", "cm")):
+            weekly, label = round(amount / 4.33, 2), f"{symbol}{amount:.0f}/month"
+        elif unit.startswith("n"):
+            weekly, label = amount * 7, f"{symbol}{amount:.0f}/night"
+        else:
+            weekly = round(amount / weeks, 2) if weeks else None
+            label = f"{symbol}{amount:.0f} total"
+        if best is None or (weekly is not None and (best[0] is None or weekly < best[0])):
+            best = (weekly, label)
+    return best or (None, "price N/A")
+
+
+def _parse_room_results(html: str, weeks: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Extract room types, prices and availability from a room search page.
+
+    Cards start at each data-roombaseid element (consecutive elements with
+    the same ID are one card) or, failing that, at each room-result element,
+    and run to the next card. Cards with the same room type are merged:
+    cheapest price, summed availability (None when no card states a count).
+    """
+    starts: List[Tuple[int, Optional[str]]] = []
+    for m in _ROOMBASEID_TAG_RE.finditer(html):
+        base_id = _tag_attr(m.group(0), "data-roombaseid")
+        if starts and starts[-1][1] == base_id:
+            continue
+        starts.append((m.start(), base_id))
+    if not starts:
+        starts = [(m.start(), None) for m in _ROOM_RESULT_TAG_RE.finditer(html)]
+
+    rooms: Dict[str, Dict[str, Any]] = {}
+    for i, (start, base_id) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(html)
+        card = html[start:min(end, start + TERM_ROOM_CARD_MAX_CHARS)]
+        text = " ".join(html_lib.unescape(_NON_TEXT_RE.sub(" ", card)).split())
+        if not text:
+            continue
+
+        name_match = _ROOM_NAME_RE.search(card)
+        name = ""
+        if name_match:
+            raw_name = name_match.group(2) or name_match.group(3) or ""
+            name = " ".join(html_lib.unescape(_NON_TEXT_RE.sub(" ", raw_name)).split())
+        if not name:
+            name = re.split(r"\s*[€£]", text, maxsplit=1)[0][:80].strip() or "Room"
+
+        weekly, label = _room_card_price(text, weeks)
+        available: Optional[int] = None
+        lowered = text.lower()
+        count = None
+        if "availab" in lowered or "left" in lowered or "remaining" in lowered:
+            count = _ROOM_AVAILABLE_RE.search(text)
+        if count:
+            available = int(count.group(1) or count.group(2))
+        elif "sold" in lowered or "booked" in lowered or "no " in lowered:
+            available = 0 if _ROOM_SOLD_OUT_RE.search(text) else None
+
+        room = rooms.get(name)
+        if room is None:
+            rooms[name] = {
+                "room_type": name,
+                "price_label": label,
+                "price_weekly": weekly,
+                "available": available,
+                "room_base_id": base_id,
+            }
+            continue
+        if weekly is not None and (room["price_weekly"] is None or weekly < room["price_weekly"]):
+            room["price_weekly"], room["price_label"] = weekly, label
+        if available is not None:
+            room["available"] = (room["available"] or 0) + available
+    return list(rooms.values())
+
+
+def _parse_term_page(html: str) -> _TermPageFields:
+    """
+    Extract term fields from a room search page without building a DOM.
+
+    Matches the BeautifulSoup reference parser in tests/aparto_reference.py:
+    scans for the term info sentence, the first data-termid tag and room
+    markers, and only strips markup to confirm a currency symbol is visible
+    text when one appears in the raw page at all.
+    """
+    info = _TERM_INFO_RE.search(html)
+
+    start_iso = end_iso = None
+    container = _TERMID_TAG_RE.search(html)
+    if container:
+        start_iso = (_tag_attr(container.group(0), "data-datestart") or "")[:10]
+        end_iso = (_tag_attr(container.group(0), "data-dateend") or "")[:10]
+
+    has_rooms = bool(_ROOM_RESULT_RE.search(html))
+    if not has_rooms and any(marker in html for marker in _CURRENCY_MARKERS):
+        text = html_lib.unescape(_NON_TEXT_RE.sub(" ", html))
+        has_rooms = "€" in text or "£" in text
+    if not has_rooms:
+        has_rooms = bool(_ROOMBASEID_ATTR_RE.search(html))
+
+    return _TermPageFields(
+        term_name=info.group(1) if info else None,
+        start_date=info.group(2) if info else None,
+        end_date=info.group(3) if info else None,
+        start_iso=start_iso,
+        end_iso=end_iso,
+        has_rooms=has_rooms,
+        rooms=_parse_room_results(html, _parse_weeks_from_name(info.group(1)) if info else None),
+    )
+
+
+# _TERM_INFO_RE as a sequence of bounded steps, so it can be matched
+# incrementally
+_TERM_INFO_STEPS = (
+    re.compile(r"You have selected '[^']+' booking term"),
+    re.compile(r"begins on \d{2}/\d{2}/\d{4}"),
+    re.compile(r"ends on \d{2}/\d{2}/\d{4}"),
+)
+
+
+class _TermPageProgress:
+    """
+    Tracks whether a term page read in chunks holds everything
+    _parse_term_page() reads: the heading, the term info, the termID tag,
+    and the whole room listing (an end marker, or
+    TERM_ROOM_LISTING_GAP_CHARS without another card).
+
+    Each feed() scans only the new chunk plus TERM_PAGE_SCAN_OVERLAP_CHARS
+    before it and keeps what it found, so checking a page as it streams is
+    linear in its size.
+    """
+
+    def __init__(self) -> None:
+        self._size = 0
+        self._tail = ""
+        self._heading = False
+        self._termid = False
+        self._info_step = 0
+        self._info_pos = 0
+        self._last_card: Optional[int] = None
+        self._end_pos: Optional[int] = None
+
+    def feed(self, chunk: str) -> bool:
+        """Add the next chunk of page text; returns True once the page is complete."""
+        offset = self._size - len(self._tail)
+        window = self._tail + chunk
+        self._size += len(chunk)
+        self._tail = window[-TERM_PAGE_SCAN_OVERLAP_CHARS:]
+
+        if not self._heading:
+            self._heading = "Choose your room" in window
+        if not self._termid:
+            self._termid = _TERMID_TAG_RE.search(window) is not None
+        while self._info_step < len(_TERM_INFO_STEPS):
+            match = _TERM_INFO_STEPS[self._info_step].search(window, max(0, self._info_pos - offset))
+            if match is None:
+                break
+            self._info_pos = offset + match.end()
+            self._info_step += 1
+
+        for match in _ROOM_MARKER_RE.finditer(window):
+            end = offset + match.end()
+            if self._last_card is None or end > self._last_card:
+                self._last_card = end
+        if self._last_card is not None:
+            end_match = _ROOM_LISTING_END_RE.search(window, max(0, self._last_card - offset))
+            if end_match is not None:
+                self._end_pos = offset + end_match.start()
+        return self.complete
+
+    @property
+    def complete(self) -> bool:
+        if not (self._heading and self._termid and self._info_step == len(_TERM_INFO_STEPS)):
+            return False
+        if self._last_card is None:
+            return False
+        if self._size - self._last_card >= TERM_ROOM_LISTING_GAP_CHARS:
+            return True
+        return self._end_pos is not None and self._end_pos >= self._last_card
+
+
+def _read_term_page(response: requests.Response, budget: int = TERM_PROBE_BYTE_BUDGET) -> str:
+    """
+    Read a streamed term page until it is complete (term fields and the
+    whole room listing) or the budget is spent.
+
+    Pages that never show a room marker are read to the end (or budget),
+    since a currency symbol further down may still mark them as having
+    rooms.
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    parts: List[str] = []
+    progress = _TermPageProgress()
+    size = 0
+    finished = True
+    for chunk in response.iter_content(chunk_size=TERM_PROBE_CHUNK_BYTES):
+        size += len(chunk)
+        text = decoder.decode(chunk)
+        parts.append(text)
+        if size >= budget or progress.feed(text):
+            finished = False
+            break
+    parts.append(decoder.decode(b"", final=True))
+
+    if not finished:
+        try:
+            remaining = int(response.headers.get("Content-Length", "")) - size
+        except ValueError:
+            remaining = -1
+        if 0 <= remaining <= TERM_PROBE_DRAIN_BYTES:
+            for _ in response.iter_content(chunk_size=TERM_PROBE_CHUNK_BYTES):
+                pass
+        else:
+            logger.debug("StarRez: stopped reading %s after %d bytes", response.url, size)
+    response.close()
+    return "".join(parts)
+
+
 # ---------------------------------------------------------------------------
 # StarRez portal session & term probing
 # ---------------------------------------------------------------------------
 
+def _establish_starrez_session(session: requests.Session, country_id: Optional[str]) -> bool:
+    """Navigate EU portal → target country to establish session cookies."""
+    try:
+        r1 = session.get(STARREZ_ENTRY_URL, headers=HEADERS, timeout=20)
+        if r1.status_code != 200:
+            logger.warning("StarRez entry page HTTP %d", r1.status_code)
+            return False
+
+        soup = BeautifulSoup(r1.text, "html.parser")
+        form = soup.find("form")
+        if not form:
+            logger.warning("No form on StarRez entry page")
+            return False
+
+        # Select the target country
+        country_value = country_id or "1"  # Default to Ireland
+        fields: Dict[str, str] = {}
+        for inp in soup.find_all("input"):
+            name = inp.get("name")
+            if name:
+                fields[name] = inp.get("value", "")
+
+        fields["CheckOrderList"] = country_value
+
+        action = form.get("action", "")
+        post_url = f"https://portal.apartostudent.com/StarRezPortalXEU{action}"
+
+        time.sleep(0.3)
+        r2 = session.post(post_url, data=fields, headers=HEADERS, timeout=20, allow_redirects=False)
+        redirect_path = r2.text.strip().strip('"')
+        if not redirect_path or not redirect_path.startswith("/"):
+            logger.warning("Unexpected redirect response: %s", r2.text[:100])
+            return False
+
+        time.sleep(0.3)
+        r3 = session.get(
+            f"https://portal.apartostudent.com{redirect_path}",
+            headers=HEADERS,
+            timeout=20,
+            allow_redirects=True,
+        )
+        if r3.status_code != 200:
+            logger.warning("Residence page HTTP %d", r3.status_code)
+            return False
+
+        logger.info("StarRez session established for country %s: %s", country_value, r3.url)
+        return True
+
+    except requests.RequestException as exc:
+        logger.warning("StarRez session error: %s", exc)
+        return False
+
+
+@dataclass
+class _PooledSession:
+    session: requests.Session
+    established_at: Optional[float] = None
+    misses: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class StarRezSessionPool:
+    """
+    Pre-established StarRez portal sessions shared by probe threads.
+
+    Sessions are handed out round-robin and established lazily (each on
+    its own lock, so workers can set them up in parallel). Cookies of
+    established sessions are saved to the cache and restored on the next
+    run; an expired session is reset and re-established on next use.
+    """
+
+    def __init__(
+        self,
+        country_id: Optional[str],
+        size: int = STARREZ_SESSION_POOL_SIZE,
+        cache: Optional[JsonCache] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        self.country_id = country_id
+        self._cache = cache
+        self._key = f"aparto/starrez-sessions/{country_id or 'default'}"
+        first = session if session is not None else requests.Session()
+        self._slots = [_PooledSession(first)] + [
+            _PooledSession(requests.Session()) for _ in range(max(1, size) - 1)
+        ]
+        self._next = 0
+        self._lock = threading.Lock()
+        self.established = 0
+        self.restored = 0
+        self.expired = 0
+        self._restore()
+
+    def _restore(self) -> None:
+        if self._cache is None:
+            return
+        saved = self._cache.get(self._key, STARREZ_SESSION_MAX_AGE_SECONDS)
+        if not isinstance(saved, list):
+            return
+        for slot, entry in zip(self._slots, saved):
+            try:
+                for cookie in entry["cookies"]:
+                    slot.session.cookies.set(
+                        cookie["name"], cookie["value"],
+                        domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+                        secure=bool(cookie.get("secure")), expires=cookie.get("expires"),
+                    )
+                slot.established_at = float(entry["established_at"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.restored += 1
+        if self.restored:
+            logger.info("StarRez: restored %d saved portal sessions", self.restored)
+
+    def save(self) -> None:
+        """Persist cookies of every established session."""
+        if self._cache is None:
+            return
+        entries = []
+        for slot in self._slots:
+            if slot.established_at is None:
+                continue
+            entries.append({
+                "established_at": slot.established_at,
+                "cookies": [
+                    {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path,
+                     "secure": c.secure, "expires": c.expires}
+                    for c in slot.session.cookies
+                ],
+            })
+        self._cache.set(self._key, entries)
+
+    def _ready(self, slot: _PooledSession) -> bool:
+        with slot.lock:
+            if slot.established_at is not None:
+                return True
+            if not _establish_starrez_session(slot.session, self.country_id):
+                return False
+            slot.established_at = time.time()
+            slot.misses = 0
+            self.established += 1
+        self.save()
+        return True
+
+    def ensure_ready(self) -> bool:
+        """Establish (or restore) the first session; others follow lazily."""
+        return self._ready(self._slots[0])
+
+    def acquire(self) -> requests.Session:
+        """Return the next usable session, establishing it if needed."""
+        with self._lock:
+            order = [(self._next + i) % len(self._slots) for i in range(len(self._slots))]
+            self._next = (self._next + 1) % len(self._slots)
+        for index in order:
+            if self._ready(self._slots[index]):
+                return self._slots[index].session
+        raise _TransientProbeError("no StarRez session available")
+
+    def _slot(self, session: requests.Session) -> Optional[_PooledSession]:
+        return next((slot for slot in self._slots if slot.session is session), None)
+
+    def invalidate(self, session: requests.Session) -> None:
+        """Drop an expired session's cookies so it is re-established."""
+        slot = self._slot(session)
+        if slot is None:
+            return
+        with slot.lock:
+            if slot.established_at is None:
+                return
+            slot.session.cookies.clear()
+            slot.established_at = None
+            slot.misses = 0
+            self.expired += 1
+        logger.info("StarRez: portal session expired; re-establishing")
+        self.save()
+
+    def record(self, session: requests.Session, hit: bool) -> bool:
+        """Track a probe outcome; True once the session is due a canary check."""
+        slot = self._slot(session)
+        if slot is None:
+            return False
+        with slot.lock:
+            slot.misses = 0 if hit else slot.misses + 1
+            if slot.misses >= STARREZ_SESSION_CANARY_MISSES:
+                slot.misses = 0
+                return True
+        return False
+
+
+
 class StarRezScraper:
     """
     Navigate the StarRez Aparto portal and probe termIDs.
@@ -579,67 +1681,24 @@ class StarRezScraper:
         session: requests.Session,
         portal_base: str,
         country_id: Optional[str] = None,
+        term_index: Optional[StarRezTermIndex] = None,
+        pool: Optional[StarRezSessionPool] = None,
     ):
         self.session = session
         self.portal_base = portal_base
         self.country_id = country_id
-        self._session_established = False
-
-    def _establish_session(self) -> bool:
-        """Navigate EU portal → target country to establish session cookies."""
-        if self._session_established:
-            return True
-
-        try:
-            r1 = self.session.get(STARREZ_ENTRY_URL, headers=HEADERS, timeout=20)
-            if r1.status_code != 200:
-                logger.warning("StarRez entry page HTTP %d", r1.status_code)
-                return False
-
-            soup = BeautifulSoup(r1.text, "html.parser")
-            form = soup.find("form")
-            if not form:
-                logger.warning("No form on StarRez entry page")
-                return False
-
-            # Select the target country
-            country_value = self.country_id or "1"  # Default to Ireland
-            fields: Dict[str, str] = {}
-            for inp in soup.find_all("input"):
-                name = inp.get("name")
-                if name:
-                    fields[name] = inp.get("value", "")
-
-            fields["CheckOrderList"] = country_value
-
-            action = form.get("action", "")
-            post_url = f"https://portal.apartostudent.com/StarRezPortalXEU{action}"
+        self.term_index = term_index
+        self.pool = pool or StarRezSessionPool(country_id, session=session)
+        self._controller: Optional[_AimdController] = None
+        self._canary_term_id: Optional[int] = None
 
-            time.sleep(0.3)
-            r2 = self.session.post(post_url, data=fields, headers=HEADERS, timeout=20, allow_redirects=False)
-            redirect_path = r2.text.strip().strip('"')
-            if not redirect_path or not redirect_path.startswith("/"):
-                logger.warning("Unexpected redirect response: %s", r2.text[:100])
-                return False
-
-            time.sleep(0.3)
-            r3 = self.session.get(
-                f"https://portal.apartostudent.com{redirect_path}",
-                headers=HEADERS,
-                timeout=20,
-                allow_redirects=True,
-            )
-            if r3.status_code != 200:
-                logger.warning("Residence page HTTP %d", r3.status_code)
-                return False
+    def probe_concurrency_stats(self) -> Dict[str, Any]:
+        """Adaptive concurrency counters from the most recent scan_term_range()."""
+        return self._controller.stats() if self._controller else {}
 
-            self._session_established = True
-            logger.info("StarRez session established for country %s: %s", country_value, r3.url)
-            return True
-
-        except requests.RequestException as exc:
-            logger.warning("StarRez session error: %s", exc)
-            return False
+    def _establish_session(self) -> bool:
+        """Make sure at least one pooled portal session is usable."""
+        return self.pool.ensure_ready()
 
     def probe_term(self, term_id: int) -> Optional[StarRezTerm]:
         """
@@ -649,38 +1708,48 @@ class StarRezScraper:
         Note: target_property_names and property_aliases are set after
         probing via _annotate_term().
         """
-        url = (
-            f"{self.portal_base}/General/RoomSearch/RoomSearch/RedirectToMainFilter"
-            f"?roomSelectionModelID=361&filterID=1&option=RoomLocationArea&termID={term_id}"
-        )
         try:
-            r = self.session.get(url, headers=HEADERS, timeout=15, allow_redirects=True)
-            if r.status_code != 200:
-                return None
-            if "Choose your room" not in r.text:
-                return None
-        except requests.RequestException:
+            return self._probe(term_id)
+        except _TransientProbeError:
             return None
 
-        soup = BeautifulSoup(r.text, "html.parser")
-
-        # Extract term name + dates from info text
-        term_info_match = re.search(
-            r"You have selected '([^']+)' booking term.*?"
-            r"begins on (\d{2}/\d{2}/\d{4}).*?"
-            r"ends on (\d{2}/\d{2}/\d{4})",
-            r.text,
-            re.DOTALL,
-        )
-
-        # Get ISO dates from data attributes
-        page_container = soup.find(attrs={"data-termid": True})
-        start_iso = page_container.get("data-datestart", "")[:10] if page_container else None
-        end_iso = page_container.get("data-dateend", "")[:10] if page_container else None
+    def _probe(self, term_id: int) -> Optional[StarRezTerm]:
+        """
+        Like probe_term, but raises _TransientProbeError when the outcome
+        says nothing about the termID (network error, throttling, 5xx, or a
+        session still expired after being re-established once), so scans
+        can tell a dead ID from a failed request.
+        """
+        for attempt in (1, 2):
+            session = self.pool.acquire()
+            try:
+                r = session.get(
+                    self._term_url(term_id), headers=HEADERS, timeout=15, allow_redirects=True, stream=True,
+                )
+                if r.status_code in (404, 410):
+                    r.close()
+                    return None
+                if r.status_code != 200:
+                    r.close()
+                    raise _TransientProbeError(f"HTTP {r.status_code}", status=r.status_code)
+                text = _read_term_page(r)
+            except requests.RequestException as exc:
+                raise _TransientProbeError(str(exc)) from exc
+            if "Choose your room" in text:
+                self.pool.record(session, hit=True)
+                self._canary_term_id = term_id
+                break
+            if self._session_expired(session, r.url, text):
+                self.pool.invalidate(session)
+                if attempt == 1:
+                    continue
+                raise _TransientProbeError("StarRez session expired")
+            return None
 
-        term_name = term_info_match.group(1) if term_info_match else f"Term {term_id}"
-        start_date = term_info_match.group(2) if term_info_match else None
-        end_date = term_info_match.group(3) if term_info_match else None
+        page = _parse_term_page(text)
+        term_name = page.term_name or f"Term {term_id}"
+        start_date, end_date = page.start_date, page.end_date
+        start_iso, end_iso = page.start_iso, page.end_iso
 
         property_name = _extract_property_name(term_name)
         weeks = _parse_weeks_from_name(term_name)
@@ -693,14 +1762,6 @@ class StarRezScraper:
             weeks,
         )
 
-        # Check for actual room listings
-        has_rooms = (
-            "room-result" in r.text.lower()
-            or "€" in soup.get_text()
-            or "£" in soup.get_text()
-            or bool(soup.find(attrs={"data-roombaseid": True}))
-        )
-
         return StarRezTerm(
             term_id=term_id,
             term_name=term_name,
@@ -712,19 +1773,102 @@ class StarRezScraper:
             weeks=weeks,
             is_target_city=False,  # Will be set by caller
             is_semester1=is_sem1,
-            has_rooms=has_rooms,
+            has_rooms=page.has_rooms,
             booking_url=r.url,
+            rooms=page.rooms,
         )
 
+    def _term_url(self, term_id: int) -> str:
+        return (
+            f"{self.portal_base}/General/RoomSearch/RoomSearch/RedirectToMainFilter"
+            f"?roomSelectionModelID=361&filterID=1&option=RoomLocationArea&termID={term_id}"
+        )
+
+    def _session_expired(self, session: requests.Session, url: str, text: str) -> bool:
+        """
+        Decide whether a miss came from an expired session, not a dead term.
+
+        Expired sessions bounce back to the country-selection page. A long
+        run of misses on one session is double-checked by re-probing the
+        last known-valid termID (the canary) with that session.
+        """
+        if any(marker in url or marker in text for marker in _SESSION_EXPIRED_MARKERS):
+            return True
+        if not self.pool.record(session, hit=False) or self._canary_term_id is None:
+            return False
+        try:
+            canary = session.get(self._term_url(self._canary_term_id), headers=HEADERS, timeout=15)
+        except requests.RequestException:
+            return False
+        return canary.status_code == 200 and "Choose your room" not in canary.text
+
+    def _discover_frontier(
+        self,
+        anchor: int,
+        deadline: float,
+    ) -> Tuple[int, Dict[int, Optional[StarRezTerm]]]:
+        """
+        Locate the highest live termID above anchor (the last known hit).
+
+        Gallops upward in doubling steps until a probe window comes back
+        empty, then binary-searches between the last live and first empty
+        window. Transient failures count as live so an outage never
+        shrinks the range. Returns (frontier, probe outcomes).
+        """
+        sampled: Dict[int, Optional[StarRezTerm]] = {}
+        ceiling = anchor + TERM_FRONTIER_MAX_SPAN
+
+        def _window_live(executor: concurrent.futures.ThreadPoolExecutor, base: int) -> Optional[int]:
+            ids = list(range(base, min(base + TERM_FRONTIER_PROBE_WINDOW, ceiling + 1)))
+            live: Optional[int] = None
+            for tid, future in zip(ids, [executor.submit(self._probe, tid) for tid in ids]):
+                try:
+                    term = future.result()
+                except _TransientProbeError:
+                    live = tid
+                    continue
+                except Exception:
+                    term = None
+                sampled[tid] = term
+                if term is not None:
+                    live = tid
+            return live
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=TERM_FRONTIER_PROBE_WINDOW) as executor:
+            live_at = anchor
+            dead_at: Optional[int] = None
+            step = TERM_FRONTIER_INITIAL_STEP
+            while live_at + step <= ceiling and time.monotonic() < deadline:
+                hit = _window_live(executor, live_at + step)
+                if hit is None:
+                    dead_at = live_at + step
+                    break
+                live_at = hit
+                step *= 2
+
+            if dead_at is not None:
+                lo, hi = live_at, dead_at
+                while hi - lo > TERM_FRONTIER_PROBE_WINDOW and time.monotonic() < deadline:
+                    mid = (lo + hi) // 2
+                    hit = _window_live(executor, mid)
+                    if hit is None:
+                        hi = mid
+                    else:
+                        lo = max(lo, hit)
+                live_at = lo
+
+        return live_at, sampled
+
     def scan_term_range(
         self,
         target_property_names: Set[str],
         property_aliases: Dict[str, str],
-        start_id: int = DEFAULT_TERM_SCAN_START,
-        end_id: int = DEFAULT_TERM_SCAN_END,
+        start_id: Optional[int] = None,
+        end_id: Optional[int] = None,
         target_city_only: bool = True,
         delay: float = 0.05,
         total_timeout: float = 90.0,
+        matcher: Optional[_PropertyMatcher] = None,
     ) -> List[StarRezTerm]:
         """
         Scan a range of termIDs and return valid terms for the target city.
@@ -733,53 +1877,97 @@ class StarRezScraper:
         1. Start from start_id and scan upward
         2. Stop after max_consecutive_misses misses past the last hit
         3. Enforce a total timeout to prevent long scans
+
+        With a term index attached, step 1 only covers known-valid IDs,
+        dead IDs due for a re-check and unprobed gaps, then continues
+        upward from the index's high-water mark; step 2 applies to that
+        upward (frontier) segment only.
+
+        If end_id is not given, DEFAULT_TERM_SCAN_END is a soft bound: when
+        the scan is still finding terms near it, the range is extended to
+        the frontier located by _discover_frontier().
+
+        Pass a prebuilt matcher to avoid rebuilding the name index from
+        target_property_names/property_aliases on every call.
         """
         if not self._establish_session():
             logger.error("Failed to establish StarRez session")
             return []
 
+        if matcher is None:
+            matcher = _PropertyMatcher(target_property_names, property_aliases)
+        extend_end = end_id is None
+        start_id = DEFAULT_TERM_SCAN_START if start_id is None else start_id
+        end_id = DEFAULT_TERM_SCAN_END if end_id is None else end_id
+        high_water_mark = self.term_index.high_water_mark if self.term_index else None
+        if extend_end and high_water_mark is not None:
+            end_id = max(end_id, high_water_mark + DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES)
+
+        plan = self.term_index.plan(start_id, end_id) if self.term_index else None
+        if plan is None:
+            term_ids = list(range(start_id, end_id + 1))
+            frontier_start = start_id
+        else:
+            term_ids, frontier_start = plan
+            logger.info(
+                "StarRez index plan: %d termIDs to re-check below %d, then probing upward",
+                sum(1 for tid in term_ids if tid < frontier_start), frontier_start,
+            )
+
         terms: List[StarRezTerm] = []
+        outcomes: Dict[int, Optional[StarRezTerm]] = {}
         consecutive_misses = 0
-        last_hit_id = start_id
+        last_hit_id = frontier_start - 1 if plan else start_id
         processed = 0
         timed_out = False
         start_time = time.monotonic()
         deadline = start_time + total_timeout
 
-        max_workers = 8
-        max_in_flight = max_workers * 4
-        next_id = start_id
-        next_expected = start_id
+        controller = _AimdController(pace=delay)
+        self._controller = controller
+        next_pos = 0
+        next_expected_pos = 0
         pending: Dict[concurrent.futures.Future, int] = {}
         ready: Dict[int, Optional[StarRezTerm]] = {}
+        failed: Set[int] = set()
         stop_early = False
+        frontier_anchor: Optional[int] = None
+
+        def _probe_with_feedback(tid: int) -> Optional[StarRezTerm]:
+            started = time.monotonic()
+            try:
+                term = self._probe(tid)
+            except _TransientProbeError as exc:
+                controller.record(time.monotonic() - started, exc.status, failed=True)
+                raise
+            controller.record(time.monotonic() - started)
+            return term
 
         def _submit_next(executor: concurrent.futures.ThreadPoolExecutor) -> bool:
-            nonlocal next_id
-            if next_id > end_id:
+            nonlocal next_pos
+            if next_pos >= len(term_ids):
                 return False
             if time.monotonic() >= deadline:
                 return False
-            if delay > 0:
-                time.sleep(delay)
-            future = executor.submit(self.probe_term, next_id)
-            pending[future] = next_id
-            next_id += 1
+            if controller.pace > 0:
+                time.sleep(controller.pace)
+            tid = term_ids[next_pos]
+            future = executor.submit(_probe_with_feedback, tid)
+            pending[future] = tid
+            next_pos += 1
             return True
 
         def _process_term(tid: int, term: Optional[StarRezTerm]) -> None:
             nonlocal consecutive_misses, last_hit_id, stop_early, processed
             processed += 1
+            if tid not in failed:
+                outcomes[tid] = term
             if term:
                 consecutive_misses = 0
-                last_hit_id = tid
+                last_hit_id = max(last_hit_id, tid)
 
                 # Check if this term belongs to the target city
-                is_target = _is_target_city_term(
-                    term.term_name,
-                    target_property_names,
-                    property_aliases,
-                )
+                is_target = matcher.is_target_city_term(term.term_name)
                 term.is_target_city = is_target
 
                 if target_city_only and not is_target:
@@ -794,7 +1982,7 @@ class StarRezScraper:
                         tid, term.term_name, term.start_date, term.end_date,
                         term.is_target_city, term.is_semester1,
                     )
-            else:
+            elif tid >= frontier_start:
                 consecutive_misses += 1
                 if (consecutive_misses > DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES
                         and tid > last_hit_id + DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES):
@@ -804,9 +1992,9 @@ class StarRezScraper:
                     )
                     stop_early = True
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=controller.maximum) as executor:
             while True:
-                while len(pending) < max_in_flight and next_id <= end_id:
+                while len(pending) < controller.limit and next_pos < len(term_ids):
                     if time.monotonic() >= deadline:
                         timed_out = True
                         break
@@ -817,15 +2005,30 @@ class StarRezScraper:
                     timed_out = True
                     break
 
-                if next_expected in ready:
-                    term = ready.pop(next_expected)
-                    _process_term(next_expected, term)
-                    next_expected += 1
+                if next_expected_pos < len(term_ids) and term_ids[next_expected_pos] in ready:
+                    tid = term_ids[next_expected_pos]
+                    _process_term(tid, ready.pop(tid))
+                    next_expected_pos += 1
                     if stop_early:
                         break
                     continue
 
                 if not pending:
+                    if (extend_end and next_expected_pos >= len(term_ids)
+                            and last_hit_id != frontier_anchor
+                            and last_hit_id + DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES >= end_id):
+                        frontier_anchor = last_hit_id
+                        frontier, sampled = self._discover_frontier(last_hit_id, deadline)
+                        outcomes.update(sampled)
+                        new_end = frontier + DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES
+                        if new_end > end_id:
+                            logger.info(
+                                "StarRez frontier near termID %d; extending scan %d → %d",
+                                frontier, end_id, new_end,
+                            )
+                            term_ids.extend(range(end_id + 1, new_end + 1))
+                            end_id = new_end
+                            continue
                     break
 
                 remaining = deadline - time.monotonic()
@@ -846,6 +2049,9 @@ class StarRezScraper:
                     tid = pending.pop(future)
                     try:
                         ready[tid] = future.result()
+                    except _TransientProbeError:
+                        failed.add(tid)
+                        ready[tid] = None
                     except Exception:
                         ready[tid] = None
 
@@ -856,13 +2062,24 @@ class StarRezScraper:
                 for future in pending:
                     future.cancel()
 
+        if self.term_index is not None:
+            self.term_index.record(outcomes, full_sweep=plan is None and not timed_out)
+            self.term_index.save()
+
         scanned = processed
+        stats = controller.stats()
+        logger.info(
+            "StarRez probe concurrency: final %d, peak %d, %d increases, %d decreases, "
+            "%d/%d congested responses, mean latency %.2fs",
+            stats["limit"], stats["peak"], stats["increases"], stats["decreases"],
+            stats["congested"], stats["responses"], stats["meanLatency"],
+        )
         if timed_out:
             logger.warning(
                 "StarRez scan timed out after %.1fs: %d/%d termIDs checked, %d target city terms found",
                 total_timeout,
                 scanned,
-                end_id - start_id + 1,
+                len(term_ids),
                 len(terms),
             )
             return terms
@@ -870,7 +2087,7 @@ class StarRezScraper:
         logger.info(
             "StarRez scan complete: %d/%d termIDs checked, %d target city terms found",
             scanned,
-            end_id - start_id + 1,
+            len(term_ids),
             len(terms),
         )
         return terms
@@ -892,8 +2109,18 @@ class ApartoProvider(BaseProvider):
         self,
         city: str = "Dublin",
         country: Optional[str] = None,
+        cache: Optional[JsonCache] = None,
+        term_id_start: Optional[int] = None,
+        term_id_end: Optional[int] = None,
     ):
         self._session = requests.Session()
+        self._cache = cache
+        self._term_id_start = term_id_start
+        self._term_id_end = term_id_end
+        self._term_index: Optional[StarRezTermIndex] = None
+        self._scraper: Optional[StarRezScraper] = None
+        self._last_terms: Optional[List[StarRezTerm]] = None
+        self._last_terms_at = 0.0
         self._city = city.strip().title()
         self._country = country or self._resolve_country(self._city)
         self._city_slug = self._resolve_city_slug(self._city)
@@ -901,6 +2128,10 @@ class ApartoProvider(BaseProvider):
         self._discovered_properties: Optional[List[Dict[str, str]]] = None
         self._property_names: Optional[Set[str]] = None
         self._property_aliases: Optional[Dict[str, str]] = None
+        self._matcher: Optional[_PropertyMatcher] = None
+        self._properties_stored_at = 0.0
+        self._properties_refresh: Optional[threading.Thread] = None
+        self._refreshed_properties: Optional[Tuple[List[Dict[str, str]], Dict[str, str], float]] = None
 
     @staticmethod
     def _resolve_country(city: str) -> str:
@@ -929,24 +2160,171 @@ class ApartoProvider(BaseProvider):
                 return v
         return city.lower().replace(" ", "-")
 
+    @property
+    def _properties_cache_key(self) -> str:
+        return f"aparto/properties/{self._city_slug}"
+
     def _ensure_properties_discovered(self) -> None:
-        """Lazy-discover properties for the target city."""
+        """
+        Lazy-discover properties for the target city.
+
+        Served from the disk cache when possible; stale lists are refreshed
+        in the background (see PROPERTY_DISCOVERY_FRESH_SECONDS).
+        """
+        refreshed, self._refreshed_properties = self._refreshed_properties, None
+        if refreshed is not None:
+            self._set_properties(*refreshed)
         if self._discovered_properties is not None:
+            self._refresh_properties_if_stale()
             return
 
-        self._discovered_properties = _discover_city_properties(
-            self._session, self._city_slug,
-        )
-        self._property_names = {p["name"] for p in self._discovered_properties}
-        self._property_aliases = _build_property_aliases(self._discovered_properties)
+        cached = None
+        if self._cache is not None:
+            entry = self._cache.get_entry(self._properties_cache_key)
+            value = entry.value if entry is not None else None
+            if (
+                isinstance(value, dict)
+                and value.get("city_slug") == self._city_slug
+                and isinstance(value.get("properties"), list)
+                and value["properties"]
+            ):
+                cached = (value["properties"], value.get("aliases") or {}, entry.stored_at)
+
+        if cached is not None and time.time() - cached[2] <= PROPERTY_DISCOVERY_MAX_AGE_SECONDS:
+            self._set_properties(*cached, source="cache")
+            self._refresh_properties_if_stale()
+            return
+
+        properties = _discover_city_properties(self._session, self._city_slug)
+        if properties:
+            self._set_properties(*self._store_properties(properties))
+        elif cached is not None:
+            logger.warning("Aparto: could not discover %s properties; using expired cache", self._city)
+            self._set_properties(*cached, source="cache")
+        else:
+            # Nothing to fall back on: retry in the background on next use.
+            self._set_properties(properties, {}, 0.0)
+
+    def _set_properties(
+        self,
+        properties: List[Dict[str, str]],
+        aliases: Dict[str, str],
+        stored_at: float,
+        source: str = "site",
+    ) -> None:
+        self._discovered_properties = properties
+        self._property_names = {p["name"] for p in properties}
+        self._property_aliases = aliases
+        self._matcher = _PropertyMatcher(self._property_names, aliases, properties)
+        self._properties_stored_at = stored_at
 
         logger.info(
-            "Aparto: discovered %d properties for %s: %s",
-            len(self._discovered_properties),
+            "Aparto: discovered %d properties for %s (%s): %s",
+            len(properties),
             self._city,
-            [p["name"] for p in self._discovered_properties],
+            source,
+            [p["name"] for p in properties],
         )
 
+    def _store_properties(
+        self, properties: List[Dict[str, str]],
+    ) -> Tuple[List[Dict[str, str]], Dict[str, str], float]:
+        aliases = _build_property_aliases(properties)
+        if self._cache is not None:
+            self._cache.set(self._properties_cache_key, {
+                "city_slug": self._city_slug,
+                "properties": properties,
+                "aliases": aliases,
+            })
+        return properties, aliases, time.time()
+
+    def _refresh_properties_if_stale(self) -> None:
+        """Re-scrape the city page on a background thread once the list is stale."""
+        if time.time() - self._properties_stored_at <= PROPERTY_DISCOVERY_FRESH_SECONDS:
+            return
+        if self._properties_refresh is not None and self._properties_refresh.is_alive():
+            return
+
+        def _refresh() -> None:
+            try:
+                properties = _discover_city_properties(requests.Session(), self._city_slug)
+            except Exception as exc:
+                logger.debug("Aparto: background discovery for %s failed: %s", self._city, exc)
+                return
+            if properties:
+                self._refreshed_properties = self._store_properties(properties)
+
+        self._properties_refresh = threading.Thread(
+            target=_refresh, name=f"aparto-discover-{self._city_slug}", daemon=True,
+        )
+        self._properties_refresh.start()
+
+    def wait_for_background(self, timeout: float) -> None:
+        """Let a running property refresh store its result before exit."""
+        refresh = self._properties_refresh
+        if refresh is not None and refresh.is_alive():
+            refresh.join(timeout)
+
+    def _make_scraper(self, portal_base: str) -> StarRezScraper:
+        """Return the provider's StarRez scraper, reusing its portal session."""
+        if self._scraper is None:
+            if self._cache is not None and self._term_index is None:
+                self._term_index = StarRezTermIndex(self._cache, portal_base)
+            country_id = self._portal_config.get("country_id")
+            self._scraper = StarRezScraper(
+                self._session,
+                portal_base=portal_base,
+                country_id=country_id,
+                term_index=self._term_index,
+                pool=StarRezSessionPool(country_id, cache=self._cache, session=self._session),
+            )
+        return self._scraper
+
+    def _sweep_terms(self, scraper: StarRezScraper) -> List[StarRezTerm]:
+        """Run a full termID sweep and remember the result for probe_booking()."""
+        terms = scraper.scan_term_range(
+            target_property_names=self._property_names,
+            property_aliases=self._property_aliases,
+            start_id=self._term_id_start,
+            end_id=self._term_id_end,
+            target_city_only=True,
+            matcher=self._matcher,
+        )
+        self._remember_terms(terms)
+        return terms
+
+    def _remember_terms(self, terms: List[StarRezTerm]) -> None:
+        self._last_terms = terms
+        self._last_terms_at = time.monotonic()
+
+    def _recheck_term(self, scraper: StarRezScraper, term_id: Any) -> List[StarRezTerm]:
+        """
+        Refresh one termID within the last sweep's snapshot.
+
+        A dead termID is dropped from the snapshot; a transient failure
+        keeps the last known state.
+        """
+        terms = list(self._last_terms or [])
+        if not term_id or not scraper._establish_session():
+            return terms
+        term_id = int(term_id)
+        try:
+            fresh = scraper._probe(term_id)
+        except _TransientProbeError:
+            return terms
+        index = next((i for i, t in enumerate(terms) if t.term_id == term_id), None)
+        if fresh is None:
+            if index is not None:
+                terms.pop(index)
+        else:
+            fresh.is_target_city = True
+            if index is None:
+                terms.append(fresh)
+            else:
+                terms[index] = fresh
+        self._last_terms = terms
+        return terms
+
     @property
     def name(self) -> str:
         return "aparto"
@@ -970,21 +2348,14 @@ class ApartoProvider(BaseProvider):
     def _scrape_property(self, prop: Dict[str, str]) -> List[Dict[str, Any]]:
         """Scrape a single property page for room types + prices."""
         url = prop.get("url") or f"{MAIN_BASE}/locations/{self._city_slug}/{prop['slug']}"
-        html = _fetch(self._session, url)
-        if not html:
-            logger.warning("Aparto: could not fetch %s", url)
-            return []
-
-        rooms: List[Dict[str, Any]] = []
-
-        next_data = _extract_next_data(html)
-        if next_data:
-            next_rooms = _extract_rooms_from_next_data(next_data)
-            if next_rooms:
-                rooms = next_rooms
-
-        if not rooms:
-            rooms = _extract_prices_from_html(html, prop["name"])
+        if self._cache is not None:
+            rooms = self._scrape_property_cached(url, prop)
+        else:
+            html = _fetch(self._session, url)
+            if not html:
+                logger.warning("Aparto: could not fetch %s", url)
+                return []
+            rooms = _parse_property_page(html, prop["name"])
 
         for room in rooms:
             room.update({
@@ -996,6 +2367,94 @@ class ApartoProvider(BaseProvider):
 
         return rooms
 
+    def _scrape_property_cached(self, url: str, prop: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Fetch a property page conditionally and parse it only if it changed.
+
+        Falls back to the last parsed rooms when the fetch fails.
+        """
+        key = f"aparto/property-page/{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
+        entry = self._cache.get_entry(key)
+        cached = None
+        if (
+            entry is not None
+            and entry.age <= PROPERTY_PAGE_CACHE_TTL_SECONDS
+            and isinstance(entry.value, dict)
+            and entry.value.get("url") == url
+            and entry.value.get("parser_version") == PROPERTY_PAGE_PARSER_VERSION
+        ):
+            cached = entry.value
+
+        validators: Dict[str, str] = {}
+        if cached and cached.get("etag"):
+            validators["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            validators["If-Modified-Since"] = cached["last_modified"]
+
+        resp = _fetch_response(self._session, url, extra_headers=validators)
+        if resp is None:
+            if cached:
+                logger.warning("Aparto: could not fetch %s; using cached rooms", url)
+                return cached["rooms"]
+            logger.warning("Aparto: could not fetch %s", url)
+            return []
+        if resp.status_code == 304 and cached:
+            logger.debug("Aparto: %s not modified", url)
+            return cached["rooms"]
+        if resp.status_code != 200:
+            return []
+
+        content_hash = hashlib.sha1(resp.content).hexdigest()
+        value = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "content_hash": content_hash,
+            "parser_version": PROPERTY_PAGE_PARSER_VERSION,
+        }
+        if cached and cached.get("content_hash") == content_hash:
+            logger.debug("Aparto: %s unchanged (content hash)", url)
+            rooms = cached["rooms"]
+            value["rooms"] = rooms
+            if value != cached:
+                # Only the validators moved: keep the parse time so the TTL
+                # still forces a re-parse
+                self._cache.set(key, value, stored_at=entry.stored_at)
+        else:
+            rooms = _parse_property_page(resp.text, prop["name"])
+            value["rooms"] = rooms
+            self._cache.set(key, value)
+        return [dict(room) for room in rooms]
+
+    def _fetch_property_rooms(
+        self,
+        properties: List[Dict[str, str]],
+        limiter: Optional[_RateLimiter] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Scrape the given property pages concurrently under the rate limit."""
+        if not properties:
+            return {}
+        limiter = limiter or _RateLimiter(PROPERTY_FETCH_MIN_INTERVAL)
+
+        def _scrape(prop: Dict[str, str]) -> List[Dict[str, Any]]:
+            limiter.wait()
+            return self._scrape_property(prop)
+
+        property_rooms: Dict[str, List[Dict[str, Any]]] = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=PROPERTY_FETCH_WORKERS, thread_name_prefix="aparto-enrich",
+        ) as executor:
+            futures = {prop["slug"]: executor.submit(_scrape, prop) for prop in properties}
+            for slug, future in futures.items():
+                try:
+                    rooms = future.result()
+                except Exception as exc:
+                    logger.warning("Aparto: enrichment failed for %s: %s", slug, exc)
+                    continue
+                if rooms:
+                    property_rooms[slug] = rooms
+        return property_rooms
+
     def scan(
         self,
         academic_year: str = "2026-27",
@@ -1004,13 +2463,15 @@ class ApartoProvider(BaseProvider):
         academic_config: Optional[AcademicYearConfig] = None,
     ) -> List[RoomOption]:
         """
-        Full scan: probe StarRez termIDs + scrape main site for prices.
+        Full scan: probe StarRez termIDs, pricing rooms from the term pages.
 
         Strategy:
         1. Discover properties for the target city
         2. Scan termIDs to find booking terms matching those properties
+           (each probe also parses the term's room listing and prices)
         3. Filter for Semester 1 terms (or return all if filter is off)
-        4. Enrich with pricing data from the main site
+        4. For properties whose terms listed no rooms, fall back to the
+           main site's approximate prices
         """
         self._ensure_properties_discovered()
         results: List[RoomOption] = []
@@ -1023,17 +2484,20 @@ class ApartoProvider(BaseProvider):
             )
             return results
 
-        # Step 1: Probe StarRez termIDs
-        scraper = StarRezScraper(
-            self._session,
-            portal_base=portal_base,
-            country_id=self._portal_config.get("country_id"),
-        )
-        all_terms = scraper.scan_term_range(
-            target_property_names=self._property_names,
-            property_aliases=self._property_aliases,
-            target_city_only=True,
-        )
+        scraper = self._make_scraper(portal_base)
+        all_terms = self._sweep_terms(scraper)
+        return self._results_from_terms(all_terms, academic_year, semester, apply_semester_filter)
+
+    def _results_from_terms(
+        self,
+        all_terms: List[StarRezTerm],
+        academic_year: str,
+        semester: int,
+        apply_semester_filter: bool,
+        limiter: Optional[_RateLimiter] = None,
+    ) -> List[RoomOption]:
+        """Filter this city's swept terms and build priced RoomOptions."""
+        results: List[RoomOption] = []
         logger.info("Aparto: found %d terms for %s", len(all_terms), self._city)
 
         # Filter by academic year (26/27)
@@ -1067,39 +2531,27 @@ class ApartoProvider(BaseProvider):
         if not target_terms:
             return results
 
-        # Step 2: Get pricing data from main site
-        property_rooms: Dict[str, List[Dict]] = {}
-        prop_lookup = {_normalise_name(p["name"]): p for p in self._discovered_properties}
-        for prop in self._discovered_properties:
-            time.sleep(0.5)
-            rooms = self._scrape_property(prop)
-            if rooms:
-                property_rooms[prop["slug"]] = rooms
+        # Step 2: Main-site prices, only for properties whose term pages
+        # listed no rooms
+        fallback: Dict[str, Dict[str, str]] = {}
+        for term in target_terms:
+            prop_info = self._matcher.match_property(term.property_name)
+            if not term.rooms and prop_info:
+                fallback.setdefault(prop_info["slug"], prop_info)
+        property_rooms = self._fetch_property_rooms(list(fallback.values()), limiter)
 
         # Step 3: Build RoomOptions
         for term in target_terms:
-            prop_info = None
-            term_prop_norm = _normalise_name(term.property_name)
-
-            # Try direct match
-            for norm_name, info in prop_lookup.items():
-                if norm_name in term_prop_norm or term_prop_norm in norm_name:
-                    prop_info = info
-                    break
-
-            # Try alias match
-            if not prop_info and self._property_aliases:
-                canonical = self._property_aliases.get(term_prop_norm)
-                if canonical:
-                    for norm_name, info in prop_lookup.items():
-                        if _normalise_name(canonical) == norm_name:
-                            prop_info = info
-                            break
+            prop_info = self._matcher.match_property(term.property_name)
 
             slug = prop_info["slug"] if prop_info else term.property_name.lower().replace(" ", "-")
             location = prop_info.get("location", "") if prop_info else ""
 
-            rooms = property_rooms.get(slug, [])
+            price_source = "starrez"
+            rooms = term.rooms
+            if not rooms:
+                price_source = "site"
+                rooms = property_rooms.get(slug, [])
             if not rooms:
                 rooms = [{"room_type": "Room (type TBC)", "price_weekly": None, "price_label": "price TBC"}]
 
@@ -1111,7 +2563,7 @@ class ApartoProvider(BaseProvider):
                     room_type=room.get("room_type", "Room"),
                     price_weekly=room.get("price_weekly"),
                     price_label=room.get("price_label", ""),
-                    available=True,
+                    available=room.get("available") != 0,
                     booking_url=term.booking_url,
                     start_date=term.start_iso,
                     end_date=term.end_iso,
@@ -1126,6 +2578,8 @@ class ApartoProvider(BaseProvider):
                         "end_date_dd": term.end_date,
                         "city": self._city,
                         "country": self._country,
+                        "price_source": price_source,
+                        "rooms_available": room.get("available"),
                     },
                 ))
 
@@ -1142,18 +2596,17 @@ class ApartoProvider(BaseProvider):
                 "error": f"No StarRez portal for {self._city} ({self._country})",
             }
 
-        scraper = StarRezScraper(
-            self._session,
-            portal_base=portal_base,
-            country_id=self._portal_config.get("country_id"),
-        )
-        all_terms = scraper.scan_term_range(
-            target_property_names=self._property_names,
-            property_aliases=self._property_aliases,
-            target_city_only=True,
+        scraper = self._make_scraper(portal_base)
+        term_id = option.raw.get("term_id")
+        snapshot_fresh = (
+            self._last_terms is not None
+            and time.monotonic() - self._last_terms_at <= TERM_SNAPSHOT_MAX_AGE_SECONDS
         )
+        if snapshot_fresh:
+            all_terms = self._recheck_term(scraper, term_id)
+        else:
+            all_terms = self._sweep_terms(scraper)
 
-        term_id = option.raw.get("term_id")
         matching_term = None
         if term_id:
             matching_term = next((t for t in all_terms if t.term_id == term_id), None)
@@ -1196,3 +2649,133 @@ class ApartoProvider(BaseProvider):
             },
             "raw": option.raw,
         }
+
+
+class ApartoMultiCityProvider(BaseProvider):
+    """
+    Aparto across several cities with one StarRez sweep per regional portal.
+
+    IE/ES/IT share a single term pool, so one sweep matched against every
+    city's properties replaces one identical sweep per city. Each term is
+    assigned to the first configured city whose properties match it.
+    Distinct portals (IE and UK) are swept concurrently.
+    """
+
+    def __init__(
+        self,
+        cities: List[str],
+        cache: Optional[JsonCache] = None,
+        term_id_start: Optional[int] = None,
+        term_id_end: Optional[int] = None,
+    ):
+        self._providers: List[ApartoProvider] = []
+        seen: Set[str] = set()
+        for city in cities:
+            provider = ApartoProvider(
+                city=city, cache=cache, term_id_start=term_id_start, term_id_end=term_id_end,
+            )
+            if provider._city not in seen:
+                seen.add(provider._city)
+                self._providers.append(provider)
+
+    @property
+    def name(self) -> str:
+        return "aparto"
+
+    def wait_for_background(self, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        for provider in self._providers:
+            provider.wait_for_background(max(0.0, deadline - time.monotonic()))
+
+    def discover_properties(self) -> List[Dict[str, Any]]:
+        props: List[Dict[str, Any]] = []
+        for provider in self._providers:
+            props.extend(provider.discover_properties())
+        return props
+
+    def _portal_groups(self) -> Dict[str, List[ApartoProvider]]:
+        groups: Dict[str, List[ApartoProvider]] = {}
+        for provider in self._providers:
+            provider._ensure_properties_discovered()
+            portal_base = provider._portal_config.get("portal_base")
+            if not portal_base:
+                logger.warning(
+                    "Aparto: no StarRez portal for %s (%s). Scan not available.",
+                    provider._city, provider._country,
+                )
+                continue
+            groups.setdefault(portal_base, []).append(provider)
+        return groups
+
+    def _sweep_portal(self, portal_base: str, group: List[ApartoProvider]) -> Dict[str, List[StarRezTerm]]:
+        """Sweep one portal and split its terms between the group's cities."""
+        names: Set[str] = set()
+        aliases: Dict[str, str] = {}
+        for provider in group:
+            names |= provider._property_names or set()
+            aliases.update(provider._property_aliases or {})
+
+        # The first city's scraper carries the portal session and term index
+        lead = group[0]
+        terms = lead._make_scraper(portal_base).scan_term_range(
+            target_property_names=names,
+            property_aliases=aliases,
+            start_id=lead._term_id_start,
+            end_id=lead._term_id_end,
+            target_city_only=True,
+            matcher=_PropertyMatcher(names, aliases),
+        )
+
+        by_city: Dict[str, List[StarRezTerm]] = {provider._city: [] for provider in group}
+        for term in terms:
+            owner = next((p for p in group if p._matcher.is_target_city_term(term.term_name)), None)
+            if owner is not None:
+                by_city[owner._city].append(term)
+        for provider in group:
+            provider._remember_terms(by_city[provider._city])
+        logger.info(
+            "Aparto: one sweep of %s served %d cities (%s)",
+            urlsplit(portal_base).netloc, len(group),
+            ", ".join(f"{city}: {len(t)}" for city, t in by_city.items()),
+        )
+        return by_city
+
+    def scan(
+        self,
+        academic_year: str = "2026-27",
+        semester: int = 1,
+        apply_semester_filter: bool = True,
+        academic_config: Optional[AcademicYearConfig] = None,
+    ) -> List[RoomOption]:
+        groups = self._portal_groups()
+        if not groups:
+            return []
+
+        terms_by_city: Dict[str, List[StarRezTerm]] = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(groups), thread_name_prefix="aparto-portal",
+        ) as pool:
+            sweeps = [pool.submit(self._sweep_portal, base, group) for base, group in groups.items()]
+            for future in sweeps:
+                try:
+                    terms_by_city.update(future.result())
+                except Exception as exc:
+                    logger.warning("Aparto: portal sweep failed: %s", exc)
+
+        limiter = _RateLimiter(PROPERTY_FETCH_MIN_INTERVAL)
+        results: List[RoomOption] = []
+        for group in groups.values():
+            for provider in group:
+                if provider._city not in terms_by_city:
+                    continue
+                results.extend(provider._results_from_terms(
+                    terms_by_city[provider._city], academic_year, semester,
+                    apply_semester_filter, limiter,
+                ))
+        return results
+
+    def probe_booking(self, option: RoomOption) -> Dict[str, Any]:
+        """Route the probe to the option's city provider."""
+        city = str(option.raw.get("city") or "")
+        provider = next((p for p in self._providers if p._city == city), self._providers[0])
+        return provider.probe_booking(option)
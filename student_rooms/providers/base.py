@@ -7,14 +7,25 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from student_rooms.models.config import AcademicYearConfig
 
 
-@dataclass
+# Fields that make up RoomOption.dedup_key(); assigning any of them
+# invalidates the cached key.
+_DEDUP_KEY_FIELDS = frozenset({"provider", "property_slug", "room_type", "academic_year", "option_name"})
+
+
+@dataclass(slots=True)
 class RoomOption:
-    """Normalised room option returned by every provider."""
+    """
+    Normalised room option returned by every provider.
+
+    Slotted to keep large result sets compact. `raw` may be any read-only
+    mapping, so providers can expose views over shared payloads instead of
+    copying them into a dict per option.
+    """
     provider: str                       # "yugo" | "aparto"
     property_name: str
     property_slug: str                  # URL slug / short identifier
@@ -28,17 +39,27 @@ class RoomOption:
     academic_year: Optional[str]        # e.g. "2026-27"
     option_name: Optional[str]          # Tenancy / option label
     location: Optional[str] = None      # Human-readable location hint
-    raw: Dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=dict)
+    _dedup_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _DEDUP_KEY_FIELDS:
+            object.__setattr__(self, "_dedup_key", None)
 
     def dedup_key(self) -> str:
-        """Stable key used for deduplication across watch cycles."""
-        return "|".join([
-            self.provider,
-            self.property_slug,
-            self.room_type.lower().strip(),
-            self.academic_year or "",
-            self.option_name or "",
-        ])
+        """Stable key used for deduplication across watch cycles (computed once)."""
+        key = self._dedup_key
+        if key is None:
+            key = "|".join([
+                self.provider,
+                self.property_slug,
+                self.room_type.lower().strip(),
+                self.academic_year or "",
+                self.option_name or "",
+            ])
+            object.__setattr__(self, "_dedup_key", key)
+        return key
 
     def alert_lines(self) -> List[str]:
         """Human-readable summary lines for alerts."""
@@ -94,3 +115,10 @@ class BaseProvider(ABC):
         Providers that don't implement this raise NotImplementedError.
         """
         raise NotImplementedError(f"Provider '{self.name}' does not implement probe_booking.")
+
+    def wait_for_background(self, timeout: float) -> None:
+        """
+        Give background work (e.g. cache refreshes) up to `timeout` seconds
+        to finish before the process exits. Providers without any do nothing.
+        """
+        return None
@@ -4,12 +4,21 @@ Wraps the original YugoClient API and adapts output to RoomOption.
 """
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
+import json
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from student_rooms.cache import JsonCache
 from student_rooms.matching import match_semester1
 from student_rooms.models.config import AcademicYearConfig
 from student_rooms.providers.base import BaseProvider, RoomOption
@@ -18,6 +27,25 @@ logger = logging.getLogger(__name__)
 
 API_PREFIX = "https://yugo.com/en-gb/"
 
+# Scan fan-out: worker threads for residence/room requests, and the maximum
+# number of requests allowed in flight against a single host at once.
+DEFAULT_SCAN_WORKERS = 8
+DEFAULT_MAX_IN_FLIGHT_PER_HOST = 8
+
+# Persistent cache TTLs. Countries and cities are effectively static;
+# residences change a few times per season.
+GEOGRAPHY_CACHE_TTL_SECONDS = 7 * 24 * 3600
+RESIDENCES_CACHE_TTL_SECONDS = 6 * 3600
+RESIDENCE_LAYOUT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Upper bound on how long memoised tenancy options are reused for a room
+# whose payload has not changed, so option-level changes are still picked up.
+# In watch mode the bound is stretched to cover one polling gap (see
+# YugoProvider._tenancy_memo_max_age); otherwise an hourly poll would never
+# find an entry young enough to reuse.
+TENANCY_MEMO_MAX_AGE_SECONDS = 30 * 60
+TENANCY_MEMO_POLL_FACTOR = 1.5
+
 # ---------------------------------------------------------------------------
 # Low-level API client
 # ---------------------------------------------------------------------------
@@ -30,12 +58,33 @@ class YugoClient:
         timeout: int = 30,
         retries: int = 3,
         retry_backoff_seconds: float = 1.0,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT_PER_HOST,
     ):
-        self.session = session or requests.Session()
+        self.max_in_flight = max(1, max_in_flight)
+        if session is None:
+            session = requests.Session()
+            # Size the connection pool to the in-flight limit so concurrent
+            # scans reuse connections instead of discarding them.
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_in_flight)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         self.base_url = base_url
         self.timeout = timeout
         self.retries = max(1, retries)
         self.retry_backoff_seconds = max(0.1, retry_backoff_seconds)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore bounding in-flight requests to the URL's host."""
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_in_flight)
+                self._host_slots[host] = slot
+            return slot
 
     def _request_json(
         self,
@@ -50,9 +99,10 @@ class YugoClient:
 
         for attempt in range(1, self.retries + 1):
             try:
-                response = self.session.request(
-                    method.upper(), url, params=params, data=data, timeout=self.timeout
-                )
+                with self._host_slot(url):
+                    response = self.session.request(
+                        method.upper(), url, params=params, data=data, timeout=self.timeout
+                    )
                 # Client errors (4xx) are not retryable — raise immediately
                 if 400 <= response.status_code < 500:
                     response.raise_for_status()
@@ -136,16 +186,36 @@ class YugoClient:
         return self._post_json("student-portal-redirect", data=data)
 
 
+def normalise_lookup_name(name: Any) -> str:
+    """Case-, accent- and whitespace-insensitive form of a place name."""
+    decomposed = unicodedata.normalize("NFKD", str(name or ""))
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
 def find_by_name(items: List[Dict[str, Any]], name: Optional[str]) -> Optional[Dict[str, Any]]:
     if not name:
         return None
-    target = name.strip().lower()
+    target = normalise_lookup_name(name)
     for item in items:
-        if str(item.get("name", "")).strip().lower() == target:
+        if normalise_lookup_name(item.get("name", "")) == target:
             return item
     return None
 
 
+def build_name_index(items: List[Dict[str, Any]], id_keys: Tuple[str, ...]) -> Dict[str, str]:
+    """Map normalised item names to the first non-empty ID among id_keys."""
+    index: Dict[str, str] = {}
+    for item in items:
+        key = normalise_lookup_name(item.get("name", ""))
+        if not key or key in index:
+            continue
+        item_id = next((item.get(k) for k in id_keys if item.get(k)), None)
+        if item_id:
+            index[key] = str(item_id)
+    return index
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -183,6 +253,100 @@ def get_weekly_price(room: Dict) -> Optional[float]:
     return None
 
 
+def _fingerprint(payload: Any) -> str:
+    """Stable digest of a JSON-like payload (key order independent)."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _TenancyMemoEntry:
+    """Last tenancy groups fetched for a room, keyed by payload fingerprint."""
+    fingerprint: str
+    groups: List[Dict[str, Any]]
+    fetched_at: float
+
+
+class _ResidenceRecord:
+    """Per-residence fields shared by every option from that residence."""
+    __slots__ = ("residence_id", "content_id", "portal_link", "payment_link")
+
+    def __init__(self, residence: Dict[str, Any]):
+        self.residence_id = str(residence.get("id"))
+        self.content_id = str(residence.get("contentId"))
+        self.portal_link = residence.get("portalLink")
+        self.payment_link = residence.get("paymentLink")
+
+
+class _RoomRecord:
+    """Per-room fields shared by every option for that room."""
+    __slots__ = ("room_id", "data")
+
+    def __init__(self, room: Dict[str, Any]):
+        self.room_id = str(room.get("id"))
+        self.data = room
+
+
+_OPTION_RAW_GETTERS: Dict[str, Callable[["YugoOptionRaw"], Any]] = {
+    "residenceId": lambda r: r._residence.residence_id,
+    "residenceContentId": lambda r: r._residence.content_id,
+    "roomId": lambda r: r._room.room_id,
+    "optionId": lambda r: str(r._option.get("id")) if r._option.get("id") else None,
+    "academicYearId": lambda r: r._group.get("academicYearId"),
+    "fromYear": lambda r: r._group.get("fromYear"),
+    "toYear": lambda r: r._group.get("toYear"),
+    "roomData": lambda r: r._room.data,
+    "residencePortalLink": lambda r: r._residence.portal_link,
+    "residencePaymentLink": lambda r: r._residence.payment_link,
+    "maxNumOfBedsInFlat": lambda r: r._room.data.get("maxNumOfBedsInFlat"),
+    "optionLinkToRedirect": lambda r: r._option.get("linkToRedirect"),
+    "optionStartDate": lambda r: r._option.get("startDate"),
+    "optionEndDate": lambda r: r._option.get("endDate"),
+    "optionTenancyLength": lambda r: r._option.get("tenancyLength"),
+    "optionStatus": lambda r: r._option.get("status"),
+}
+
+
+class YugoOptionRaw(Mapping):
+    """
+    Read-only `RoomOption.raw` view for Yugo options.
+
+    Exposes the same keys the provider has always put in `raw`, but derives
+    them on access from shared residence/room records and the API's own
+    group/option dicts rather than copying them into a dict per option.
+    Use dict(raw) when a plain dict is needed (e.g. for JSON).
+    """
+    __slots__ = ("_residence", "_room", "_group", "_option")
+
+    def __init__(
+        self,
+        residence: _ResidenceRecord,
+        room: _RoomRecord,
+        group: Dict[str, Any],
+        option: Dict[str, Any],
+    ):
+        self._residence = residence
+        self._room = room
+        self._group = group
+        self._option = option
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            getter = _OPTION_RAW_GETTERS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return getter(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_OPTION_RAW_GETTERS)
+
+    def __len__(self) -> int:
+        return len(_OPTION_RAW_GETTERS)
+
+    def __repr__(self) -> str:
+        return f"YugoOptionRaw({dict(self)!r})"
+
+
 # ---------------------------------------------------------------------------
 # Provider implementation
 # ---------------------------------------------------------------------------
@@ -196,8 +360,19 @@ class YugoProvider(BaseProvider):
         city: str = "Dublin",
         country_id: Optional[str] = None,
         city_id: Optional[str] = None,
+        max_workers: int = DEFAULT_SCAN_WORKERS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT_PER_HOST,
+        cache: Optional[JsonCache] = None,
+        poll_interval_seconds: Optional[float] = None,
     ):
-        self._client = YugoClient()
+        self._client = YugoClient(max_in_flight=max_in_flight)
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_workers = max(1, max_workers)
+        self._cache = cache
+        self._tenancy_memo: Dict[Tuple[str, str], _TenancyMemoEntry] = {}
+        self._residence_layouts: Dict[str, Tuple[List[str], List[int]]] = {}
+        self._memo_hits = 0
+        self._memo_misses = 0
         self._country = country
         self._city = city
         self._country_id = country_id
@@ -207,6 +382,62 @@ class YugoProvider(BaseProvider):
     def name(self) -> str:
         return "yugo"
 
+    def _cached_items(
+        self,
+        key: str,
+        ttl_seconds: float,
+        fetch: Callable[[], List[Dict[str, Any]]],
+        id_keys: Tuple[str, ...] = (),
+        refresh: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """
+        Return (items, name_index) for a list endpoint, via the disk cache.
+
+        The name→ID index is stored alongside the items so resolving a name
+        on a cold start is a single dict lookup with no network calls.
+        With refresh=True the cached copy is skipped and overwritten.
+        """
+        if self._cache is not None and not refresh:
+            cached = self._cache.get(key, ttl_seconds)
+            if isinstance(cached, dict) and isinstance(cached.get("items"), list):
+                return cached["items"], cached.get("index") or {}
+
+        items = fetch()
+        index = build_name_index(items, id_keys) if id_keys else {}
+        if self._cache is not None and items:
+            self._cache.set(key, {"items": items, "index": index})
+        return items, index
+
+    def _countries(self, refresh: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        return self._cached_items(
+            "yugo/countries",
+            GEOGRAPHY_CACHE_TTL_SECONDS,
+            self._client.list_countries,
+            ("countryId", "id"),
+            refresh=refresh,
+        )
+
+    def _cities(
+        self,
+        country_id: str,
+        refresh: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        return self._cached_items(
+            f"yugo/cities/{country_id}",
+            GEOGRAPHY_CACHE_TTL_SECONDS,
+            lambda: self._client.list_cities(country_id),
+            ("contentId", "id"),
+            refresh=refresh,
+        )
+
+    def _residences(self, city_id: str) -> List[Dict[str, Any]]:
+        items, _ = self._cached_items(
+            f"yugo/residences/{city_id}",
+            RESIDENCES_CACHE_TTL_SECONDS,
+            lambda: self._client.list_residences(city_id),
+        )
+        return items
+
     def _resolve_city_id(self) -> Optional[str]:
         if self._city_id:
             return self._city_id
@@ -215,45 +446,54 @@ class YugoProvider(BaseProvider):
         if not cid:
             return None
 
-        cities = self._client.list_cities(cid)
-        city_match = find_by_name(cities, self._city)
-        if not city_match:
+        key = normalise_lookup_name(self._city)
+        city_id = self._cities(cid)[1].get(key)
+        if not city_id and self._cache is not None:
+            # The cached index may predate a newly added city
+            city_id = self._cities(cid, refresh=True)[1].get(key)
+        if not city_id:
             logger.error("Yugo: city '%s' not found", self._city)
             return None
 
-        return str(city_match.get("contentId") or city_match.get("id") or "")
+        self._city_id = city_id
+        return city_id
 
     def _resolve_country_id(self) -> Optional[str]:
         if self._country_id:
             return str(self._country_id)
 
-        countries = self._client.list_countries()
-        country_match = find_by_name(countries, self._country)
-        if not country_match:
+        key = normalise_lookup_name(self._country)
+        country_id = self._countries()[1].get(key)
+        if not country_id and self._cache is not None:
+            # The cached index may predate a newly added country
+            country_id = self._countries(refresh=True)[1].get(key)
+        if not country_id:
             logger.error("Yugo: country '%s' not found", self._country)
             return None
-        return str(country_match.get("countryId") or country_match.get("id") or "")
+
+        self._country_id = country_id
+        return country_id
 
     def discover_properties(self) -> List[Dict[str, Any]]:
         city_id = self._resolve_city_id()
         if not city_id:
             return []
-        return self._client.list_residences(city_id)
+        return self._residences(city_id)
 
     def list_countries(self) -> List[Dict[str, Any]]:
-        return self._client.list_countries()
+        return self._countries()[0]
 
     def list_cities(self, country_id: Optional[str] = None) -> List[Dict[str, Any]]:
         cid = country_id or self._resolve_country_id()
         if not cid:
             return []
-        return self._client.list_cities(cid)
+        return self._cities(cid)[0]
 
     def list_residences(self, city_id: Optional[str] = None) -> List[Dict[str, Any]]:
         cid = city_id or self._resolve_city_id()
         if not cid:
             return []
-        return self._client.list_residences(cid)
+        return self._residences(cid)
 
     def _academic_year_matches(
         self,
@@ -277,6 +517,116 @@ class YugoProvider(BaseProvider):
             return False
         return True
 
+    def _fetch_room_groups(
+        self,
+        residences: List[Dict[str, Any]],
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Fetch rooms and tenancy groups for many residences concurrently.
+
+        Room lists are requested for every residence up front; tenancy-option
+        requests for a residence's unsold rooms are submitted as soon as its
+        room list arrives. Results are returned as (residence, room, groups)
+        tuples in residence/room order, independent of completion order.
+
+        Tenancy groups are memoised per room: if the residence and room
+        payloads fingerprint the same as on the previous scan (and the entry
+        is younger than _tenancy_memo_max_age()), the previous groups are
+        reused instead of calling tenancyOptionsBySSId again.
+        """
+        valid = [r for r in residences if r.get("id") and r.get("contentId")]
+        if not valid:
+            self._tenancy_memo = {}
+            return []
+
+        now = time.monotonic()
+        max_age = self._tenancy_memo_max_age()
+        hits = 0
+        misses = 0
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            room_futures = {
+                executor.submit(self._client.list_rooms, str(residence["id"])): idx
+                for idx, residence in enumerate(valid)
+            }
+            per_residence: List[List[Tuple[Dict[str, Any], Tuple[str, str], str, Any]]] = [
+                [] for _ in valid
+            ]
+            for future in concurrent.futures.as_completed(room_futures):
+                idx = room_futures[future]
+                residence = valid[idx]
+                residence_fp = _fingerprint(residence)
+                for room in future.result():
+                    if room.get("soldOut") is not False or not room.get("id"):
+                        continue
+                    memo_key = (str(residence["id"]), str(room["id"]))
+                    fingerprint = _fingerprint((residence_fp, room))
+                    cached = self._tenancy_memo.get(memo_key)
+                    if (
+                        cached is not None
+                        and cached.fingerprint == fingerprint
+                        and now - cached.fetched_at <= max_age
+                    ):
+                        hits += 1
+                        per_residence[idx].append((room, memo_key, fingerprint, cached))
+                        continue
+                    misses += 1
+                    per_residence[idx].append((room, memo_key, fingerprint, executor.submit(
+                        self._client.list_tenancy_options,
+                        str(residence["id"]),
+                        str(residence["contentId"]),
+                        str(room["id"]),
+                    )))
+
+            results: List[Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]] = []
+            memo: Dict[Tuple[str, str], _TenancyMemoEntry] = {}
+            for idx, rooms in enumerate(per_residence):
+                for room, memo_key, fingerprint, pending in rooms:
+                    if isinstance(pending, _TenancyMemoEntry):
+                        entry = pending
+                    else:
+                        entry = _TenancyMemoEntry(fingerprint, pending.result(), now)
+                    memo[memo_key] = entry
+                    results.append((valid[idx], room, entry.groups))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # Replacing the memo drops rooms that disappeared or sold out.
+        self._tenancy_memo = memo
+        self._memo_hits += hits
+        self._memo_misses += misses
+        if hits + misses:
+            logger.info(
+                "Yugo: tenancy options reused for %d/%d rooms (%.0f%%; lifetime hit ratio %.0f%%)",
+                hits, hits + misses, 100.0 * hits / (hits + misses),
+                100.0 * self.tenancy_cache_stats()["hitRatio"],
+            )
+        return results
+
+    def _tenancy_memo_max_age(self) -> float:
+        """
+        Memo entries must outlive the gap between two scans to ever be
+        reused, so with a polling interval the bound is at least
+        TENANCY_MEMO_POLL_FACTOR times that interval. Entries are then
+        still refreshed every other scan.
+        """
+        if self._poll_interval_seconds is None:
+            return TENANCY_MEMO_MAX_AGE_SECONDS
+        return max(
+            TENANCY_MEMO_MAX_AGE_SECONDS,
+            self._poll_interval_seconds * TENANCY_MEMO_POLL_FACTOR,
+        )
+
+    def tenancy_cache_stats(self) -> Dict[str, Any]:
+        """Lifetime hit/miss counters for the tenancy-options memo."""
+        total = self._memo_hits + self._memo_misses
+        return {
+            "hits": self._memo_hits,
+            "misses": self._memo_misses,
+            "entries": len(self._tenancy_memo),
+            "hitRatio": (self._memo_hits / total) if total else 0.0,
+        }
+
     def scan(
         self,
         academic_year: str = "2026-27",
@@ -300,107 +650,85 @@ class YugoProvider(BaseProvider):
                 pass
 
         results: List[RoomOption] = []
-        residences = self._client.list_residences(city_id)
+        residences = self._residences(city_id)
 
-        for residence in residences:
-            residence_id = residence.get("id")
-            residence_content_id = residence.get("contentId")
-            if not residence_id or not residence_content_id:
+        residence_records: Dict[int, _ResidenceRecord] = {}
+        for residence, room, groups in self._fetch_room_groups(residences):
+            if not groups:
                 continue
 
-            rooms = self._client.list_rooms(str(residence_id))
-            for room in rooms:
-                if room.get("soldOut") is not False:
-                    continue
-
-                room_id = room.get("id")
-                if not room_id:
-                    continue
-
-                groups = self._client.list_tenancy_options(
-                    str(residence_id), str(residence_content_id), str(room_id)
-                )
-                if not groups:
+            residence_record = residence_records.get(id(residence))
+            if residence_record is None:
+                residence_record = residence_records[id(residence)] = _ResidenceRecord(residence)
+            room_record: Optional[_RoomRecord] = None
+            weekly = get_weekly_price(room)
+            price_label = f"€{weekly:.0f}/week" if weekly else (room.get("priceLabel") or "")
+            property_name = residence.get("name") or ""
+            room_type = room.get("name") or ""
+            fallback_url = residence.get("portalLink") or residence.get("paymentLink")
+
+            for group in groups:
+                if apply_semester_filter and not self._academic_year_matches(group, academic_year, semester):
                     continue
 
-                for group in groups:
-                    if apply_semester_filter and not self._academic_year_matches(group, academic_year, semester):
-                        continue
-
-                    options = group.get("tenancyOption") or []
-                    for option in options:
-                        if apply_semester_filter and semester == 1:
-                            option_payload = {
-                                "fromYear": group.get("fromYear"),
-                                "toYear": group.get("toYear"),
-                                "tenancyOption": [{
-                                    "name": option.get("name"),
-                                    "formattedLabel": option.get("formattedLabel"),
-                                    "startDate": option.get("startDate"),
-                                    "endDate": option.get("endDate"),
-                                }],
-                            }
-                            if not match_semester1(option_payload, academic_config):
-                                continue
-
-                        weekly = get_weekly_price(room)
-                        price_label = room.get("priceLabel") or ""
-
-                        results.append(RoomOption(
-                            provider="yugo",
-                            property_name=residence.get("name") or "",
-                            property_slug=str(residence_id),
-                            room_type=room.get("name") or "",
-                            price_weekly=weekly,
-                            price_label=f"€{weekly:.0f}/week" if weekly else price_label,
-                            available=True,
-                            booking_url=(
-                                option.get("linkToRedirect")
-                                or residence.get("portalLink")
-                                or residence.get("paymentLink")
-                            ),
-                            start_date=option.get("startDate"),
-                            end_date=option.get("endDate"),
-                            academic_year=academic_year,
-                            option_name=option.get("name") or option.get("formattedLabel"),
-                            location=residence.get("locationInfo"),
-                            raw={
-                                "residenceId": str(residence_id),
-                                "residenceContentId": str(residence_content_id),
-                                "roomId": str(room_id),
-                                "optionId": str(option.get("id")) if option.get("id") else None,
-                                "academicYearId": group.get("academicYearId"),
-                                "fromYear": group.get("fromYear"),
-                                "toYear": group.get("toYear"),
-                                "roomData": room,
-                                "residencePortalLink": residence.get("portalLink"),
-                                "residencePaymentLink": residence.get("paymentLink"),
-                                "maxNumOfBedsInFlat": room.get("maxNumOfBedsInFlat"),
-                                "optionLinkToRedirect": option.get("linkToRedirect"),
-                                "optionStartDate": option.get("startDate"),
-                                "optionEndDate": option.get("endDate"),
-                                "optionTenancyLength": option.get("tenancyLength"),
-                                "optionStatus": option.get("status"),
-                            },
-                        ))
+                options = group.get("tenancyOption") or []
+                for option in options:
+                    if apply_semester_filter and semester == 1:
+                        option_payload = {
+                            "fromYear": group.get("fromYear"),
+                            "toYear": group.get("toYear"),
+                            "tenancyOption": [{
+                                "name": option.get("name"),
+                                "formattedLabel": option.get("formattedLabel"),
+                                "startDate": option.get("startDate"),
+                                "endDate": option.get("endDate"),
+                            }],
+                        }
+                        if not match_semester1(option_payload, academic_config):
+                            continue
+
+                    if room_record is None:
+                        room_record = _RoomRecord(room)
+
+                    results.append(RoomOption(
+                        provider="yugo",
+                        property_name=property_name,
+                        property_slug=residence_record.residence_id,
+                        room_type=room_type,
+                        price_weekly=weekly,
+                        price_label=price_label,
+                        available=True,
+                        booking_url=option.get("linkToRedirect") or fallback_url,
+                        start_date=option.get("startDate"),
+                        end_date=option.get("endDate"),
+                        academic_year=academic_year,
+                        option_name=option.get("name") or option.get("formattedLabel"),
+                        location=residence.get("locationInfo"),
+                        raw=YugoOptionRaw(residence_record, room_record, group, option),
+                    ))
 
         return results
 
-    def probe_booking(self, option: RoomOption) -> Dict[str, Any]:
-        """Deep-probe the Yugo booking flow for a given option."""
-        from datetime import datetime
-
-        raw = option.raw
-        residence_content_id = raw.get("residenceContentId") or ""
-
-        # Warm booking session
-        self._client.session.get(
-            self._client.base_url + "booking-flow-page",
-            params={"residenceContentId": residence_content_id},
-            timeout=self._client.timeout,
-        ).raise_for_status()
-
-        property_data = self._client.get_residence_property(raw["residenceId"])
+    def _residence_layout(self, residence_id: str) -> Tuple[List[str], List[int]]:
+        """
+        Return (building_ids, floor_indexes) for a residence.
+
+        This residence-property metadata is static, so it is memoised per
+        residence and, when a cache is configured, persisted on disk.
+        """
+        layout = self._residence_layouts.get(residence_id)
+        if layout is not None:
+            return layout
+
+        cache_key = f"yugo/residence-layout/{residence_id}"
+        if self._cache is not None:
+            cached = self._cache.get(cache_key, RESIDENCE_LAYOUT_CACHE_TTL_SECONDS)
+            if isinstance(cached, dict) and cached.get("buildingIds") and cached.get("floorIndexes"):
+                layout = (list(cached["buildingIds"]), [int(i) for i in cached["floorIndexes"]])
+                self._residence_layouts[residence_id] = layout
+                return layout
+
+        property_data = self._client.get_residence_property(residence_id)
         buildings = ((property_data.get("property") or {}).get("buildings") or [])
         building_ids = [b.get("id") for b in buildings if b.get("id")]
 
@@ -416,6 +744,26 @@ class YugoProvider(BaseProvider):
         if not building_ids or not floor_indexes:
             raise RuntimeError("Could not resolve building/floor metadata for booking probe.")
 
+        layout = (building_ids, floor_indexes)
+        self._residence_layouts[residence_id] = layout
+        if self._cache is not None:
+            self._cache.set(cache_key, {"buildingIds": building_ids, "floorIndexes": floor_indexes})
+        return layout
+
+    def probe_booking(self, option: RoomOption) -> Dict[str, Any]:
+        """
+        Deep-probe the Yugo booking flow for a given option.
+
+        Independent calls run concurrently: the booking-flow warm-up runs
+        alongside the (cached) residence layout lookup; available-beds,
+        flats-with-beds and skip-room-selection then run together, and the
+        student-portal redirect starts as soon as a bed has been picked.
+        """
+        from datetime import datetime
+
+        raw = option.raw
+        residence_content_id = raw.get("residenceContentId") or ""
+
         def _to_js_date(date_str: str) -> str:
             dt = datetime.strptime(date_str, "%Y-%m-%d")
             return dt.strftime("%a %b %d %Y 00:00:00 GMT+0000 (UTC)")
@@ -428,54 +776,70 @@ class YugoProvider(BaseProvider):
         start_date_js = _to_js_date(start_date_raw)
         end_date_js = _to_js_date(end_date_raw)
 
-        common_params = {
-            "roomTypeId": raw["roomId"],
-            "residenceExternalId": raw["residenceId"],
-            "tenancyOptionId": raw["optionId"],
-            "tenancyStartDate": start_date_js,
-            "tenancyEndDate": end_date_js,
-            "academicYearId": raw.get("academicYearId"),
-            "maxNumOfFlatmates": str(raw.get("maxNumOfBedsInFlat") or 7),
-            "buildingIds": ",".join(building_ids),
-            "floorIndexes": ",".join(str(i) for i in floor_indexes),
-        }
+        def _warm_booking_session() -> None:
+            self._client.session.get(
+                self._client.base_url + "booking-flow-page",
+                params={"residenceContentId": residence_content_id},
+                timeout=self._client.timeout,
+            ).raise_for_status()
 
-        available_beds = self._client.get_available_beds(common_params)
         room = raw.get("roomData") or {}
-        flats_with_beds = self._client.get_flats_with_beds({
-            **common_params,
-            "sortDirection": "false",
-            "pageNumber": "1",
-            "pageSize": "6",
-            "totalPriceOriginal": "0",
-            "pricePerNightOriginal": str(room.get("minPricePerNight") or ""),
-        })
-
-        selected_bed_id = None
-        selected_flat_id = None
-        floors = ((flats_with_beds.get("flats") or {}).get("floors") or [])
-        for floor in floors:
-            for flat in floor.get("flats") or []:
-                beds = flat.get("beds") or []
-                if beds:
-                    selected_bed_id = beds[0].get("bedId") or beds[0].get("id")
-                    selected_flat_id = flat.get("id")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            warm_future = executor.submit(_warm_booking_session)
+            layout_future = executor.submit(self._residence_layout, raw["residenceId"])
+            building_ids, floor_indexes = layout_future.result()
+            warm_future.result()
+
+            common_params = {
+                "roomTypeId": raw["roomId"],
+                "residenceExternalId": raw["residenceId"],
+                "tenancyOptionId": raw["optionId"],
+                "tenancyStartDate": start_date_js,
+                "tenancyEndDate": end_date_js,
+                "academicYearId": raw.get("academicYearId"),
+                "maxNumOfFlatmates": str(raw.get("maxNumOfBedsInFlat") or 7),
+                "buildingIds": ",".join(building_ids),
+                "floorIndexes": ",".join(str(i) for i in floor_indexes),
+            }
+
+            beds_future = executor.submit(self._client.get_available_beds, common_params)
+            skip_future = executor.submit(self._client.get_skip_room_selection, common_params)
+            flats_with_beds = self._client.get_flats_with_beds({
+                **common_params,
+                "sortDirection": "false",
+                "pageNumber": "1",
+                "pageSize": "6",
+                "totalPriceOriginal": "0",
+                "pricePerNightOriginal": str(room.get("minPricePerNight") or ""),
+            })
+
+            selected_bed_id = None
+            selected_flat_id = None
+            floors = ((flats_with_beds.get("flats") or {}).get("floors") or [])
+            for floor in floors:
+                for flat in floor.get("flats") or []:
+                    beds = flat.get("beds") or []
+                    if beds:
+                        selected_bed_id = beds[0].get("bedId") or beds[0].get("id")
+                        selected_flat_id = flat.get("id")
+                        break
+                if selected_bed_id:
                     break
-            if selected_bed_id:
-                break
-
-        skip_room = self._client.get_skip_room_selection(common_params)
-        handover = self._client.post_student_portal_redirect({
-            "roomTypeId": raw["roomId"],
-            "residenceExternalId": raw["residenceId"],
-            "tenancyOptionId": raw["optionId"],
-            "tenancyStartDate": start_date_js,
-            "tenancyEndDate": end_date_js,
-            "academicYearId": raw.get("academicYearId"),
-            "bedId": selected_bed_id or "",
-            "flatId": selected_flat_id or "",
-            "currencyCode": "EUR",
-        })
+
+            handover = self._client.post_student_portal_redirect({
+                "roomTypeId": raw["roomId"],
+                "residenceExternalId": raw["residenceId"],
+                "tenancyOptionId": raw["optionId"],
+                "tenancyStartDate": start_date_js,
+                "tenancyEndDate": end_date_js,
+                "academicYearId": raw.get("academicYearId"),
+                "bedId": selected_bed_id or "",
+                "flatId": selected_flat_id or "",
+                "currencyCode": "EUR",
+            })
+            available_beds = beds_future.result()
+            skip_room = skip_future.result()
 
         return {
             "match": {
@@ -0,0 +1,109 @@
+"""
+scheduler.py — Per-provider polling schedule for watch mode.
+
+Each provider runs on its own interval. Run times are anchored to a
+monotonic clock: tick k is due at anchor + k * interval plus a fresh
+random jitter, so a slow scan never pushes later ticks back, and ticks
+missed while a scan overran are skipped rather than run back to back.
+Providers are started independently, so one provider's slow scan does not
+delay another's ticks.
+Failures back off exponentially; a backed-off provider resumes at the
+first tick after its backoff expires.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 600
+
+
+@dataclass
+class ProviderSchedule:
+    """Schedule state for one provider (times are monotonic seconds)."""
+    name: str
+    interval: float
+    jitter: float
+    anchor: float
+    tick: int = 0
+    next_run: float = 0.0
+    failures: int = 0
+    backoff_until: float = 0.0
+
+
+class WatchScheduler:
+    """Tracks when each provider is next due."""
+
+    def __init__(
+        self,
+        schedules: Dict[str, Tuple[float, float]],
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[float, float], float] = random.uniform,
+        backoff_base: float = BACKOFF_BASE_SECONDS,
+        backoff_max: float = BACKOFF_MAX_SECONDS,
+    ):
+        """`schedules` maps provider name → (interval_seconds, jitter_seconds)."""
+        self._clock = clock
+        self._rng = rng
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        anchor = clock()
+        self._schedules: Dict[str, ProviderSchedule] = {
+            name: ProviderSchedule(name=name, interval=max(1.0, float(interval)),
+                                   jitter=max(0.0, float(jitter)), anchor=anchor, next_run=anchor)
+            for name, (interval, jitter) in schedules.items()
+        }
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Names of providers whose next run time has passed, in schedule order."""
+        now = self._clock() if now is None else now
+        return [s.name for s in self._schedules.values() if s.next_run <= now]
+
+    def record_success(self, name: str) -> None:
+        schedule = self._schedules[name]
+        schedule.failures = 0
+        schedule.backoff_until = 0.0
+        self._advance(schedule)
+
+    def record_failure(self, name: str) -> float:
+        """Back the provider off; returns the backoff in seconds."""
+        schedule = self._schedules[name]
+        schedule.failures += 1
+        backoff = min(self._backoff_max, self._backoff_base * (2 ** (schedule.failures - 1)))
+        schedule.backoff_until = self._clock() + backoff
+        self._advance(schedule)
+        return backoff
+
+    def start(self, name: str) -> None:
+        """Mark a provider as running: it is not due again until its run is recorded."""
+        self._schedules[name].next_run = math.inf
+
+    def skip(self, name: str) -> None:
+        """Move a provider to its next tick without touching its failure count."""
+        self._advance(self._schedules[name])
+
+    def next_runs(self) -> Dict[str, float]:
+        """Provider name → monotonic time of its next run (inf while running)."""
+        return {s.name: s.next_run for s in self._schedules.values()}
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        """Seconds until the next provider is due (inf with no schedules)."""
+        now = self._clock() if now is None else now
+        if not self._schedules:
+            return math.inf
+        return max(0.0, min(s.next_run for s in self._schedules.values()) - now)
+
+    def _advance(self, schedule: ProviderSchedule) -> None:
+        """Schedule the first tick after now (and after any backoff)."""
+        not_before = max(self._clock(), schedule.backoff_until)
+        tick = math.floor((not_before - schedule.anchor) / schedule.interval) + 1
+        schedule.tick = max(schedule.tick + 1, tick)
+        jitter = self._rng(0.0, schedule.jitter) if schedule.jitter else 0.0
+        schedule.next_run = schedule.anchor + schedule.tick * schedule.interval + jitter
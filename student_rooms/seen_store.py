@@ -0,0 +1,128 @@
+"""
+seen_store.py — Persistent record of alerted option keys for watch mode.
+
+Dedup keys live in a small SQLite database (WAL journal) with first-seen
+and last-seen timestamps. Each cycle writes only keys that are new or whose
+last-seen time is more than LAST_SEEN_RESOLUTION_SECONDS old, in a single
+transaction, and keys not seen for the configured TTL are pruned so an
+option that disappears and later returns alerts again.
+
+On first use, keys from the legacy seen_options.json list are imported.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+LAST_SEEN_RESOLUTION_SECONDS = 3600
+_QUERY_BATCH = 500
+
+
+class SeenStore:
+    """SQLite-backed set of dedup keys with first/last-seen timestamps."""
+
+    def __init__(self, path: str, legacy_json_path: Optional[str] = None):
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate(legacy_json_path)
+
+    def _migrate(self, legacy_json_path: Optional[str]) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen ("
+                " key TEXT PRIMARY KEY,"
+                " first_seen REAL NOT NULL,"
+                " last_seen REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS seen_last_seen ON seen (last_seen)")
+            imported = self._import_legacy_json(legacy_json_path)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        if imported:
+            logger.info("Imported %d seen keys from %s", imported, legacy_json_path)
+
+    def _import_legacy_json(self, legacy_json_path: Optional[str]) -> int:
+        if not legacy_json_path or not os.path.exists(legacy_json_path):
+            return 0
+        try:
+            with open(legacy_json_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not import %s: %s", legacy_json_path, exc)
+            return 0
+        keys = [key for key in data if isinstance(key, str)] if isinstance(data, list) else []
+        try:
+            stamp = os.path.getmtime(legacy_json_path)
+        except OSError:
+            stamp = time.time()
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO seen (key, first_seen, last_seen) VALUES (?, ?, ?)",
+            ((key, stamp, stamp) for key in keys),
+        )
+        return len(keys)
+
+    def unseen(self, keys: Iterable[str]) -> Set[str]:
+        """Return the subset of keys not in the store."""
+        pending = list(dict.fromkeys(keys))
+        known: Set[str] = set()
+        for i in range(0, len(pending), _QUERY_BATCH):
+            batch = pending[i:i + _QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            known.update(
+                row[0] for row in self._conn.execute(
+                    f"SELECT key FROM seen WHERE key IN ({placeholders})", batch,
+                )
+            )
+        return set(pending) - known
+
+    def record(self, keys: Iterable[str], now: Optional[float] = None) -> int:
+        """
+        Mark keys as seen now, atomically. Existing keys only get their
+        last_seen refreshed once it is LAST_SEEN_RESOLUTION_SECONDS stale.
+        Returns the number of rows written.
+        """
+        now = time.time() if now is None else now
+        rows = [(key, now, now) for key in dict.fromkeys(keys)]
+        if not rows:
+            return 0
+        with self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT INTO seen (key, first_seen, last_seen) VALUES (?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET last_seen = excluded.last_seen"
+                f" WHERE excluded.last_seen - seen.last_seen >= {LAST_SEEN_RESOLUTION_SECONDS}",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    def prune(self, ttl_seconds: float, now: Optional[float] = None) -> int:
+        """Delete keys not seen for ttl_seconds; returns how many were removed."""
+        now = time.time() if now is None else now
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM seen WHERE last_seen < ?", (now - ttl_seconds,))
+        return cursor.rowcount
+
+    def first_seen(self, key: str) -> Optional[float]:
+        row = self._conn.execute("SELECT first_seen FROM seen WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
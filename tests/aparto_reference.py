@@ -0,0 +1,187 @@
+"""
+tests/aparto_reference.py — BeautifulSoup reference parsers for Aparto pages.
+
+The provider parses pages without building a DOM. These are the earlier
+BeautifulSoup implementations it replaced; the parity tests and the
+benchmarks check the fast paths against them.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Set
+
+from bs4 import BeautifulSoup
+
+from student_rooms.providers.aparto import (
+    MAIN_BASE,
+    _TERM_INFO_RE,
+    _TermPageFields,
+    _parse_room_results,
+    _parse_weeks_from_name,
+)
+
+
+def parse_term_page_soup(html: str) -> _TermPageFields:
+    """Term page fields, as _parse_term_page() should return them."""
+    soup = BeautifulSoup(html, "html.parser")
+    info = _TERM_INFO_RE.search(html)
+
+    page_container = soup.find(attrs={"data-termid": True})
+    start_iso = page_container.get("data-datestart", "")[:10] if page_container else None
+    end_iso = page_container.get("data-dateend", "")[:10] if page_container else None
+
+    has_rooms = (
+        "room-result" in html.lower()
+        or "€" in soup.get_text()
+        or "£" in soup.get_text()
+        or bool(soup.find(attrs={"data-roombaseid": True}))
+    )
+
+    return _TermPageFields(
+        term_name=info.group(1) if info else None,
+        start_date=info.group(2) if info else None,
+        end_date=info.group(3) if info else None,
+        start_iso=start_iso,
+        end_iso=end_iso,
+        has_rooms=has_rooms,
+        rooms=_parse_room_results(html, _parse_weeks_from_name(info.group(1)) if info else None),
+    )
+
+
+def extract_prices_from_html_soup(html: str, property_name: str) -> List[Dict[str, Any]]:
+    """Room types and weekly prices, as _extract_prices_from_html() should return them."""
+    soup = BeautifulSoup(html, "html.parser")
+    text = soup.get_text(separator=" ")
+
+    APARTO_TIERS = ["Bronze", "Silver", "Gold", "Platinum"]
+
+    rooms = []
+    seen_tiers: set = set()
+
+    proximity_pattern = re.compile(
+        r'(Bronze|Silver|Gold|Platinum|Studio|Deluxe)[\s\-]*(Ensuite|En-suite|Studio|Room|Suite|Apartment)?'
+        r'.{0,200}?[€£]\s*(\d+(?:[.,]\d+)?)\s*(?:p/?w|/week|per week|pw)',
+        re.IGNORECASE | re.DOTALL,
+    )
+    for m in proximity_pattern.finditer(text):
+        tier = m.group(1).strip().title()
+        subtype = (m.group(2) or "Ensuite").strip().title()
+        label = f"{tier} {subtype}"
+        if label in seen_tiers:
+            continue
+        seen_tiers.add(label)
+        try:
+            price = float(m.group(3).replace(",", "."))
+        except ValueError:
+            price = None
+        rooms.append({
+            "room_type": label,
+            "price_label": f"€{price:.0f}/week" if price else "price N/A",
+            "price_weekly": price,
+        })
+
+    if rooms:
+        tier_order = {t: i for i, t in enumerate(APARTO_TIERS)}
+        rooms.sort(key=lambda r: tier_order.get(r["room_type"].split()[0].title(), 99))
+        return rooms
+
+    # Fallback: check for monthly pricing (common for ES/IT)
+    monthly_pattern = re.compile(
+        r'[€£]\s*(\d+(?:[.,]\d+)?)\s*(?:per month|/month|p/?m|pcm)',
+        re.IGNORECASE,
+    )
+    monthly_prices = monthly_pattern.findall(text)
+    if monthly_prices:
+        prices = sorted({float(p.replace(",", ".")) for p in monthly_prices if p})
+        if prices:
+            return [{
+                "room_type": "Room",
+                "price_label": f"from €{prices[0]:.0f}/month",
+                "price_weekly": round(prices[0] / 4.33, 2),  # approximate
+            }]
+
+    # Fallback: separate tier list + price list
+    tier_pattern = re.compile(
+        r'\b(Bronze|Silver|Gold|Platinum|Studio|Deluxe)\b'
+        r'[\s\-]*(Ensuite|En-suite|Room|Suite|Apartment)?',
+        re.IGNORECASE,
+    )
+    found_tiers = []
+    for m in tier_pattern.finditer(text):
+        tier = m.group(1).strip().title()
+        subtype = (m.group(2) or "Ensuite").strip().title()
+        label = f"{tier} {subtype}"
+        if label not in found_tiers:
+            found_tiers.append(label)
+
+    price_pattern = re.compile(r'[€£]\s*(\d+(?:[.,]\d+)?)\s*(?:p/?w|/week|per week|pw)', re.IGNORECASE)
+    prices_raw = price_pattern.findall(text)
+    prices = sorted({float(p.replace(",", ".")) for p in prices_raw if p})
+
+    if not found_tiers:
+        weekly = prices[0] if prices else None
+        return [{
+            "room_type": "Room (type TBC)",
+            "price_label": f"from €{weekly:.0f}/week" if weekly else "price N/A",
+            "price_weekly": weekly,
+        }]
+
+    tier_order = {t: i for i, t in enumerate(APARTO_TIERS)}
+    found_tiers.sort(key=lambda l: tier_order.get(l.split()[0].title(), 99))
+
+    for idx, tier_label in enumerate(found_tiers):
+        weekly = prices[idx] if idx < len(prices) else (prices[0] if prices else None)
+        rooms.append({
+            "room_type": tier_label,
+            "price_label": f"€{weekly:.0f}/week" if weekly else "price N/A",
+            "price_weekly": weekly,
+        })
+
+    return rooms
+
+
+def parse_city_page_soup(html: str, city_slug: str) -> List[Dict[str, str]]:
+    """Property links on a city page, as _parse_city_page() should return them."""
+    soup = BeautifulSoup(html, "html.parser")
+    properties: List[Dict[str, str]] = []
+    seen_slugs: Set[str] = set()
+
+    # Find all links to /locations/{city_slug}/{property_slug}
+    pattern = re.compile(rf'^{re.escape(MAIN_BASE)}/locations/{re.escape(city_slug)}/([a-z0-9-]+)/?$')
+    for link in soup.find_all("a", href=True):
+        href = link.get("href", "")
+        if not href.startswith("http"):
+            href = MAIN_BASE + href
+        m = pattern.match(href.rstrip("/"))
+        if not m:
+            continue
+        slug = m.group(1)
+        if slug in seen_slugs or slug == "short-stays":
+            continue
+        seen_slugs.add(slug)
+
+        # Derive display name from slug
+        name = slug.replace("-", " ").title()
+
+        # Try to get address text near the link
+        parent = link.find_parent(["div", "section", "article"])
+        location = ""
+        if parent:
+            addr_text = parent.get_text(separator=" ").strip()
+            # Look for address patterns (street names, postcodes)
+            addr_match = re.search(
+                r'((?:Carrer|Calle|Via|Rue|Street|St|Rd|Road|Square|Place|Point|Tce|Terrace)\s+[^,\n]{3,50}(?:,\s*[^,\n]{3,30})?)',
+                addr_text,
+                re.IGNORECASE,
+            )
+            if addr_match:
+                location = addr_match.group(1).strip()
+
+        properties.append({
+            "slug": slug,
+            "name": name,
+            "location": location,
+            "url": f"{MAIN_BASE}/locations/{city_slug}/{slug}",
+        })
+
+    return properties
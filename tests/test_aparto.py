@@ -4,29 +4,71 @@ tests/test_aparto.py — Tests for the Aparto provider.
 Tests dynamic property discovery, HTML parsing, price extraction,
 term matching, and the provider interface across multiple cities.
 """
+import glob
+import json
+import os
+import random
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
+import requests
+
+from student_rooms.cache import CacheEntry, JsonCache
+
 from student_rooms.matching import match_semester1
 from student_rooms.models.config import AcademicYearConfig, Semester1Rules
 from student_rooms.providers.aparto import (
+    ApartoMultiCityProvider,
     ApartoProvider,
     CITY_COUNTRY_MAP,
     CITY_SLUG_MAP,
     COUNTRY_PORTAL_MAP,
+    DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES,
+    PORTAL_IE_BASE,
+    PORTAL_UK_BASE,
+    TERM_ROOM_LISTING_GAP_CHARS,
+    PROPERTY_PAGE_CACHE_TTL_SECONDS,
+    StarRezScraper,
+    StarRezSessionPool,
+    StarRezTerm,
+    StarRezTermIndex,
+    _ROOM_LISTING_END_RE,
+    _ROOM_MARKER_RE,
+    _TERM_INFO_RE,
+    _TERMID_TAG_RE,
+    _TransientProbeError,
     _build_property_aliases,
     _discover_city_properties,
     _extract_next_data,
     _extract_prices_from_html,
     _extract_property_name,
-    _extract_rsc_json_chunks,
+    _iter_rsc_json,
     _is_target_city_term,
     _normalise_name,
+    _PageScanner,
+    _parse_city_page,
+    _parse_term_page,
+    _read_term_page,
     _parse_months_from_name,
+    _parse_property_page,
+    _parse_room_results,
     _parse_weeks_from_name,
+    _PropertyMatcher,
+    _TermPageProgress,
+    _AimdController,
+    _RateLimiter,
 )
 from student_rooms.providers.base import RoomOption
 
+from tests.aparto_reference import (
+    extract_prices_from_html_soup,
+    parse_city_page_soup,
+    parse_term_page_soup,
+)
+
 
 # ---------------------------------------------------------------------------
 # Sample HTML fragments for testing
@@ -200,12 +242,56 @@ class TestExtractNextData(unittest.TestCase):
         self.assertIsNone(data)
 
 
-class TestExtractRscJsonChunks(unittest.TestCase):
-    """Test RSC JSON chunk extraction."""
+class TestIterRscJson(unittest.TestCase):
+    """Test RSC JSON row extraction."""
 
     def test_extracts_chunks(self):
-        chunks = _extract_rsc_json_chunks(SAMPLE_RSC_HTML)
-        self.assertTrue(len(chunks) >= 0)
+        chunks = list(_iter_rsc_json(SAMPLE_RSC_HTML))
+        self.assertEqual(chunks, [{"rooms": [{"name": "Bronze Ensuite", "price": 291}]}])
+
+
+def _rsc_page(*chunks: str) -> str:
+    """Build a page pushing each chunk the way Next.js does (JSON string literals)."""
+    pushes = "".join(f"<script>self.__next_f.push([1,{json.dumps(c)}])</script>" for c in chunks)
+    return f"<html><head><script>self.__next_f.push([0])</script></head><body>{pushes}</body></html>"
+
+
+class TestStreamingRscDecoder(unittest.TestCase):
+    def test_yields_only_rows_with_prices(self):
+        page = _rsc_page(
+            '0:["$","div",null,{"children":"Binary Hub"}]\n',
+            '1:I["chunks/123.js",["app"],""]\n',
+            '2:{"rooms":[{"name":"Gold Ensuite","price":329}]}\n',
+        )
+        self.assertEqual(list(_iter_rsc_json(page)), [{"rooms": [{"name": "Gold Ensuite", "price": 329}]}])
+
+    def test_row_split_across_pushes(self):
+        page = _rsc_page('0:{"rooms":[{"name":"Silver En', 'suite","price":309}', ']}\n1:{"a":1}\n')
+        self.assertEqual(list(_iter_rsc_json(page)), [{"rooms": [{"name": "Silver Ensuite", "price": 309}]}])
+
+    def test_text_rows_skipped_by_byte_length(self):
+        text = "Café\n2:{\"price\": 1}\n"  # newlines and a fake row inside the text
+        page = _rsc_page(
+            f"1:T{len(text.encode('utf-8')):x},{text}"
+            '3:{"name":"Bronze Ensuite","price":289}\n'
+        )
+        self.assertEqual(list(_iter_rsc_json(page)), [{"name": "Bronze Ensuite", "price": 289}])
+
+    def test_non_ascii_and_escapes_decoded(self):
+        page = _rsc_page('0:{"name":"Estudio Deluxe \u2014 Más","priceFrom":"€ 1,050"}\n')
+        self.assertEqual(list(_iter_rsc_json(page))[0]["name"], "Estudio Deluxe — Más")
+
+    def test_oversized_row_dropped(self):
+        big = '0:{"price":1,"pad":"' + "x" * 500 + '"}\n'
+        page = _rsc_page(big, '1:{"price":2}\n')
+        self.assertEqual(list(_iter_rsc_json(page, max_row_chars=100)), [{"price": 2}])
+
+    def test_property_page_uses_rsc_before_html(self):
+        page = _rsc_page(
+            '0:{"rooms":[{"name":"Bronze Ensuite","price":291},{"name":"Bronze Ensuite","price":291}]}\n'
+        ).replace("<body>", "<body><div>Gold Ensuite €999 p/w</div>")
+        rooms = _parse_property_page(page, "Test")
+        self.assertEqual([(r["room_type"], r["price_weekly"]) for r in rooms], [("Bronze Ensuite", 291.0)])
 
 
 class TestCityCountryMappings(unittest.TestCase):
@@ -445,6 +531,19 @@ class TestRoomOption(unittest.TestCase):
         opt2 = self._sample_option(room_type="Bronze Ensuite")
         self.assertNotEqual(opt1.dedup_key(), opt2.dedup_key())
 
+    def test_dedup_key_computed_once_and_refreshed_on_change(self):
+        opt = self._sample_option()
+        key = opt.dedup_key()
+        self.assertIs(opt.dedup_key(), key)
+        opt.room_type = "Bronze Ensuite"
+        self.assertEqual(opt.dedup_key(), "aparto|binary-hub|bronze ensuite|2026-27|Semester 1 2026-27")
+
+    def test_is_slotted(self):
+        opt = self._sample_option()
+        self.assertFalse(hasattr(opt, "__dict__"))
+        with self.assertRaises(AttributeError):
+            opt.unexpected = 1
+
     def test_alert_lines(self):
         opt = self._sample_option(location="Bonham St, Dublin 8")
         lines = opt.alert_lines()
@@ -569,6 +668,840 @@ class TestApartoScanMocked(unittest.TestCase):
         self.assertEqual(results, [])
 
 
+def _term(term_id, name="Binary Hub - 26/27 - 41 Weeks"):
+    return StarRezTerm(
+        term_id=term_id, term_name=name, property_name=name.split(" - ")[0],
+        start_date="", end_date="",
+        start_iso=None, end_iso=None, weeks=41, is_target_city=False,
+        is_semester1=False, has_rooms=True, booking_url="",
+    )
+
+
+class TestStarRezTermIndex(unittest.TestCase):
+    """Test the persistent termID index and high-water-mark planning."""
+
+    PORTAL = "https://apartostudent.starrezhousing.com/StarRezPortalX"
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = JsonCache(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_empty_index_requests_full_sweep(self):
+        index = StarRezTermIndex(self.cache, self.PORTAL)
+        self.assertIsNone(index.plan(1200, 1600))
+
+    def test_plan_skips_fresh_dead_ids_and_probes_frontier(self):
+        index = StarRezTermIndex(self.cache, self.PORTAL)
+        index.record({1200: None, 1201: _term(1201), 1202: None, 1203: _term(1203)},
+                     full_sweep=True, now=1000.0)
+        ids, frontier = index.plan(1200, 1206, now=1100.0)
+        self.assertEqual(frontier, 1204)
+        self.assertEqual(ids, [1201, 1203, 1204, 1205, 1206])
+
+    def test_plan_reprobes_unprobed_gaps(self):
+        index = StarRezTermIndex(self.cache, self.PORTAL)
+        index.record({1200: None, 1203: _term(1203)}, full_sweep=True, now=1000.0)
+        ids, _ = index.plan(1200, 1203, now=1100.0)
+        self.assertEqual(ids, [1201, 1202, 1203])
+
+    def test_dead_rechecks_are_staggered(self):
+        index = StarRezTermIndex(self.cache, self.PORTAL, dead_recheck_seconds=1000)
+        dead = {tid: None for tid in range(1200, 1300)}
+        index.record({**dead, 1300: _term(1300)}, full_sweep=True, now=0.0)
+        ids, _ = index.plan(1200, 1300, now=1000.0)
+        rechecked = [tid for tid in ids if tid < 1300]
+        self.assertTrue(0 < len(rechecked) < 100)
+        ids, _ = index.plan(1200, 1300, now=1300.0)
+        self.assertEqual(len([tid for tid in ids if tid < 1300]), 100)
+
+    def test_stale_index_requests_full_sweep(self):
+        index = StarRezTermIndex(self.cache, self.PORTAL, max_age_seconds=100)
+        index.record({1201: _term(1201)}, full_sweep=True, now=0.0)
+        self.assertIsNone(index.plan(1200, 1300, now=101.0))
+
+    def test_save_and_reload(self):
+        index = StarRezTermIndex(self.cache, self.PORTAL)
+        index.record({1200: None, 1201: _term(1201)}, full_sweep=True)
+        index.save()
+        reloaded = StarRezTermIndex(self.cache, self.PORTAL)
+        self.assertEqual(set(reloaded.valid), {1201})
+        self.assertEqual(set(reloaded.dead), {1200})
+        self.assertEqual(reloaded.high_water_mark, 1201)
+
+    def test_scan_uses_index_and_skips_transient_failures(self):
+        index = StarRezTermIndex(self.cache, self.PORTAL)
+        index.record({tid: None for tid in range(1200, 1210)}, full_sweep=True)
+        index.record({1210: _term(1210)}, full_sweep=False)
+        probed = []
+
+        def fake_probe(tid):
+            probed.append(tid)
+            if tid == 1211:
+                raise _TransientProbeError("503")
+            return _term(tid) if tid in (1210, 1212) else None
+
+        scraper = StarRezScraper(MagicMock(), self.PORTAL, term_index=index)
+        with patch.object(scraper, "_establish_session", return_value=True), \
+                patch.object(scraper, "_probe", side_effect=fake_probe):
+            terms = scraper.scan_term_range(
+                {"binary hub"}, {}, start_id=1200, end_id=1300, delay=0,
+            )
+
+        self.assertEqual([t.term_id for t in terms], [1210, 1212])
+        self.assertNotIn(1205, probed)
+        self.assertLess(max(probed), 1300)
+        self.assertNotIn(1211, index.valid)
+        self.assertNotIn(1211, index.dead)
+        self.assertEqual(index.high_water_mark, 1212)
+
+
+class TestStarRezFrontierDiscovery(unittest.TestCase):
+    """Test galloping termID frontier discovery past the default range."""
+
+    PORTAL = "https://apartostudent.starrezhousing.com/StarRezPortalX"
+
+    def _scan(self, live_ids, **kwargs):
+        probed = []
+
+        def fake_probe(tid):
+            probed.append(tid)
+            return _term(tid) if tid in live_ids else None
+
+        scraper = StarRezScraper(MagicMock(), self.PORTAL)
+        with patch.object(scraper, "_establish_session", return_value=True), \
+                patch.object(scraper, "_probe", side_effect=fake_probe):
+            terms = scraper.scan_term_range({"binary hub"}, {}, delay=0, **kwargs)
+        return sorted({t.term_id for t in terms}), probed
+
+    def test_soft_end_extends_to_live_frontier(self):
+        live = set(range(1210, 1900, 7))
+        found, probed = self._scan(live)
+        self.assertEqual(found, sorted(live))
+        self.assertLess(max(probed), 1900 + 2 * DEFAULT_TERM_SCAN_MAX_CONSECUTIVE_MISSES)
+
+    def test_configured_end_is_a_hard_bound(self):
+        live = set(range(1500, 1900, 7))
+        found, probed = self._scan(live, start_id=1500, end_id=1600)
+        self.assertEqual(found, sorted(t for t in live if t <= 1600))
+        self.assertLessEqual(max(probed), 1600)
+
+    def test_no_extension_when_frontier_is_inside_range(self):
+        found, probed = self._scan({1250, 1260})
+        self.assertEqual(found, [1250, 1260])
+        self.assertLessEqual(max(probed), 1600)
+
+
+class TestApartoProbeBookingReuse(unittest.TestCase):
+    """probe_booking reuses the last sweep and re-checks only its termID."""
+
+    def setUp(self):
+        patcher = patch("student_rooms.providers.aparto._discover_city_properties", return_value=[
+            {"slug": "binary-hub", "name": "Binary Hub", "location": "Dublin 8",
+             "url": "https://apartostudent.com/locations/dublin/binary-hub"},
+        ])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.provider = ApartoProvider(city="Dublin")
+        self.option = RoomOption(
+            provider="aparto", property_name="Binary Hub", property_slug="binary-hub",
+            room_type="Gold Ensuite", price_weekly=None, price_label="", available=True,
+            booking_url=None, start_date=None, end_date=None, academic_year="2026-27",
+            option_name="Binary Hub - 26/27 - 41 Weeks", raw={"term_id": 1267},
+        )
+
+    def _probe_booking(self, probe_result):
+        with patch.object(StarRezScraper, "scan_term_range", return_value=[_term(1267), _term(1270)]) as sweep, \
+                patch.object(StarRezScraper, "_establish_session", return_value=True), \
+                patch.object(StarRezScraper, "_probe", side_effect=probe_result) as probe:
+            self.provider._sweep_terms(self.provider._make_scraper(COUNTRY_PORTAL_MAP["Ireland"]["portal_base"]))
+            result = self.provider.probe_booking(self.option)
+        return result, sweep, probe
+
+    def test_fresh_snapshot_rechecks_single_term(self):
+        result, sweep, probe = self._probe_booking(lambda tid: _term(tid, "Binary Hub - 26/27 - 40 Weeks"))
+        self.assertEqual(sweep.call_count, 1)
+        probe.assert_called_once_with(1267)
+        self.assertEqual(result["match"]["termName"], "Binary Hub - 26/27 - 40 Weeks")
+        self.assertEqual(result["portalState"]["termCount"], 2)
+
+    def test_dead_term_is_dropped_and_transient_failure_keeps_snapshot(self):
+        result, _, _ = self._probe_booking(lambda tid: None)
+        self.assertEqual(result["match"]["termName"], "N/A")
+        self.assertEqual(result["portalState"]["termCount"], 1)
+
+        self.provider._last_terms = [_term(1267)]
+        result, _, _ = self._probe_booking(_TransientProbeError("503"))
+        self.assertEqual(result["match"]["termName"], "Binary Hub - 26/27 - 41 Weeks")
+
+    def test_stale_snapshot_triggers_full_sweep(self):
+        with patch.object(StarRezScraper, "scan_term_range", return_value=[_term(1267)]) as sweep:
+            self.provider.probe_booking(self.option)
+            self.provider._last_terms_at -= 3600
+            self.provider.probe_booking(self.option)
+        self.assertEqual(sweep.call_count, 2)
+
+
+SAMPLE_TERM_PAGE = """
+<!DOCTYPE html>
+<html>
+<head><title>Choose your room</title>
+<script>var template = '<span>&euro;</span>';</script>
+</head>
+<body>
+<h1>Choose your room</h1>
+<div class="page-container" data-termid="1267" data-datestart="2026-08-29T00:00:00" data-dateend='2027-06-12T00:00:00'>
+  <p>You have selected 'Binary Hub - 26/27 - 41 Weeks' booking term.
+  This term begins on 29/08/2026 and ends on 12/06/2027.</p>
+  {rooms}
+</div>
+</body>
+</html>
+"""
+
+
+class TestStarRezTermPageParser(unittest.TestCase):
+    """The regex term page parser must agree with the BeautifulSoup one."""
+
+    PAGES = {
+        "room_result": '<div class="Room-Result">Gold Ensuite</div>',
+        "euro_text": "<span>From &euro;289 per week</span>",
+        "pound_text": "<span>From £189 per week</span>",
+        "roombaseid": '<div data-roombaseid="88"></div>',
+        "no_rooms": "<p>No rooms are currently available.</p>",
+        "currency_in_attribute_only": '<img alt="€" title="&pound;">',
+        "currency_in_comment_only": "<!-- €250 -->",
+    }
+
+    def test_parity_with_soup_parser(self):
+        for label, rooms in self.PAGES.items():
+            page = SAMPLE_TERM_PAGE.replace("{rooms}", rooms)
+            with self.subTest(page=label):
+                self.assertEqual(_parse_term_page(page), parse_term_page_soup(page))
+        no_rooms = SAMPLE_TERM_PAGE.replace("{rooms}", self.PAGES["no_rooms"])
+        self.assertFalse(_parse_term_page(no_rooms).has_rooms)
+
+    def test_extracts_term_fields(self):
+        page = _parse_term_page(SAMPLE_TERM_PAGE.replace("{rooms}", self.PAGES["euro_text"]))
+        self.assertEqual(page.term_name, "Binary Hub - 26/27 - 41 Weeks")
+        self.assertEqual((page.start_date, page.end_date), ("29/08/2026", "12/06/2027"))
+        self.assertEqual((page.start_iso, page.end_iso), ("2026-08-29", "2027-06-12"))
+        self.assertTrue(page.has_rooms)
+
+    def test_page_without_term_container(self):
+        page = "<html><body><h1>Choose your room</h1></body></html>"
+        self.assertEqual(_parse_term_page(page), parse_term_page_soup(page))
+        self.assertIsNone(_parse_term_page(page).start_iso)
+
+
+ROOM_LISTING = """
+<div class="room-result" data-roombaseid="88">
+  <h3 class="title">Gold Ensuite</h3>
+  <p>Double bed, private bathroom</p>
+  <span class="price">&euro;329.00 per week</span>
+  <span>3 rooms available</span>
+  <a data-roombaseid="88" href="/Select?roomBaseID=88">Select</a>
+</div>
+<div class="room-result" data-roombaseid="89">
+  <h3 class="title">Bronze Ensuite</h3>
+  <span class="price">€12,177.00</span>
+  <span>Sold out</span>
+</div>
+<div class="room-result" data-roombaseid="90">
+  <h3 class="title">Gold Ensuite</h3>
+  <span class="price">€319 p/w</span>
+  <span>Available: 2</span>
+</div>
+"""
+
+
+class TestStarRezRoomResults(unittest.TestCase):
+    """Room types, prices and availability come from the term page itself."""
+
+    def test_parses_room_cards(self):
+        page = SAMPLE_TERM_PAGE.replace("{rooms}", ROOM_LISTING)
+        rooms = _parse_term_page(page).rooms
+        self.assertEqual(
+            [(r["room_type"], r["price_weekly"], r["price_label"], r["available"]) for r in rooms],
+            [("Gold Ensuite", 319.0, "€319/week", 5),
+             ("Bronze Ensuite", 297.0, "€12177 total", 0)],
+        )
+        self.assertEqual(rooms[0]["room_base_id"], "88")
+        self.assertEqual(parse_term_page_soup(page), _parse_term_page(page))
+
+    def test_price_formats(self):
+        cases = {
+            "<span>£189 pw</span>": (189.0, "£189/week"),
+            "<span>€950 per month</span>": (219.4, "€950/month"),
+            "<span>€1.050,50 /month</span>": (242.61, "€1050/month"),
+            "<span>€45 per night</span>": (315.0, "€45/night"),
+            "<span>No price yet</span>": (None, "price N/A"),
+        }
+        for markup, expected in cases.items():
+            with self.subTest(markup=markup):
+                page = f'<div data-roombaseid="1"><h4>Studio</h4>{markup}</div>'
+                room = _parse_room_results(page, weeks=41)[0]
+                self.assertEqual((room["price_weekly"], room["price_label"]), expected)
+
+    def test_no_cards_no_rooms(self):
+        page = SAMPLE_TERM_PAGE.replace("{rooms}", "<span>From &euro;289 per week</span>")
+        self.assertEqual(_parse_term_page(page).rooms, [])
+
+    def test_streamed_read_keeps_whole_listing(self):
+        cards = ROOM_LISTING + "".join(
+            f'<div data-roombaseid="{i}"><h3>Type {i}</h3><span>€{200 + i} per week</span>'
+            f'<p>{"x" * 3000}</p></div>'
+            for i in range(100, 140)
+        )
+        body = SAMPLE_TERM_PAGE.replace("{rooms}", cards).replace("</body>", "<footer>" + "y" * 300_000 + "</footer></body>")
+        resp = _StreamedResponse(body)
+        text = _read_term_page(resp)
+        self.assertLess(resp.pulled, len(body.encode("utf-8")) - 200_000)
+        self.assertEqual(len(_parse_term_page(text).rooms), 42)
+
+
+class TestApartoEnrichment(unittest.TestCase):
+    """Property pages are only fetched for terms whose StarRez page listed no rooms."""
+
+    PROPERTIES = [
+        {"slug": slug, "name": name, "location": "Dublin",
+         "url": f"https://apartostudent.com/locations/dublin/{slug}"}
+        for slug, name in (("binary-hub", "Binary Hub"), ("the-loom", "The Loom"), ("dorset-point", "Dorset Point"))
+    ]
+    STARREZ_ROOMS = [{"room_type": "Gold Ensuite", "price_label": "€329/week", "price_weekly": 329.0,
+                      "available": 3, "room_base_id": "88"}]
+
+    def _scan(self, terms):
+        provider = ApartoProvider(city="Dublin")
+        with patch("student_rooms.providers.aparto._discover_city_properties", return_value=self.PROPERTIES), \
+                patch("student_rooms.providers.aparto._fetch", return_value=SAMPLE_PROPERTY_HTML) as fetch, \
+                patch("student_rooms.providers.aparto.PROPERTY_FETCH_MIN_INTERVAL", 0), \
+                patch.object(StarRezScraper, "scan_term_range", return_value=terms):
+            results = provider.scan(academic_year="2026-27", apply_semester_filter=False)
+        return results, [call.args[1] for call in fetch.call_args_list]
+
+    def test_starrez_rooms_skip_property_pages(self):
+        term = _term(1267, "The Loom - 26/27 - Semester 1")
+        term.rooms = self.STARREZ_ROOMS
+        results, fetched = self._scan([term])
+        self.assertEqual(fetched, [])
+        self.assertEqual([(r.room_type, r.price_weekly, r.available) for r in results],
+                         [("Gold Ensuite", 329.0, True)])
+        self.assertEqual(results[0].raw["price_source"], "starrez")
+        self.assertEqual(results[0].raw["rooms_available"], 3)
+
+    def test_fallback_fetches_only_properties_without_rooms(self):
+        priced = _term(1267, "The Loom - 26/27 - Semester 1")
+        priced.rooms = self.STARREZ_ROOMS
+        unpriced = _term(1268, "Binary Hub - 26/27 - Semester 1")
+        results, fetched = self._scan([priced, unpriced])
+        self.assertEqual(fetched, ["https://apartostudent.com/locations/dublin/binary-hub"])
+        sources = {(r.property_slug, r.raw["price_source"]) for r in results}
+        self.assertEqual(sources, {("the-loom", "starrez"), ("binary-hub", "site")})
+
+    def test_sold_out_rooms_are_not_available(self):
+        term = _term(1267, "The Loom - 26/27 - Semester 1")
+        term.rooms = [dict(self.STARREZ_ROOMS[0], available=0)]
+        results, _ = self._scan([term])
+        self.assertFalse(results[0].available)
+
+    def test_rate_limiter_spaces_request_starts(self):
+        limiter = _RateLimiter(0.05)
+        starts = []
+
+        def worker():
+            limiter.wait()
+            starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
+
+
+class TestApartoPropertyDiscoveryCache(unittest.TestCase):
+    """Discovered properties are served from disk and refreshed in the background."""
+
+    PROPS = [{"slug": "binary-hub", "name": "Binary Hub", "location": "Dublin 8",
+              "url": "https://apartostudent.com/locations/dublin/binary-hub"}]
+    NEW_PROPS = PROPS + [{"slug": "the-loom", "name": "The Loom", "location": "Dublin 8",
+                          "url": "https://apartostudent.com/locations/dublin/the-loom"}]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = JsonCache(self._tmp.name)
+
+    def _discover(self, returns):
+        provider = ApartoProvider(city="Dublin", cache=self.cache)
+        with patch("student_rooms.providers.aparto._discover_city_properties", return_value=returns) as discover:
+            names = [p["name"] for p in provider.discover_properties()]
+            provider.wait_for_background(2)
+        return provider, names, discover.call_count
+
+    def _age_entry(self, seconds):
+        entry = self.cache.get_entry("aparto/properties/dublin")
+        return patch.object(self.cache, "get_entry",
+                            return_value=CacheEntry(entry.value, entry.stored_at - seconds))
+
+    def test_second_process_skips_city_page(self):
+        _, names, calls = self._discover(self.PROPS)
+        self.assertEqual((names, calls), (["Binary Hub"], 1))
+
+        provider, names, calls = self._discover(self.NEW_PROPS)
+        self.assertEqual((names, calls), (["Binary Hub"], 0))
+        self.assertEqual(provider._property_aliases, _build_property_aliases(self.PROPS))
+
+    def test_stale_entry_used_then_refreshed_in_background(self):
+        self._discover(self.PROPS)
+        with self._age_entry(8 * 24 * 3600):
+            provider, names, calls = self._discover(self.NEW_PROPS)
+        self.assertEqual((names, calls), (["Binary Hub"], 1))
+
+        provider._ensure_properties_discovered()
+        self.assertEqual(provider._property_names, {"Binary Hub", "The Loom"})
+        _, names, calls = self._discover(self.PROPS)
+        self.assertEqual((names, calls), (["Binary Hub", "The Loom"], 0))
+
+    def test_expired_entry_only_used_when_discovery_fails(self):
+        self._discover(self.PROPS)
+        with self._age_entry(120 * 24 * 3600):
+            _, names, calls = self._discover(self.NEW_PROPS)
+            self.assertEqual((names, calls), (["Binary Hub", "The Loom"], 1))
+        with self._age_entry(120 * 24 * 3600):
+            _, names, _ = self._discover([])
+        self.assertEqual(names, ["Binary Hub", "The Loom"])
+
+
+class TestApartoPropertyPageCache(unittest.TestCase):
+    """Parsed property pages are reused when the page has not changed."""
+
+    PROP = {"slug": "binary-hub", "name": "Binary Hub", "location": "Dublin 8",
+            "url": "https://apartostudent.com/locations/dublin/binary-hub"}
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.provider = ApartoProvider(city="Dublin", cache=JsonCache(self._tmp.name))
+
+    @staticmethod
+    def _response(status, html="", headers=None):
+        resp = MagicMock(status_code=status, text=html, content=html.encode("utf-8"))
+        resp.headers = headers or {}
+        return resp
+
+    def _scrape(self, response):
+        with patch("student_rooms.providers.aparto._fetch_response", return_value=response) as fetch, \
+                patch("student_rooms.providers.aparto._parse_property_page",
+                      wraps=_parse_property_page) as parse:
+            rooms = self.provider._scrape_property(self.PROP)
+        return rooms, fetch.call_args.kwargs["extra_headers"], parse.call_count
+
+    def test_not_modified_skips_parsing(self):
+        rooms, sent, parses = self._scrape(self._response(200, SAMPLE_PROPERTY_HTML, {"ETag": '"v1"'}))
+        self.assertEqual((len(rooms), sent, parses), (4, {}, 1))
+
+        rooms, sent, parses = self._scrape(self._response(304))
+        self.assertEqual(sent, {"If-None-Match": '"v1"'})
+        self.assertEqual((len(rooms), parses), (4, 0))
+        self.assertEqual(rooms[0]["property_slug"], "binary-hub")
+
+    def test_unchanged_content_hash_skips_parsing(self):
+        self._scrape(self._response(200, SAMPLE_PROPERTY_HTML, {"Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}))
+        rooms, sent, parses = self._scrape(self._response(200, SAMPLE_PROPERTY_HTML))
+        self.assertEqual(sent, {"If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT"})
+        self.assertEqual((len(rooms), parses), (4, 0))
+
+        rooms, _, parses = self._scrape(self._response(200, "<html><body>Sold out</body></html>"))
+        self.assertEqual(parses, 1)
+        self.assertNotEqual(len(rooms), 4)
+
+    def _entry_path(self):
+        directory = self.provider._cache.directory
+        (name,) = os.listdir(directory)
+        return os.path.join(directory, name)
+
+    def _read_entry(self):
+        with open(self._entry_path(), encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def test_content_hash_hit_keeps_parse_time_so_ttl_applies(self):
+        self._scrape(self._response(200, SAMPLE_PROPERTY_HTML, {"ETag": '"v1"'}))
+        parsed_at = self._read_entry()["stored_at"]
+
+        self._scrape(self._response(200, SAMPLE_PROPERTY_HTML, {"ETag": '"v2"'}))
+        stored = self._read_entry()
+        self.assertEqual(stored["stored_at"], parsed_at)
+        self.assertEqual(stored["value"]["etag"], '"v2"')
+
+        stored["stored_at"] = time.time() - PROPERTY_PAGE_CACHE_TTL_SECONDS - 1
+        with open(self._entry_path(), "w", encoding="utf-8") as fh:
+            json.dump(stored, fh)
+        _, sent, parses = self._scrape(self._response(200, SAMPLE_PROPERTY_HTML, {"ETag": '"v2"'}))
+        self.assertEqual((sent, parses), ({}, 1))
+
+    def test_parser_version_mismatch_is_a_miss(self):
+        self._scrape(self._response(200, SAMPLE_PROPERTY_HTML, {"ETag": '"v1"'}))
+        with patch("student_rooms.providers.aparto.PROPERTY_PAGE_PARSER_VERSION", -1):
+            _, sent, parses = self._scrape(self._response(200, SAMPLE_PROPERTY_HTML, {"ETag": '"v1"'}))
+        self.assertEqual((sent, parses), ({}, 1))
+
+    def test_fetch_failure_falls_back_to_cached_rooms(self):
+        self._scrape(self._response(200, SAMPLE_PROPERTY_HTML))
+        rooms, _, _ = self._scrape(None)
+        self.assertEqual(len(rooms), 4)
+
+
+def _linear_is_target(term_name, names, aliases):
+    """The original per-term linear scan, kept as the matcher's reference."""
+    prop_norm = _normalise_name(_extract_property_name(term_name))
+    for known in names:
+        known_norm = _normalise_name(known)
+        if known_norm in prop_norm or prop_norm in known_norm:
+            return True
+    for alias in aliases:
+        if alias == prop_norm or prop_norm.startswith(alias + " "):
+            return True
+        term_start = _normalise_name(term_name.split("-")[0].strip() if "-" in term_name else term_name)
+        if alias == term_start:
+            return True
+    return False
+
+
+def _linear_match(property_name, properties, aliases):
+    prop_lookup = {_normalise_name(p["name"]): p for p in properties}
+    term_norm = _normalise_name(property_name)
+    for norm, info in prop_lookup.items():
+        if norm in term_norm or term_norm in norm:
+            return info
+    canonical = aliases.get(term_norm) if aliases else None
+    if canonical:
+        for norm, info in prop_lookup.items():
+            if _normalise_name(canonical) == norm:
+                return info
+    return None
+
+
+class TestPropertyMatcher(unittest.TestCase):
+    """The precomputed matcher must agree with the original linear scans."""
+
+    WORDS = ["Binary", "Hub", "The", "Loom", "Pallars", "Cristobal", "de", "Moura",
+             "PA", "CdM", "Giovenale", "Hub's", "Dorset", "Point", "aparto", "B"]
+
+    def _name(self, rng):
+        return " ".join(rng.choice(self.WORDS) for _ in range(rng.randint(1, 3)))
+
+    def test_parity_with_linear_matching(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            properties = [
+                {"slug": f"p{i}", "name": self._name(rng)} for i in range(rng.randint(0, 6))
+            ]
+            names = {p["name"] for p in properties}
+            aliases = _build_property_aliases(properties)
+            matcher = _PropertyMatcher(names, aliases, properties)
+            for _ in range(10):
+                prop = self._name(rng)
+                term = rng.choice([
+                    f"{prop} - 26/27 - 41 Weeks",
+                    f"{prop} -26/27-Semester 1",
+                    f"aparto {prop}-September 2024",
+                    prop,
+                ])
+                self.assertEqual(
+                    matcher.is_target_city_term(term),
+                    _linear_is_target(term, names, aliases),
+                    (term, properties),
+                )
+                self.assertIs(
+                    matcher.match_property(_extract_property_name(term)),
+                    _linear_match(_extract_property_name(term), properties, aliases),
+                )
+
+    def test_match_prefers_discovery_order(self):
+        properties = [{"slug": "hub", "name": "Hub"}, {"slug": "binary-hub", "name": "Binary Hub"}]
+        matcher = _PropertyMatcher({p["name"] for p in properties}, {}, properties)
+        self.assertEqual(matcher.match_property("Binary Hub")["slug"], "hub")
+        self.assertIsNone(matcher.match_property("Giovenale"))
+
+
+class TestAimdController(unittest.TestCase):
+    """Adaptive concurrency for StarRez probing."""
+
+    def test_grows_by_one_per_healthy_window(self):
+        controller = _AimdController(initial=4, maximum=6, pace=0.04)
+        for _ in range(4):
+            controller.record(0.1)
+        self.assertEqual(controller.limit, 5)
+        self.assertEqual(controller.pace, 0.02)
+        for _ in range(50):
+            controller.record(0.1)
+        self.assertEqual(controller.limit, 6)
+
+    def test_halves_once_per_window_on_throttling(self):
+        controller = _AimdController(initial=8, pace=0)
+        controller.record(0.1, status=429, failed=True)
+        controller.record(0.1, status=503, failed=True)
+        self.assertEqual(controller.limit, 4)
+        self.assertGreater(controller.pace, 0)
+        for _ in range(8):
+            controller.record(0.1)
+        controller.record(0.1, failed=True)
+        self.assertEqual(controller.limit, 2)
+        self.assertEqual(controller.stats()["decreases"], 2)
+
+    def test_slow_responses_back_off_but_client_errors_do_not(self):
+        controller = _AimdController(initial=8, slow_seconds=2.0)
+        controller.record(0.1, status=403, failed=True)
+        self.assertEqual(controller.limit, 8)
+        controller.record(3.0)
+        self.assertEqual(controller.limit, 4)
+
+    def test_scan_backs_off_when_portal_throttles(self):
+        scraper = StarRezScraper(MagicMock(), "https://apartostudent.starrezhousing.com/StarRezPortalX")
+
+        def fake_probe(tid):
+            if tid % 3 == 0:
+                raise _TransientProbeError("HTTP 429", status=429)
+            return None
+
+        with patch.object(scraper, "_establish_session", return_value=True), \
+                patch.object(scraper, "_probe", side_effect=fake_probe), \
+                patch("student_rooms.providers.aparto.PROBE_PACE_MAX_SECONDS", 0):
+            scraper.scan_term_range({"binary hub"}, {}, start_id=1200, end_id=1260, delay=0)
+
+        stats = scraper.probe_concurrency_stats()
+        self.assertGreater(stats["decreases"], 0)
+        self.assertLess(stats["limit"], 8)
+
+
+class TestApartoMultiCity(unittest.TestCase):
+    """One StarRez sweep per regional portal, shared between cities."""
+
+    CITY_PROPERTIES = {
+        "dublin": [{"slug": "binary-hub", "name": "Binary Hub", "location": "Dublin 8",
+                    "url": "https://apartostudent.com/locations/dublin/binary-hub"}],
+        "barcelona": [{"slug": "pallars", "name": "Pallars", "location": "Poblenou",
+                       "url": "https://apartostudent.com/locations/barcelona/pallars"}],
+        "glasgow": [{"slug": "ard-grianan", "name": "Ard Grianan", "location": "Glasgow",
+                     "url": "https://apartostudent.com/locations/glasgow/ard-grianan"}],
+    }
+    PORTAL_TERMS = {
+        PORTAL_IE_BASE: ["Binary Hub - 26/27 - Semester 1", "Pallars - 26/27 - Semester 1",
+                         "Giovenale - 26/27 - Semester 1"],
+        PORTAL_UK_BASE: ["Ard Grianan - 26/27 - Semester 1"],
+    }
+
+    @patch("student_rooms.providers.aparto._fetch", return_value=None)
+    @patch("student_rooms.providers.aparto._discover_city_properties")
+    def test_sweeps_each_portal_once_and_assigns_cities(self, mock_discover, mock_fetch):
+        mock_discover.side_effect = lambda session, slug: self.CITY_PROPERTIES[slug]
+        provider = ApartoMultiCityProvider(["Dublin", "Barcelona", "Glasgow", "dublin"])
+        swept = []
+
+        def sweep(scraper, *args, **kwargs):
+            swept.append(scraper.portal_base)
+            matcher = kwargs["matcher"]
+            return [
+                _term(1000 + i, name)
+                for i, name in enumerate(self.PORTAL_TERMS[scraper.portal_base])
+                if matcher.is_target_city_term(name)
+            ]
+
+        with patch.object(StarRezScraper, "scan_term_range", autospec=True, side_effect=sweep):
+            results = provider.scan(academic_year="2026-27", apply_semester_filter=False)
+
+        self.assertEqual(sorted(swept), sorted([PORTAL_IE_BASE, PORTAL_UK_BASE]))
+        by_city = {(r.raw["city"], r.property_slug) for r in results}
+        self.assertEqual(by_city, {
+            ("Dublin", "binary-hub"), ("Barcelona", "pallars"), ("Glasgow", "ard-grianan"),
+        })
+
+
+def _establish_fake(session, country_id):
+    session.cookies.set("StarRezPortal", f"token-{country_id}", domain="portal.apartostudent.com", path="/")
+    return True
+
+
+def _page(text, url="https://apartostudent.starrezhousing.com/StarRezPortal/RoomSearch", headers=None):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = text.encode("utf-8")
+    resp._content_consumed = True
+    resp.encoding = "utf-8"
+    resp.url = url
+    resp.headers.update(headers or {})
+    return resp
+
+
+class TestStarRezSessionPool(unittest.TestCase):
+    """Pooled StarRez sessions: persistence, expiry and re-establishment."""
+
+    PORTAL = "https://apartostudent.starrezhousing.com/StarRezPortal"
+    TERM_PAGE = (
+        "<h1>Choose your room</h1><p>You have selected 'Binary Hub - 26/27 - 41 Weeks' booking term. "
+        "It begins on 29/08/2026 and ends on 12/06/2027.</p>"
+    )
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = JsonCache(self._tmp.name)
+
+    @patch("student_rooms.providers.aparto._establish_starrez_session", side_effect=_establish_fake)
+    def test_cookies_are_persisted_and_restored(self, establish):
+        pool = StarRezSessionPool("1", size=2, cache=self.cache)
+        self.assertTrue(pool.ensure_ready())
+        pool.acquire()
+        pool.acquire()
+        self.assertEqual(establish.call_count, 2)
+
+        restored = StarRezSessionPool("1", size=2, cache=self.cache)
+        self.assertEqual(restored.restored, 2)
+        self.assertTrue(restored.ensure_ready())
+        session = restored.acquire()
+        self.assertEqual(session.cookies.get("StarRezPortal"), "token-1")
+        self.assertEqual(establish.call_count, 2)
+
+    @patch("student_rooms.providers.aparto._establish_starrez_session", side_effect=_establish_fake)
+    def test_expired_session_is_reestablished_and_probe_retried(self, establish):
+        session = requests.Session()
+        pool = StarRezSessionPool("1", size=1, cache=self.cache, session=session)
+        scraper = StarRezScraper(session, self.PORTAL, country_id="1", pool=pool)
+        responses = [
+            _page("<form><input name='CheckOrderList'></form>", url="https://portal.apartostudent.com/Choose_Your_Country"),
+            _page(self.TERM_PAGE),
+        ]
+        with patch.object(session, "get", side_effect=responses):
+            term = scraper.probe_term(1267)
+        self.assertEqual(term.term_name, "Binary Hub - 26/27 - 41 Weeks")
+        self.assertEqual(pool.expired, 1)
+        self.assertEqual(establish.call_count, 2)
+
+    @patch("student_rooms.providers.aparto.STARREZ_SESSION_CANARY_MISSES", 3)
+    @patch("student_rooms.providers.aparto._establish_starrez_session", side_effect=_establish_fake)
+    def test_canary_detects_silently_expired_session(self, establish):
+        session = requests.Session()
+        pool = StarRezSessionPool("1", size=1, session=session)
+        scraper = StarRezScraper(session, self.PORTAL, country_id="1", pool=pool)
+        miss = _page("<p>Nothing here</p>")
+        responses = [_page(self.TERM_PAGE), miss, miss, miss, miss, _page(self.TERM_PAGE)]
+        with patch.object(session, "get", side_effect=responses):
+            self.assertIsNotNone(scraper.probe_term(1267))
+            self.assertIsNone(scraper.probe_term(1268))
+            self.assertIsNone(scraper.probe_term(1269))
+            self.assertEqual(pool.expired, 0)
+            # The third miss triggers a canary re-probe of 1267, which also
+            # misses: the session is re-established and 1270 probed again
+            self.assertIsNotNone(scraper.probe_term(1270))
+        self.assertEqual(pool.expired, 1)
+        self.assertEqual(establish.call_count, 2)
+
+
+class _StreamedResponse:
+    """Minimal streamed response recording how many bytes were pulled."""
+
+    def __init__(self, body, content_length=None):
+        self._body = body.encode("utf-8")
+        self.encoding = "utf-8"
+        self.url = "https://apartostudent.starrezhousing.com/StarRezPortal/RoomSearch"
+        self.headers = {"Content-Length": str(content_length)} if content_length is not None else {}
+        self.pulled = 0
+        self.closed = False
+        self._offset = 0
+
+    def iter_content(self, chunk_size):
+        while self._offset < len(self._body):
+            chunk = self._body[self._offset:self._offset + chunk_size]
+            self._offset += len(chunk)
+            self.pulled += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class TestStreamedTermPageRead(unittest.TestCase):
+    """Term probes stop reading once every parsed field has been seen."""
+
+    HEAD = SAMPLE_TERM_PAGE.split("{rooms}")[0] + '<div class="room-result">Gold Ensuite</div>'
+    TAIL = "<p>" + "x" * 400_000 + "</p></div></body></html>"
+
+    def test_stops_after_markers_and_parses_like_full_page(self):
+        body = self.HEAD + self.TAIL
+        resp = _StreamedResponse(body)
+        text = _read_term_page(resp)
+        self.assertLess(resp.pulled, 64 * 1024)
+        self.assertTrue(resp.closed)
+        self.assertEqual(_parse_term_page(text), _parse_term_page(body))
+
+    def test_drains_small_remainder_to_keep_connection(self):
+        body = self.HEAD + "<p>footer</p>" * 2000
+        resp = _StreamedResponse(body, content_length=len(body.encode("utf-8")))
+        _read_term_page(resp)
+        self.assertEqual(resp.pulled, len(body.encode("utf-8")))
+
+    def test_page_without_room_marker_is_read_to_budget(self):
+        body = SAMPLE_TERM_PAGE.replace("{rooms}", self.TAIL + "<span>€250</span>")
+        resp = _StreamedResponse(body)
+        self.assertTrue(_parse_term_page(_read_term_page(resp)).has_rooms)
+
+        resp = _StreamedResponse(body)
+        text = _read_term_page(resp, budget=100_000)
+        self.assertLess(resp.pulled, 100_000 + 16 * 1024)
+        self.assertFalse(_parse_term_page(text).has_rooms)
+
+
+def _full_text_term_page_complete(text):
+    """The original whole-text completeness check, kept as the reference."""
+    if not ("Choose your room" in text and _TERM_INFO_RE.search(text) and _TERMID_TAG_RE.search(text)):
+        return False
+    last_card = None
+    for last_card in _ROOM_MARKER_RE.finditer(text):
+        pass
+    if last_card is None:
+        return False
+    tail = text[last_card.end():]
+    return len(tail) >= TERM_ROOM_LISTING_GAP_CHARS or _ROOM_LISTING_END_RE.search(tail) is not None
+
+
+class TestTermPageProgress(unittest.TestCase):
+    """The incremental check agrees with the whole-text check at every chunk."""
+
+    def test_matches_full_text_check_for_any_chunking(self):
+        head = SAMPLE_TERM_PAGE.split("{rooms}")[0]
+        pages = [
+            head + '<div class="room-result">A</div>' + "x" * 40_000 + "</div></body></html>",
+            head + ROOM_LISTING + "<footer>f</footer>",
+            head + '<div class="room-result">A</div></body><div data-roombaseid="9">B</div>' + "y" * 5000,
+            SAMPLE_TERM_PAGE.replace("{rooms}", "no rooms here") + "</body>",
+        ]
+        rng = random.Random(7)
+        for page in pages:
+            for _ in range(5):
+                progress = _TermPageProgress()
+                pos = 0
+                while pos < len(page):
+                    step = rng.choice([1, 3, 17, 500, 4096, 16384])
+                    chunk = page[pos:pos + step]
+                    pos += len(chunk)
+                    self.assertEqual(progress.feed(chunk), _full_text_term_page_complete(page[:pos]),
+                                     f"diverged at {pos} of {len(page)}")
+
+    def test_read_is_linear_in_page_size(self):
+        body = TestStreamedTermPageRead.HEAD + "<p>" + "z" * 500_000
+        resp = _StreamedResponse(body)
+        started = time.perf_counter()
+        _read_term_page(resp, budget=10**7)
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+
 class TestStarRezTermAnalysis(unittest.TestCase):
     """Test StarRez term detection and analysis."""
 
@@ -645,5 +1578,77 @@ class TestStarRezTermAnalysis(unittest.TestCase):
         self.assertIsNone(_parse_months_from_name("Binary Hub - 26/27 - 41 Weeks"))
 
 
+# ---------------------------------------------------------------------------
+# Single-pass page extraction vs the BeautifulSoup reference
+# ---------------------------------------------------------------------------
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "aparto")
+
+
+def _fixture_pages():
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        with open(path, encoding="utf-8") as fh:
+            yield os.path.basename(path), fh.read()
+
+
+class TestSinglePassPageExtraction(unittest.TestCase):
+    def _pages(self):
+        pages = list(_fixture_pages())
+        self.assertGreaterEqual(len(pages), 4)
+        pages += [
+            ("SAMPLE_PROPERTY_HTML", SAMPLE_PROPERTY_HTML),
+            ("SAMPLE_PROPERTY_HTML_NO_PRICE", SAMPLE_PROPERTY_HTML_NO_PRICE),
+            ("SAMPLE_CITY_PAGE_HTML", SAMPLE_CITY_PAGE_HTML),
+            ("SAMPLE_BARCELONA_PAGE_HTML", SAMPLE_BARCELONA_PAGE_HTML),
+        ]
+        return pages
+
+    def test_page_text_matches_soup(self):
+        from bs4 import BeautifulSoup
+        for name, html in self._pages():
+            with self.subTest(page=name):
+                self.assertEqual(
+                    _PageScanner.scan(html).text,
+                    BeautifulSoup(html, "html.parser").get_text(separator=" "),
+                )
+
+    def test_price_extraction_matches_reference(self):
+        for name, html in self._pages():
+            with self.subTest(page=name):
+                self.assertEqual(
+                    _extract_prices_from_html(html, "Test"),
+                    extract_prices_from_html_soup(html, "Test"),
+                )
+
+    def test_city_page_matches_reference(self):
+        for name, html in self._pages():
+            for slug in ("dublin", "barcelona"):
+                with self.subTest(page=name, city=slug):
+                    self.assertEqual(_parse_city_page(html, slug), parse_city_page_soup(html, slug))
+
+    def test_city_fixture_addresses(self):
+        html = dict(_fixture_pages())["city_barcelona.html"]
+        props = {p["slug"]: p["location"] for p in _parse_city_page(html, "barcelona")}
+        self.assertEqual(props["aparto-diagonal-mar"], "Carrer de Josep Pla 55, 08019 Barcelona")
+        self.assertNotIn("short-stays", props)
+
+    def test_property_fixture_tiers(self):
+        html = dict(_fixture_pages())["property_binary_hub.html"]
+        rooms = _extract_prices_from_html(html, "Binary Hub")
+        self.assertEqual(
+            [(r["room_type"], r["price_weekly"]) for r in rooms],
+            [("Bronze Ensuite", 289.0), ("Silver Ensuite", 309.0),
+             ("Gold Ensuite", 329.0), ("Platinum Studio", 399.0)],
+        )
+
+    def test_script_and_comment_text_ignored(self):
+        html = (
+            "<div><script>var p = '€999 per week';</script><!-- Gold €1 pw -->"
+            "<a href='/locations/dublin/x-house'>X</a><p>Pearse Street Upper, Dublin 2</p></div>"
+        )
+        self.assertEqual(_PageScanner.scan(html).text.split(), ["X", "Pearse", "Street", "Upper,", "Dublin", "2"])
+        self.assertEqual(_parse_city_page(html, "dublin")[0]["location"], "Street Upper, Dublin 2")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+"""
+tests/test_cache.py — Tests for the persistent JSON cache.
+"""
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from student_rooms.cache import JsonCache, create_cache, default_cache_dir, default_data_dir
+from student_rooms.models.config import CacheConfig
+
+
+class TestJsonCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = JsonCache(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_roundtrip(self):
+        self.cache.set("yugo/cities/598930", {"items": [{"name": "Dublin"}]})
+        self.assertEqual(
+            self.cache.get("yugo/cities/598930", ttl_seconds=60),
+            {"items": [{"name": "Dublin"}]},
+        )
+
+    def test_missing_key_returns_none(self):
+        self.assertIsNone(self.cache.get("nope", ttl_seconds=60))
+        self.assertIsNone(self.cache.get_entry("nope"))
+
+    def test_expired_entry_returns_none_but_entry_is_kept(self):
+        self.cache.set("k", [1, 2, 3])
+        with patch("student_rooms.cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(self.cache.get("k", ttl_seconds=60))
+            entry = self.cache.get_entry("k")
+        self.assertEqual(entry.value, [1, 2, 3])
+
+    def test_corrupt_file_is_a_miss(self):
+        self.cache.set("k", "v")
+        path = self.cache._path("k")
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write("{not json")
+        self.assertIsNone(self.cache.get("k", ttl_seconds=60))
+
+    def test_write_is_atomic_and_leaves_no_temp_files(self):
+        self.cache.set("a/b", {"x": 1})
+        files = os.listdir(self._tmp.name)
+        self.assertEqual(len(files), 1)
+        with open(os.path.join(self._tmp.name, files[0]), encoding="utf-8") as fh:
+            self.assertEqual(json.load(fh)["value"], {"x": 1})
+
+    def test_delete(self):
+        self.cache.set("k", 1)
+        self.cache.delete("k")
+        self.assertIsNone(self.cache.get_entry("k"))
+
+
+class TestCacheFactory(unittest.TestCase):
+    def test_disabled_returns_none(self):
+        self.assertIsNone(create_cache(CacheConfig(enabled=False)))
+
+    def test_directory_override(self):
+        cache = create_cache(CacheConfig(enabled=True, directory="/tmp/sr-cache"))
+        self.assertEqual(cache.directory, "/tmp/sr-cache")
+
+    def test_default_dir_honours_xdg(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": "/tmp/xdg"}):
+            self.assertEqual(default_cache_dir(), "/tmp/xdg/student-rooms-cli")
+
+    def test_default_data_dir_honours_xdg(self):
+        with patch.dict(os.environ, {"XDG_DATA_HOME": "/tmp/xdg-data"}):
+            self.assertEqual(default_data_dir(), "/tmp/xdg-data/student-rooms-cli")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+tests/test_changes.py — Tests for watch change events.
+"""
+import unittest
+
+from student_rooms.changes import (
+    EVENT_AVAILABILITY_CHANGED,
+    EVENT_NEW,
+    EVENT_PRICE_CHANGED,
+    EVENT_REMOVED,
+    ChangeTracker,
+    diff_snapshots,
+    filter_events,
+    group_events,
+    snapshot,
+)
+from student_rooms.cli import build_change_message, build_new_options_message
+from student_rooms.models.config import FilterConfig
+from student_rooms.providers.base import RoomOption
+
+
+def _option(room_type="Gold Ensuite", provider="yugo", **overrides):
+    defaults = dict(
+        provider=provider,
+        property_name="Dominick Place",
+        property_slug="dominick-place",
+        room_type=room_type,
+        price_weekly=250.0,
+        price_label="€250/week",
+        available=True,
+        booking_url="https://example.com/book",
+        start_date="2026-09-01",
+        end_date="2027-01-31",
+        academic_year="2026-27",
+        option_name="Semester 1",
+    )
+    defaults.update(overrides)
+    return RoomOption(**defaults)
+
+
+class TestDiffSnapshots(unittest.TestCase):
+    def test_no_changes(self):
+        snap = snapshot([_option(), _option("Studio")])
+        self.assertEqual(diff_snapshots(snap, snapshot([_option(), _option("Studio")])), [])
+
+    def test_event_types(self):
+        previous = snapshot([
+            _option("Gold Ensuite"),
+            _option("Studio", available=False),
+            _option("Twodio"),
+            _option("Penthouse", price_weekly=None),
+        ])
+        current = snapshot([
+            _option("Gold Ensuite", price_weekly=240.0),
+            _option("Studio", available=True, price_weekly=300.0),
+            _option("Penthouse", price_weekly=400.0),
+            _option("Loft"),
+        ])
+        events = diff_snapshots(previous, current)
+        self.assertEqual(
+            [(e.type, e.option.room_type) for e in events],
+            [
+                (EVENT_PRICE_CHANGED, "Gold Ensuite"),
+                (EVENT_PRICE_CHANGED, "Studio"),
+                (EVENT_AVAILABILITY_CHANGED, "Studio"),
+                (EVENT_PRICE_CHANGED, "Penthouse"),
+                (EVENT_NEW, "Loft"),
+                (EVENT_REMOVED, "Twodio"),
+            ],
+        )
+        self.assertEqual(events[0].price_delta, -10.0)
+        self.assertIsNone(events[3].price_delta)
+        self.assertIn("⬇", events[0].summary_line())
+        self.assertIn("available again", events[2].summary_line())
+
+    def test_price_tolerance(self):
+        previous = snapshot([_option(price_weekly=250.0)])
+        self.assertEqual(diff_snapshots(previous, snapshot([_option(price_weekly=250.001)])), [])
+
+    def test_reappeared_flag(self):
+        loft = _option("Loft")
+        events = diff_snapshots({}, snapshot([loft, _option("Studio")]), unseen={_option("Studio").dedup_key()})
+        self.assertEqual([(e.option.room_type, e.reappeared) for e in events], [("Loft", True), ("Studio", False)])
+
+    def test_sold_out_options_are_not_new(self):
+        events = diff_snapshots({}, snapshot([_option("Studio", available=False), _option("Loft")]))
+        self.assertEqual([(e.type, e.option.room_type) for e in events], [(EVENT_NEW, "Loft")])
+
+    def test_group_events_orders_by_type(self):
+        previous = snapshot([_option("Twodio"), _option()])
+        events = diff_snapshots(previous, snapshot([_option(price_weekly=1.0), _option("Loft")]))
+        self.assertEqual(list(group_events(events)), [EVENT_NEW, EVENT_PRICE_CHANGED, EVENT_REMOVED])
+
+
+class TestChangeTracker(unittest.TestCase):
+    def test_first_scan_reports_only_unseen_options(self):
+        tracker = ChangeTracker()
+        options = [_option(), _option("Studio")]
+        events = tracker.update("yugo", options, unseen={options[1].dedup_key()})
+        self.assertEqual([(e.type, e.option.room_type) for e in events], [(EVENT_NEW, "Studio")])
+        self.assertIn("yugo", tracker)
+
+    def test_disappear_and_return(self):
+        tracker = ChangeTracker()
+        studio = _option("Studio")
+        tracker.update("yugo", [_option(), studio], unseen=set())
+        removed = tracker.update("yugo", [_option()], unseen=set())
+        self.assertEqual([e.type for e in removed], [EVENT_REMOVED])
+        back = tracker.update("yugo", [_option(), studio], unseen=set())
+        self.assertEqual([(e.type, e.reappeared) for e in back], [(EVENT_NEW, True)])
+
+    def test_sold_out_first_seen_alerts_when_bookable(self):
+        tracker = ChangeTracker()
+        sold_out = _option("Studio", available=False)
+        self.assertEqual(tracker.update("aparto", [sold_out], unseen={sold_out.dedup_key()}), [])
+        events = tracker.update("aparto", [_option("Studio")], unseen={sold_out.dedup_key()})
+        self.assertEqual([e.type for e in events], [EVENT_AVAILABILITY_CHANGED])
+        self.assertIn("available again", events[0].summary_line())
+
+    def test_providers_are_diffed_separately(self):
+        tracker = ChangeTracker()
+        tracker.update("yugo", [_option()], unseen=set())
+        events = tracker.update("aparto", [_option(provider="aparto")], unseen=set())
+        self.assertEqual(events, [])
+        self.assertEqual(tracker.update("yugo", [_option()], unseen=set()), [])
+
+
+class TestFilterEvents(unittest.TestCase):
+    def test_price_crossing_limit_is_a_price_change(self):
+        tracker = ChangeTracker()
+        filters = FilterConfig(max_weekly_price=300.0)
+        tracker.update("yugo", [_option(price_weekly=320.0)], unseen=set())
+        events = filter_events(tracker.update("yugo", [_option(price_weekly=280.0)], unseen=set()), filters)
+        self.assertEqual([(e.type, e.price_delta) for e in events], [(EVENT_PRICE_CHANGED, -40.0)])
+
+    def test_events_outside_filters_are_dropped(self):
+        filters = FilterConfig(max_weekly_price=300.0)
+        events = diff_snapshots(
+            snapshot([_option("Studio", price_weekly=400.0)]),
+            snapshot([_option("Studio", price_weekly=420.0), _option("Loft", price_weekly=350.0),
+                      _option("Twodio", price_weekly=250.0)]),
+        )
+        self.assertEqual([e.option.room_type for e in filter_events(events, filters)], ["Twodio"])
+
+
+class TestChangeMessages(unittest.TestCase):
+    def test_new_options_message_flags_reappeared(self):
+        events = diff_snapshots({}, snapshot([_option("Studio"), _option("Loft")]),
+                                unseen={_option("Studio").dedup_key()})
+        message = build_new_options_message(events)
+        self.assertIn("🚨 NEW", message)
+        self.assertIn("Back after disappearing (1)", message)
+        self.assertIn("Loft", message.split("Back after disappearing")[1])
+
+    def test_change_message(self):
+        events = diff_snapshots(snapshot([_option()]), snapshot([_option(price_weekly=199.0)]))
+        message = build_change_message(EVENT_PRICE_CHANGED, events)
+        self.assertTrue(message.startswith("💶 PRICE CHANGE"))
+        self.assertIn("€250/week → €199/week ⬇", message)
+        self.assertIn("🔗 Book: https://example.com/book", message)
+        self.assertEqual(build_change_message(EVENT_REMOVED, []), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+tests/test_cli.py — Tests for concurrent provider execution in the CLI.
+"""
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from student_rooms import cli
+from student_rooms.cli import ProviderOutcome, ProviderRunner, _scan_providers, bookable, run_providers
+from student_rooms.models.config import Config
+from student_rooms.providers.base import RoomOption
+
+
+class _FakeProvider:
+    def __init__(self, name, delay=0.0, result=None, error=None, release=None):
+        self.name = name
+        self.delay = delay
+        self.result = result if result is not None else [name]
+        self.error = error
+        self.release = release
+
+    def scan(self, **kwargs):
+        if self.release is not None:
+            self.release.wait(5)
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return list(self.result)
+
+
+class TestProviderRunner(unittest.TestCase):
+    def test_wall_time_is_slowest_provider_and_results_arrive_in_order(self):
+        providers = [_FakeProvider("aparto", delay=0.3), _FakeProvider("yugo", delay=0.05)]
+        started = time.monotonic()
+        outcomes = list(run_providers(providers, lambda p: p.scan()))
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.3 + 0.05 - 0.02)
+        self.assertEqual([o.provider.name for o in outcomes], ["yugo", "aparto"])
+        self.assertTrue(all(o.ok for o in outcomes))
+
+    def test_failure_is_isolated(self):
+        providers = [_FakeProvider("yugo", error=RuntimeError("boom")), _FakeProvider("aparto")]
+        outcomes = {o.provider.name: o for o in run_providers(providers, lambda p: p.scan())}
+        self.assertIsInstance(outcomes["yugo"].error, RuntimeError)
+        self.assertFalse(outcomes["yugo"].ok)
+        self.assertEqual(outcomes["aparto"].result, ["aparto"])
+
+    def test_timeout_reported_and_provider_stays_busy(self):
+        release = threading.Event()
+        slow = _FakeProvider("aparto", release=release)
+        fast = _FakeProvider("yugo")
+        runner = ProviderRunner()
+
+        started = time.monotonic()
+        outcomes = {o.provider.name: o for o in runner.run([slow, fast], lambda p: p.scan(), {"aparto": 0.1})}
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertTrue(outcomes["aparto"].timed_out)
+        self.assertTrue(outcomes["yugo"].ok)
+        self.assertTrue(runner.busy(slow))
+        self.assertFalse(runner.busy(fast))
+
+        release.set()
+        runner._running[id(slow)].join(2)
+        self.assertFalse(runner.busy(slow))
+
+    def test_fast_provider_reruns_while_slow_one_is_running(self):
+        release = threading.Event()
+        slow = _FakeProvider("aparto", release=release)
+        fast = _FakeProvider("yugo")
+        runner = ProviderRunner()
+        runner.start(slow, lambda p: p.scan(), 5.0)
+
+        finished = []
+        for _ in range(3):
+            runner.start(fast, lambda p: p.scan(), 5.0)
+            outcomes = runner.poll(2.0)
+            finished.extend(o.provider.name for o in outcomes)
+        self.assertEqual(finished, ["yugo", "yugo", "yugo"])
+        self.assertTrue(runner.pending())
+
+        release.set()
+        self.assertEqual([o.provider.name for o in runner.poll(2.0)], ["aparto"])
+        self.assertFalse(runner.pending())
+
+    def test_late_result_of_timed_out_call_is_discarded(self):
+        release = threading.Event()
+        slow = _FakeProvider("aparto", release=release, result=["late"])
+        runner = ProviderRunner()
+        runner.start(slow, lambda p: p.scan(), 0.05)
+        self.assertTrue(runner.poll()[0].timed_out)
+
+        release.set()
+        runner._running[id(slow)].join(2)
+        slow.result, slow.release = ["fresh"], None
+        runner.start(slow, lambda p: p.scan(), 2.0)
+        outcomes = runner.poll(2.0)
+        self.assertEqual([o.result for o in outcomes], [["fresh"]])
+
+    def test_scan_providers_merges_surviving_results(self):
+        providers = [
+            _FakeProvider("yugo", result=["y1", "y2"]),
+            _FakeProvider("aparto", error=ValueError("portal down")),
+        ]
+        with self.assertLogs("student_rooms.cli", level="ERROR"):
+            matches = _scan_providers(providers, Config(), "2026-27", True, "scan")
+        self.assertEqual(matches, ["y1", "y2"])
+
+
+class TestBackgroundWait(unittest.TestCase):
+    def test_command_waits_for_provider_background_work(self):
+        refresh = threading.Thread(target=time.sleep, args=(0.2,), daemon=True)
+
+        class _Provider(_FakeProvider):
+            def wait_for_background(self, timeout):
+                refresh.join(timeout)
+
+        def _scan(providers, *args):
+            refresh.start()
+            return []
+
+        with patch("student_rooms.cli.make_providers", return_value=[_Provider("aparto")]), \
+                patch("student_rooms.cli._scan_providers", side_effect=_scan), \
+                patch("student_rooms.cli.create_history", return_value=None):
+            self.assertEqual(cli.main(["--config", "missing.yaml", "scan"]), 0)
+        self.assertFalse(refresh.is_alive())
+
+    def test_other_commands_do_not_wait(self):
+        with patch("student_rooms.cli.wait_for_background") as wait:
+            self.assertEqual(cli.main(["--config", "missing.yaml", "test-match", "--from-year", "2026", "--to-year", "2027"]), 0)
+        wait.assert_not_called()
+
+
+class TestWatchWithoutProviders(unittest.TestCase):
+    def test_returns_error_instead_of_polling(self):
+        with patch("student_rooms.cli.make_providers", return_value=[]), \
+                patch("student_rooms.cli.SeenStore") as seen_store:
+            self.assertEqual(cli.main(["--config", "missing.yaml", "watch"]), 2)
+        seen_store.assert_not_called()
+
+
+class TestWatchSeenPruning(unittest.TestCase):
+    def _watch(self, outcomes):
+        provider = _FakeProvider("yugo", result=[])
+        seen = MagicMock()
+        seen.unseen.return_value = set()
+        polls = [[ProviderOutcome(provider, result=[])] for _ in range(outcomes)]
+        with patch("student_rooms.cli.make_providers", return_value=[provider]), \
+                patch("student_rooms.cli.SeenStore", return_value=seen), \
+                patch("student_rooms.cli.create_history", return_value=None), \
+                patch.object(ProviderRunner, "start"), \
+                patch.object(ProviderRunner, "poll", side_effect=polls + [KeyboardInterrupt()]):
+            self.assertEqual(cli.main(["--config", "missing.yaml", "watch"]), 0)
+        return seen
+
+    def test_prunes_at_start_not_after_every_scan(self):
+        seen = self._watch(3)
+        self.assertEqual(seen.record.call_count, 3)
+        self.assertEqual(seen.prune.call_count, 1)
+
+    def test_prunes_again_once_the_interval_has_passed(self):
+        with patch("student_rooms.cli.SEEN_PRUNE_INTERVAL_SECONDS", 0):
+            seen = self._watch(3)
+        self.assertEqual(seen.prune.call_count, 4)
+
+
+class TestBookable(unittest.TestCase):
+    def test_drops_sold_out_options(self):
+        def _option(room_type, available):
+            return RoomOption(
+                provider="aparto", property_name="Binary Hub", property_slug="binary-hub",
+                room_type=room_type, price_weekly=250.0, price_label="€250/week", available=available,
+                booking_url=None, start_date=None, end_date=None, academic_year="2026-27",
+                option_name="Semester 1",
+            )
+
+        options = [_option("Bronze Ensuite", False), _option("Gold Studio", True)]
+        self.assertEqual([m.room_type for m in bookable(options)], ["Gold Studio"])
+
+
+if __name__ == "__main__":
+    unittest.main()
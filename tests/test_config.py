@@ -16,6 +16,64 @@ class TestConfigLoading(unittest.TestCase):
         self.assertTrue(any("YAML parse error" in w for w in warnings))
         self.assertIsInstance(config, Config)
 
+    def test_aparto_term_bounds_default_to_discovery(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".yaml", delete=False) as tmp:
+            tmp.write("providers:\n  aparto:\n    term_id_end: 1800\n    cities: [Dublin, '', Milan]\n")
+            tmp_path = tmp.name
+
+        config, _ = load_config(tmp_path)
+        self.assertIsNone(config.providers.aparto_term_id_start)
+        self.assertEqual(config.providers.aparto_term_id_end, 1800)
+        self.assertEqual(config.providers.aparto_cities, ["Dublin", "Milan"])
+
+    def test_provider_timeouts(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".yaml", delete=False) as tmp:
+            tmp.write("providers:\n  yugo:\n    timeout_seconds: 45\n")
+            tmp_path = tmp.name
+
+        config, _ = load_config(tmp_path)
+        self.assertEqual(config.providers.yugo_timeout_seconds, 45.0)
+        self.assertEqual(config.providers.aparto_timeout_seconds, 300.0)
+
+    def test_per_provider_polling(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".yaml", delete=False) as tmp:
+            tmp.write("polling:\n  interval_seconds: 3600\n  providers:\n    yugo:\n      interval_seconds: 600\n")
+            tmp_path = tmp.name
+
+        config, _ = load_config(tmp_path)
+        self.assertEqual(config.polling.provider_interval_seconds, {"yugo": 600})
+        self.assertEqual(config.polling.schedule_for("yugo"), (600, 30))
+        self.assertEqual(config.polling.schedule_for("aparto"), (3600, 30))
+        self.assertEqual(config.polling.seen_ttl_days, 60)
+
+    def test_seen_ttl_days(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".yaml", delete=False) as tmp:
+            tmp.write("polling:\n  seen_ttl_days: 0\n")
+            tmp_path = tmp.name
+
+        config, _ = load_config(tmp_path)
+        self.assertEqual(config.polling.seen_ttl_days, 1)
+
+    def test_history_config(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".yaml", delete=False) as tmp:
+            tmp.write("history:\n  enabled: false\n  directory: /tmp/rooms-history\n")
+            tmp_path = tmp.name
+
+        config, _ = load_config(tmp_path)
+        self.assertFalse(config.history.enabled)
+        self.assertEqual(config.history.directory, "/tmp/rooms-history")
+
+    def test_notification_routes(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".yaml", delete=False) as tmp:
+            tmp.write("notifications:\n  type: telegram\n  routes:\n    price_changed: webhook\n    new: none\n")
+            tmp_path = tmp.name
+
+        config, _ = load_config(tmp_path)
+        self.assertEqual(config.notifications.route_for("price_changed"), "webhook")
+        self.assertIsNone(config.notifications.route_for("new"))
+        self.assertEqual(config.notifications.route_for("availability_changed"), "telegram")
+        self.assertIsNone(config.notifications.route_for("removed"))
+
 
 class TestAcademicYearDerivation(unittest.TestCase):
     def test_academic_year_jan_to_jul(self):
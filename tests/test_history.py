@@ -0,0 +1,155 @@
+"""
+tests/test_history.py — Tests for the scan history store and command.
+"""
+import contextlib
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from student_rooms.cli import main
+from student_rooms.history import HistoryStore
+from student_rooms.providers.base import RoomOption
+
+DAY = 86400
+NOW = datetime(2026, 10, 18, 12, tzinfo=timezone.utc).timestamp()
+
+
+def _option(property_name="Binary Hub", room_type="Bronze Ensuite", price=250.0, provider="aparto", **overrides):
+    defaults = dict(
+        provider=provider,
+        property_name=property_name,
+        property_slug=property_name.lower().replace(" ", "-"),
+        room_type=room_type,
+        price_weekly=price,
+        price_label=f"€{price}/week" if price else "",
+        available=True,
+        booking_url=None,
+        start_date="2026-09-01",
+        end_date="2027-01-31",
+        academic_year="2026-27",
+        option_name="Semester 1",
+        raw={"city": "Dublin"} if provider == "aparto" else {},
+    )
+    defaults.update(overrides)
+    return RoomOption(**defaults)
+
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.store = HistoryStore(self._tmp.name)
+        self.addCleanup(self.store.close)
+
+    def test_partitions_by_provider_city_and_day(self):
+        self.store.append([_option(), _option(provider="yugo", property_name="Dominick Place")], city="Cork", now=NOW)
+        self.store.append([_option(price=240.0)], now=NOW + 60)
+        self.store.append([_option()], now=NOW + DAY)
+
+        parts = [(p, c, d) for p, c, d, _ in self.store.partitions()]
+        self.assertEqual(parts, [
+            ("aparto", "dublin", "2026-10-18"),
+            ("aparto", "dublin", "2026-10-19"),
+            ("yugo", "cork", "2026-10-18"),
+        ])
+        path = self.store.partition_path("aparto", "Dublin", "2026-10-18")
+        records = list(self.store.read_partition(path))
+        self.assertEqual([r["price_weekly"] for r in records], [250.0, 240.0])
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            self.assertEqual(json.loads(fh.readline())["key"], _option().dedup_key())
+
+    def test_price_summary(self):
+        self.store.append([_option(price=250.0), _option("Dorset Point", price=300.0)], now=NOW - 40 * DAY)
+        self.store.append([_option(price=230.0), _option("Dorset Point", price=None)], now=NOW - 2 * DAY)
+        self.store.append([_option(price=260.0, available=False), _option("Dorset Point", price=310.0)], now=NOW)
+
+        rows = self.store.price_summary(30, now=NOW)
+        self.assertEqual([(r["property"], r["minPriceWeekly"], r["maxPriceWeekly"]) for r in rows],
+                         [("Binary Hub", 230.0, 260.0), ("Dorset Point", 310.0, 310.0)])
+        self.assertEqual(rows[0]["daysSeen"], 2)
+        self.assertEqual(rows[0]["availableShare"], 0.5)
+        self.assertEqual(rows[0]["lastSeen"], "2026-10-18")
+
+        self.assertEqual(self.store.price_summary(90, now=NOW)[0]["minPriceWeekly"], 230.0)
+        self.assertEqual(len(self.store.price_summary(30, property_name="dorset", now=NOW)), 1)
+        self.assertEqual(self.store.price_summary(30, provider="yugo", now=NOW), [])
+
+    def test_price_summary_by_room(self):
+        self.store.append([_option(price=250.0), _option(room_type="Gold Studio", price=350.0)], now=NOW)
+        rows = self.store.price_summary(7, by_room=True, now=NOW)
+        self.assertEqual([(r["roomType"], r["minPriceWeekly"]) for r in rows],
+                         [("Bronze Ensuite", 250.0), ("Gold Studio", 350.0)])
+
+    def test_releases(self):
+        self.store.append([_option()], now=NOW - 40 * DAY)
+        self.store.append([_option(), _option(room_type="Gold Studio", price=350.0)], now=NOW - 3 * DAY)
+        rows = self.store.releases(30, now=NOW)
+        self.assertEqual([(r["roomType"], r["firstSeen"]) for r in rows], [("Gold Studio", "2026-10-15")])
+
+    def test_truncated_member_does_not_hide_later_appends(self):
+        self.store.append([_option(price=250.0)], now=NOW)
+        path = self.store.partition_path("aparto", "dublin", "2026-10-18")
+        with open(path, "rb") as fh:
+            complete = fh.read()
+        with open(path, "ab") as fh:
+            fh.write(complete[: len(complete) // 2])  # killed mid-append
+        self.store.append([_option(price=240.0)], now=NOW + 60)
+
+        with self.assertLogs("student_rooms.history", level="WARNING"):
+            prices = [r["price_weekly"] for r in self.store.read_partition(path)]
+        self.assertEqual(prices, [250.0, 240.0])
+        with self.assertLogs("student_rooms.history", level="WARNING"):
+            self.assertEqual(self.store.rebuild_index(), 2)
+
+    def test_unindexed_appends_are_indexed_on_open(self):
+        self.store.append([_option(price=250.0)], now=NOW)
+        path = self.store.partition_path("aparto", "dublin", "2026-10-18")
+        with open(path, "rb") as fh:
+            member = fh.read()
+        with open(path, "ab") as fh:
+            fh.write(member)  # written, but the process died before indexing it
+        self.store.close()
+
+        reopened = HistoryStore(self._tmp.name)
+        self.addCleanup(reopened.close)
+        (row,) = reopened.price_summary(7, now=NOW)
+        self.assertEqual(row["availableShare"], 1.0)
+        scans = reopened._conn.execute("SELECT scans FROM daily").fetchone()[0]
+        self.assertEqual(scans, 2)
+        reopened.close()
+        again = HistoryStore(self._tmp.name)
+        self.addCleanup(again.close)
+        self.assertEqual(again._conn.execute("SELECT scans FROM daily").fetchone()[0], 2)
+
+    def test_rebuild_index_matches_incremental_index(self):
+        self.store.append([_option(price=250.0)], now=NOW - DAY)
+        self.store.append([_option(price=240.0), _option("Dorset Point")], now=NOW)
+        before = self.store.price_summary(30, now=NOW)
+        self.assertEqual(self.store.rebuild_index(), 3)
+        self.assertEqual(self.store.price_summary(30, now=NOW), before)
+
+
+class TestHistoryCommand(unittest.TestCase):
+    def test_history_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = HistoryStore(os.path.join(tmp, "history"))
+            store.append([_option(price=250.0)])
+            store.close()
+            config_path = os.path.join(tmp, "config.yaml")
+            with open(config_path, "w", encoding="utf-8") as fh:
+                fh.write(f"history:\n  directory: {os.path.join(tmp, 'history')}\n")
+
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                code = main(["--config", config_path, "history", "--days", "7", "--json"])
+            self.assertEqual(code, 0)
+            rows = json.loads(out.getvalue())["rows"]
+            self.assertEqual([(r["property"], r["minPriceWeekly"]) for r in rows], [("Binary Hub", 250.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,7 @@ from student_rooms.models.config import (
     TelegramNotifierConfig,
     OpenClawNotifierConfig,
 )
-from student_rooms.notifiers.base import BaseNotifier, StdoutNotifier, create_notifier
+from student_rooms.notifiers.base import BaseNotifier, StdoutNotifier, create_event_notifiers, create_notifier
 from student_rooms.notifiers.webhook import WebhookNotifier
 from student_rooms.notifiers.telegram import TelegramNotifier
 from student_rooms.notifiers.openclaw import OpenClawNotifier
@@ -243,6 +243,19 @@ class TestCreateNotifier(unittest.TestCase):
         n = create_notifier(cfg)
         self.assertIsInstance(n, StdoutNotifier)
 
+    def test_event_routes(self):
+        cfg = NotificationConfig(
+            type="stdout",
+            webhook=WebhookNotifierConfig(enabled=True, url="https://example.com"),
+            routes={"price_changed": "webhook", "availability_changed": "webhook", "new": "None"},
+        )
+        routed = create_event_notifiers(cfg, ["new", "price_changed", "availability_changed", "removed", "other"])
+        self.assertIsNone(routed["new"])
+        self.assertIsNone(routed["removed"])
+        self.assertIsInstance(routed["price_changed"], WebhookNotifier)
+        self.assertIs(routed["price_changed"], routed["availability_changed"])
+        self.assertIsInstance(routed["other"], StdoutNotifier)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+"""
+tests/test_scheduler.py — Tests for the per-provider watch scheduler.
+"""
+import math
+import unittest
+
+from student_rooms.models.config import PollingConfig
+from student_rooms.scheduler import WatchScheduler
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _no_jitter(low, high):
+    return 0.0
+
+
+class TestWatchScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+
+    def _scheduler(self, schedules, rng=_no_jitter):
+        return WatchScheduler(schedules, clock=self.clock, rng=rng)
+
+    def test_all_due_at_start_then_independent_cadences(self):
+        scheduler = self._scheduler({"yugo": (60, 0), "aparto": (300, 0)})
+        self.assertEqual(scheduler.due(), ["yugo", "aparto"])
+        scheduler.record_success("yugo")
+        scheduler.record_success("aparto")
+        self.assertEqual(scheduler.next_runs(), {"yugo": 1060.0, "aparto": 1300.0})
+
+        self.clock.now = 1060.0
+        self.assertEqual(scheduler.due(), ["yugo"])
+
+    def test_running_provider_is_not_due(self):
+        scheduler = self._scheduler({"yugo": (60, 0), "aparto": (300, 0)})
+        scheduler.start("aparto")
+        scheduler.start("yugo")
+        self.assertEqual(scheduler.due(), [])
+        self.assertEqual(scheduler.seconds_until_next(), float("inf"))
+
+        self.clock.now = 1010.0
+        scheduler.record_success("yugo")
+        self.assertEqual(scheduler.due(), [])
+        self.assertEqual(scheduler.seconds_until_next(), 50.0)
+
+        self.clock.now = 1060.0
+        self.assertEqual(scheduler.due(), ["yugo"])
+
+    def test_ticks_do_not_drift_with_scan_duration(self):
+        scheduler = self._scheduler({"yugo": (60, 0)})
+        runs = []
+        for _ in range(5):
+            self.clock.now = scheduler.next_runs()["yugo"]
+            runs.append(self.clock.now)
+            self.clock.now += 17  # scan duration
+            scheduler.record_success("yugo")
+        self.assertEqual(runs, [1000.0, 1060.0, 1120.0, 1180.0, 1240.0])
+
+    def test_overrun_skips_missed_ticks(self):
+        scheduler = self._scheduler({"aparto": (60, 0)})
+        self.clock.now = 1000.0 + 150  # scan took 2.5 intervals
+        scheduler.record_success("aparto")
+        self.assertEqual(scheduler.next_runs()["aparto"], 1180.0)
+
+    def test_jitter_added_per_tick_on_top_of_anchor(self):
+        scheduler = self._scheduler({"yugo": (60, 10)}, rng=lambda low, high: high)
+        scheduler.record_success("yugo")
+        self.assertEqual(scheduler.next_runs()["yugo"], 1070.0)
+        self.clock.now = 1075.0
+        scheduler.record_success("yugo")
+        self.assertEqual(scheduler.next_runs()["yugo"], 1130.0)
+
+    def test_backoff_resumes_at_first_tick_after_expiry(self):
+        scheduler = self._scheduler({"yugo": (20, 0), "aparto": (60, 0)})
+        self.assertEqual(scheduler.record_failure("yugo"), 30)
+        self.assertEqual(scheduler.next_runs()["yugo"], 1040.0)
+        self.clock.now = 1040.0
+        self.assertEqual(scheduler.record_failure("yugo"), 60)
+        self.assertEqual(scheduler.next_runs()["yugo"], 1120.0)
+
+        self.clock.now = 1120.0
+        scheduler.record_success("yugo")
+        self.assertEqual(scheduler.next_runs()["yugo"], 1140.0)
+        self.assertEqual(scheduler.next_runs()["aparto"], 1000.0)
+
+    def test_seconds_until_next(self):
+        scheduler = self._scheduler({"yugo": (60, 0), "aparto": (300, 0)})
+        scheduler.record_success("yugo")
+        self.assertEqual(scheduler.seconds_until_next(), 0.0)
+        scheduler.record_success("aparto")
+        self.clock.now = 1010.0
+        self.assertEqual(scheduler.seconds_until_next(), 50.0)
+
+    def test_seconds_until_next_without_schedules(self):
+        self.assertEqual(self._scheduler({}).seconds_until_next(), math.inf)
+
+
+class TestPollingSchedules(unittest.TestCase):
+    def test_provider_overrides_fall_back_to_defaults(self):
+        polling = PollingConfig(
+            interval_seconds=3600, jitter_seconds=300,
+            provider_interval_seconds={"yugo": 600, "aparto": 2},
+            provider_jitter_seconds={"yugo": 60},
+        )
+        self.assertEqual(polling.schedule_for("yugo"), (600, 60))
+        self.assertEqual(polling.schedule_for("aparto"), (5, 300))
+        self.assertEqual(polling.schedule_for("other"), (3600, 300))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+tests/test_seen_store.py — Tests for the SQLite seen-options store.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from student_rooms.seen_store import LAST_SEEN_RESOLUTION_SECONDS, SeenStore
+
+
+class TestSeenStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "data", "seen.sqlite3")
+
+    def _store(self, legacy=None):
+        store = SeenStore(self.path, legacy_json_path=legacy)
+        self.addCleanup(store.close)
+        return store
+
+    def test_wal_mode_and_roundtrip(self):
+        store = self._store()
+        mode = sqlite3.connect(self.path).execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+        self.assertEqual(store.unseen(["a", "b", "a"]), {"a", "b"})
+        store.record(["a"], now=1000.0)
+        self.assertEqual(store.unseen(["a", "b"]), {"b"})
+        self.assertEqual(store.first_seen("a"), 1000.0)
+
+        store.close()
+        self.assertEqual(self._store().unseen(["a", "b"]), {"b"})
+
+    def test_only_changed_keys_are_written(self):
+        store = self._store()
+        self.assertEqual(store.record(["a", "b"], now=1000.0), 2)
+        self.assertEqual(store.record(["a", "b", "c"], now=1100.0), 1)
+        later = 1000.0 + LAST_SEEN_RESOLUTION_SECONDS
+        self.assertEqual(store.record(["a"], now=later), 1)
+        self.assertEqual(store.first_seen("a"), 1000.0)
+
+    def test_prune_by_last_seen(self):
+        store = self._store()
+        store.record(["old"], now=1000.0)
+        store.record(["fresh"], now=1000.0)
+        store.record(["fresh"], now=1000.0 + 5 * 86400)
+        self.assertEqual(store.prune(3 * 86400, now=1000.0 + 6 * 86400), 1)
+        self.assertEqual(store.unseen(["old", "fresh"]), {"old"})
+
+    def test_many_keys_query_in_batches(self):
+        store = self._store()
+        keys = [f"k{i}" for i in range(1200)]
+        store.record(keys[:700])
+        self.assertEqual(store.unseen(keys), set(keys[700:]))
+
+    def test_imports_legacy_json_once(self):
+        legacy = os.path.join(self._tmp.name, "seen_options.json")
+        with open(legacy, "w", encoding="utf-8") as fh:
+            json.dump(["yugo|1", "aparto|2"], fh)
+        store = self._store(legacy)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.first_seen("yugo|1"), os.path.getmtime(legacy))
+        store.close()
+
+        with open(legacy, "w", encoding="utf-8") as fh:
+            json.dump(["yugo|3"], fh)
+        self.assertEqual(self._store(legacy).unseen(["yugo|3"]), {"yugo|3"})
+
+    def test_corrupt_legacy_json_is_skipped(self):
+        legacy = os.path.join(self._tmp.name, "seen_options.json")
+        with open(legacy, "w", encoding="utf-8") as fh:
+            fh.write("[not json")
+        with self.assertLogs("student_rooms.seen_store", level="WARNING"):
+            store = self._store(legacy)
+        self.assertEqual(len(store), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,472 @@
+"""
+tests/test_yugo.py — Tests for the Yugo provider.
+
+Tests the concurrent residence/room fan-out used by scan, the
+per-host in-flight limit enforced by YugoClient, cached
+country/city resolution, tenancy-option memoisation and the
+concurrent booking probe, and the shared raw payload view.
+"""
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from student_rooms.cache import JsonCache
+from student_rooms.matching import apply_filters
+from student_rooms.models.config import FilterConfig
+from student_rooms.providers.base import RoomOption
+from student_rooms.providers.yugo import (
+    TENANCY_MEMO_MAX_AGE_SECONDS,
+    YugoClient,
+    YugoOptionRaw,
+    YugoProvider,
+    build_name_index,
+    find_by_name,
+    normalise_lookup_name,
+)
+
+
+def _tenancy_groups(room_id: str):
+    return [{
+        "fromYear": 2026,
+        "toYear": 2027,
+        "academicYearId": "ay-2026",
+        "tenancyOption": [{
+            "id": f"opt-{room_id}",
+            "name": "Semester 1",
+            "formattedLabel": "Semester 1",
+            "startDate": "2026-09-01",
+            "endDate": "2027-01-31",
+        }],
+    }]
+
+
+class FakeYugoClient:
+    """In-memory stand-in for YugoClient with per-call latency."""
+
+    def __init__(self, residences, rooms, delays=None):
+        self.residences = residences
+        self.rooms = rooms
+        self.delays = delays or {}
+        self.tenancy_calls = []
+        self._lock = threading.Lock()
+
+    def list_residences(self, city_id):
+        return self.residences
+
+    def list_rooms(self, residence_id):
+        time.sleep(self.delays.get(residence_id, 0))
+        return self.rooms.get(residence_id, [])
+
+    def list_tenancy_options(self, residence_id, residence_content_id, room_id):
+        time.sleep(self.delays.get(room_id, 0))
+        with self._lock:
+            self.tenancy_calls.append(room_id)
+        return _tenancy_groups(room_id)
+
+
+def _room(room_id: str, name: str, sold_out: bool = False):
+    return {
+        "id": room_id,
+        "name": name,
+        "soldOut": sold_out,
+        "priceLabel": "per week",
+        "minPriceForBillingCycle": 300,
+    }
+
+
+class TestYugoConcurrentScan(unittest.TestCase):
+    """Test the bounded-concurrency scan engine."""
+
+    def _provider(self, client, workers=4):
+        provider = YugoProvider(city_id="city-1", max_workers=workers)
+        provider._client = client
+        return provider
+
+    def test_results_keep_residence_and_room_order(self):
+        residences = [
+            {"id": "r1", "contentId": "c1", "name": "Alpha"},
+            {"id": "r2", "contentId": "c2", "name": "Bravo"},
+            {"id": "r3", "contentId": "c3", "name": "Charlie"},
+        ]
+        rooms = {
+            "r1": [_room("a1", "Alpha Ensuite"), _room("a2", "Alpha Studio")],
+            "r2": [_room("b1", "Bravo Ensuite")],
+            "r3": [_room("c1", "Charlie Ensuite"), _room("c2", "Charlie Studio")],
+        }
+        # Earlier residences/rooms finish last, so completion order is reversed.
+        delays = {"r1": 0.06, "r2": 0.03, "a1": 0.05, "a2": 0.02, "c1": 0.03}
+        client = FakeYugoClient(residences, rooms, delays)
+
+        results = self._provider(client).scan(academic_year="2026-27", apply_semester_filter=False)
+
+        self.assertEqual(
+            [(r.property_name, r.room_type) for r in results],
+            [
+                ("Alpha", "Alpha Ensuite"),
+                ("Alpha", "Alpha Studio"),
+                ("Bravo", "Bravo Ensuite"),
+                ("Charlie", "Charlie Ensuite"),
+                ("Charlie", "Charlie Studio"),
+            ],
+        )
+        for r in results:
+            self.assertIsInstance(r, RoomOption)
+            self.assertEqual(r.raw["optionId"], f"opt-{r.raw['roomId']}")
+
+    def test_skips_sold_out_rooms_and_incomplete_residences(self):
+        residences = [
+            {"id": "r1", "contentId": "c1", "name": "Alpha"},
+            {"id": "r2", "name": "No content id"},
+        ]
+        rooms = {
+            "r1": [_room("a1", "Open"), _room("a2", "Gone", sold_out=True)],
+            "r2": [_room("b1", "Unreachable")],
+        }
+        client = FakeYugoClient(residences, rooms)
+
+        results = self._provider(client).scan(academic_year="2026-27", apply_semester_filter=False)
+
+        self.assertEqual([r.room_type for r in results], ["Open"])
+        self.assertEqual(client.tenancy_calls, ["a1"])
+
+    def test_errors_propagate(self):
+        client = FakeYugoClient([{"id": "r1", "contentId": "c1"}], {})
+        client.list_rooms = MagicMock(side_effect=RuntimeError("boom"))
+        with self.assertRaises(RuntimeError):
+            self._provider(client).scan(academic_year="2026-27")
+
+
+class TestYugoOptionRaw(unittest.TestCase):
+    """Test the compact, shared raw payload attached to Yugo options."""
+
+    def _scan(self):
+        residences = [{"id": 42, "contentId": "c1", "name": "Alpha", "portalLink": "https://portal"}]
+        room = _room("a1", "Ensuite")
+        room["bathroomArrangement"] = "Private"
+        room["maxNumOfBedsInFlat"] = 5
+        groups = _tenancy_groups("a1")
+        groups[0]["tenancyOption"].append(dict(groups[0]["tenancyOption"][0], id=None, name="Full Year"))
+        client = FakeYugoClient(residences, {"42": [room]})
+        client.list_tenancy_options = lambda *args: groups
+        provider = YugoProvider(city_id="city-1")
+        provider._client = client
+        return provider.scan(academic_year="2026-27", apply_semester_filter=False), room
+
+    def test_exposes_legacy_raw_keys(self):
+        (first, second), room = self._scan()
+        self.assertIsInstance(first.raw, YugoOptionRaw)
+        self.assertEqual(dict(first.raw), {
+            "residenceId": "42",
+            "residenceContentId": "c1",
+            "roomId": "a1",
+            "optionId": "opt-a1",
+            "academicYearId": "ay-2026",
+            "fromYear": 2026,
+            "toYear": 2027,
+            "roomData": room,
+            "residencePortalLink": "https://portal",
+            "residencePaymentLink": None,
+            "maxNumOfBedsInFlat": 5,
+            "optionLinkToRedirect": None,
+            "optionStartDate": "2026-09-01",
+            "optionEndDate": "2027-01-31",
+            "optionTenancyLength": None,
+            "optionStatus": None,
+        })
+        self.assertIsNone(second.raw["optionId"])
+        self.assertEqual(first.raw.get("missing", "default"), "default")
+        self.assertEqual(first.booking_url, "https://portal")
+
+    def test_options_share_room_and_residence_records(self):
+        (first, second), room = self._scan()
+        self.assertIs(first.raw["roomData"], room)
+        self.assertIs(first.raw._room, second.raw._room)
+        self.assertIs(first.raw._residence, second.raw._residence)
+        self.assertIs(first.price_label, second.price_label)
+
+    def test_filters_read_room_data_through_mapping(self):
+        options, _ = self._scan()
+        kept = apply_filters(options, FilterConfig(private_bathroom=True))
+        self.assertEqual(len(kept), 2)
+        dropped = apply_filters(options, FilterConfig(private_kitchen=True))
+        self.assertEqual(dropped, [])
+
+
+class TestYugoTenancyMemo(unittest.TestCase):
+    """Test room-fingerprint memoisation of tenancy-options calls."""
+
+    def setUp(self):
+        self.residences = [{"id": "r1", "contentId": "c1", "name": "Alpha"}]
+        self.rooms = {"r1": [_room("a1", "Ensuite"), _room("a2", "Studio")]}
+        self.client = FakeYugoClient(self.residences, self.rooms)
+        self.provider = YugoProvider(city_id="city-1")
+        self.provider._client = self.client
+
+    def _scan(self):
+        return self.provider.scan(academic_year="2026-27", apply_semester_filter=False)
+
+    def test_unchanged_rooms_reuse_tenancy_groups(self):
+        first = self._scan()
+        second = self._scan()
+        self.assertEqual(sorted(self.client.tenancy_calls), ["a1", "a2"])
+        self.assertEqual([o.dedup_key() for o in first], [o.dedup_key() for o in second])
+        stats = self.provider.tenancy_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+        self.assertAlmostEqual(stats["hitRatio"], 0.5)
+
+    def test_changed_room_payload_forces_refetch(self):
+        self._scan()
+        self.rooms["r1"][1] = dict(self.rooms["r1"][1], minPriceForBillingCycle=280)
+        self._scan()
+        self.assertEqual(sorted(self.client.tenancy_calls), ["a1", "a2", "a2"])
+
+    def test_changed_residence_payload_forces_refetch(self):
+        self._scan()
+        self.residences[0]["portalLink"] = "https://example.test/portal"
+        self._scan()
+        self.assertEqual(len(self.client.tenancy_calls), 4)
+
+    def test_stale_entries_are_refetched(self):
+        self._scan()
+        with patch("student_rooms.providers.yugo.TENANCY_MEMO_MAX_AGE_SECONDS", -1):
+            self._scan()
+        self.assertEqual(len(self.client.tenancy_calls), 4)
+
+    def test_poll_interval_stretches_memo_age(self):
+        self.provider._poll_interval_seconds = 3600
+        self.assertEqual(self.provider._tenancy_memo_max_age(), 5400)
+        self.provider._poll_interval_seconds = 60
+        self.assertEqual(self.provider._tenancy_memo_max_age(), TENANCY_MEMO_MAX_AGE_SECONDS)
+
+    def test_sold_out_rooms_are_dropped_from_memo(self):
+        self._scan()
+        self.rooms["r1"][1] = dict(self.rooms["r1"][1], soldOut=True)
+        self._scan()
+        self.assertEqual(self.provider.tenancy_cache_stats()["entries"], 1)
+
+
+def _probe_option() -> RoomOption:
+    return RoomOption(
+        provider="yugo",
+        property_name="Dominick Place",
+        property_slug="r1",
+        room_type="Gold Ensuite",
+        price_weekly=300.0,
+        price_label="€300/week",
+        available=True,
+        booking_url=None,
+        start_date="2026-09-01",
+        end_date="2027-01-31",
+        academic_year="2026-27",
+        option_name="Semester 1",
+        raw={
+            "residenceId": "r1",
+            "residenceContentId": "c1",
+            "roomId": "a1",
+            "optionId": "opt-a1",
+            "academicYearId": "ay-2026",
+            "roomData": {"minPricePerNight": 40},
+            "maxNumOfBedsInFlat": 6,
+        },
+    )
+
+
+class TestYugoProbeBooking(unittest.TestCase):
+    """Test the concurrent booking-flow probe."""
+
+    PROPERTY = {"property": {"buildings": [
+        {"id": "b1", "floors": [{"index": "0"}, {"index": "2.0"}]},
+        {"id": "b2", "floors": [{"index": 1}]},
+    ]}}
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _provider(self, barrier=None):
+        provider = YugoProvider(city_id="city-1", cache=JsonCache(self._tmp.name))
+        client = MagicMock()
+        client.base_url = "https://yugo.test/"
+        client.timeout = 5
+        client.get_residence_property.return_value = self.PROPERTY
+
+        def _rendezvous(result):
+            def _call(params):
+                if barrier is not None:
+                    barrier.wait()
+                return result
+            return _call
+
+        client.get_available_beds.side_effect = _rendezvous({"beds": 3})
+        client.get_skip_room_selection.side_effect = _rendezvous({"linkToRedirect": "https://skip"})
+        client.get_flats_with_beds.side_effect = _rendezvous({"flats": {"floors": [
+            {"flats": [{"id": "f1", "beds": [{"bedId": "bed-1"}]}]},
+        ]}})
+        client.post_student_portal_redirect.return_value = {"linkToRedirect": "https://handover"}
+        provider._client = client
+        return provider
+
+    def test_independent_calls_run_concurrently(self):
+        # Deadlocks (BrokenBarrierError) unless beds, flats and skip overlap.
+        barrier = threading.Barrier(3, timeout=5)
+        probe = self._provider(barrier).probe_booking(_probe_option())
+
+        self.assertEqual(probe["bookingContext"]["selectedBedId"], "bed-1")
+        self.assertEqual(probe["bookingContext"]["selectedFlatId"], "f1")
+        self.assertEqual(probe["bookingContext"]["commonParams"]["buildingIds"], "b1,b2")
+        self.assertEqual(probe["bookingContext"]["commonParams"]["floorIndexes"], "0,1,2")
+        self.assertEqual(probe["links"]["skipRoomLink"], "https://skip")
+        self.assertEqual(probe["links"]["handoverLink"], "https://handover")
+        self.assertEqual(probe["apiResults"]["availableBeds"], {"beds": 3})
+
+    def test_residence_layout_is_cached(self):
+        provider = self._provider()
+        provider.probe_booking(_probe_option())
+        provider.probe_booking(_probe_option())
+        provider._client.get_residence_property.assert_called_once_with("r1")
+
+        cold = self._provider()
+        cold.probe_booking(_probe_option())
+        cold._client.get_residence_property.assert_not_called()
+
+    def test_missing_dates_fail_before_any_request(self):
+        option = _probe_option()
+        option.start_date = None
+        provider = self._provider()
+        with self.assertRaises(RuntimeError):
+            provider.probe_booking(option)
+        provider._client.session.get.assert_not_called()
+
+    def test_missing_layout_raises(self):
+        provider = self._provider()
+        provider._client.get_residence_property.return_value = {"property": {"buildings": []}}
+        with self.assertRaises(RuntimeError):
+            provider.probe_booking(_probe_option())
+
+
+class TestYugoClientInFlightLimit(unittest.TestCase):
+    """Test the per-host in-flight limit."""
+
+    def test_limits_concurrent_requests_per_host(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_request(method, url, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"rooms": []}
+            return response
+
+        session = MagicMock()
+        session.request.side_effect = fake_request
+        client = YugoClient(session=session, max_in_flight=2)
+
+        threads = [threading.Thread(target=client.list_rooms, args=(str(i),)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(session.request.call_count, 8)
+        self.assertLessEqual(peak, 2)
+
+
+class TestYugoNameResolution(unittest.TestCase):
+    """Test accent-insensitive lookups and the persistent geography cache."""
+
+    COUNTRIES = [{"name": "Spain", "countryId": "es-1"}, {"name": "Ireland", "countryId": "ie-1"}]
+    CITIES = [
+        {"name": "Alcalá de Henares", "contentId": "alc-1"},
+        {"name": "Madrid", "contentId": "mad-1"},
+    ]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _provider(self, city="alcala de henares"):
+        provider = YugoProvider(country="SPAIN", city=city, cache=JsonCache(self._tmp.name))
+        provider._client = MagicMock()
+        provider._client.list_countries.return_value = self.COUNTRIES
+        provider._client.list_cities.return_value = self.CITIES
+        return provider
+
+    def test_normalise_lookup_name(self):
+        self.assertEqual(normalise_lookup_name("  Alcalá  de HENARES "), "alcala de henares")
+        self.assertEqual(normalise_lookup_name("Münster"), "munster")
+
+    def test_find_by_name_ignores_accents_and_case(self):
+        self.assertEqual(find_by_name(self.CITIES, "ALCALA DE HENARES")["contentId"], "alc-1")
+        self.assertIsNone(find_by_name(self.CITIES, "Sevilla"))
+
+    def test_build_name_index_keeps_first_id(self):
+        items = [{"name": "Dublin", "contentId": "a"}, {"name": "dublin", "id": "b"}, {"name": "Cork"}]
+        self.assertEqual(build_name_index(items, ("contentId", "id")), {"dublin": "a"})
+
+    def test_resolves_city_with_accents(self):
+        provider = self._provider()
+        self.assertEqual(provider._resolve_city_id(), "alc-1")
+        provider._client.list_cities.assert_called_once_with("es-1")
+
+    def test_cold_process_resolves_from_disk_cache(self):
+        self._provider()._resolve_city_id()
+
+        cold = self._provider(city="Alcalá de Henares")
+        self.assertEqual(cold._resolve_city_id(), "alc-1")
+        cold._client.list_countries.assert_not_called()
+        cold._client.list_cities.assert_not_called()
+
+    def test_city_missing_from_cached_index_is_refetched_once(self):
+        self._provider()._resolve_city_id()
+
+        cold = self._provider(city="Getafe")
+        cold._client.list_cities.return_value = self.CITIES + [{"name": "Getafe", "contentId": "get-1"}]
+        self.assertEqual(cold._resolve_city_id(), "get-1")
+        cold._client.list_countries.assert_not_called()
+        cold._client.list_cities.assert_called_once_with("es-1")
+
+        warm = self._provider(city="Getafe")
+        self.assertEqual(warm._resolve_city_id(), "get-1")
+        warm._client.list_cities.assert_not_called()
+
+    def test_unknown_city_gives_up_after_one_refetch(self):
+        self._provider()._resolve_city_id()
+
+        cold = self._provider(city="Atlantis")
+        self.assertIsNone(cold._resolve_city_id())
+        cold._client.list_cities.assert_called_once_with("es-1")
+
+    def test_listing_uses_cache(self):
+        self._provider().list_cities()
+        cold = self._provider()
+        self.assertEqual(cold.list_cities(), self.CITIES)
+        self.assertEqual(cold.list_countries(), self.COUNTRIES)
+        cold._client.list_cities.assert_not_called()
+        cold._client.list_countries.assert_not_called()
+
+    def test_without_cache_fetches_each_time(self):
+        provider = YugoProvider(country="Spain", city="Madrid")
+        provider._client = MagicMock()
+        provider._client.list_countries.return_value = self.COUNTRIES
+        provider._client.list_cities.return_value = self.CITIES
+        provider.list_countries()
+        provider.list_countries()
+        self.assertEqual(provider._client.list_countries.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()